@@ -0,0 +1,56 @@
+"""
+Compare per-address conversions with the bulk Address helpers.
+
+Converts a list of addresses where a small set of hot addresses recurs,
+as in block data, with Address.to_hex / from_hex in a loop and with
+to_hex_many / from_hex_many (cold and warm cache). The NumPy variants
+are timed as well when NumPy is installed.
+
+    python benchmarks/addresses.py [addresses] [distinct addresses]
+"""
+import secrets
+import sys
+import timeit
+
+from tronapi.common import account
+from tronapi.common.account import Address
+
+
+def main():
+    total = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    distinct = int(sys.argv[2]) if len(sys.argv) > 2 else 5000
+
+    raw = [b'\x41' + secrets.token_bytes(20) for _ in range(distinct)]
+    hex_addresses = [raw[i % distinct].hex() for i in range(total)]
+    base58_addresses = [Address.from_hex(address).decode() for address in hex_addresses]
+    print('{0} addresses, {1} distinct'.format(total, distinct))
+
+    def cold(func, *args):
+        account.clear_address_caches()
+        return func(*args)
+
+    cases = [
+        ('to_hex loop cold', lambda: cold(lambda: [Address.to_hex(a) for a in base58_addresses])),
+        ('to_hex_many cold', lambda: cold(Address.to_hex_many, base58_addresses)),
+        ('to_hex_many warm', lambda: Address.to_hex_many(base58_addresses)),
+        ('from_hex loop cold', lambda: cold(lambda: [Address.from_hex(a) for a in hex_addresses])),
+        ('from_hex_many cold', lambda: cold(Address.from_hex_many, hex_addresses)),
+        ('from_hex_many warm', lambda: Address.from_hex_many(hex_addresses)),
+    ]
+
+    if account.numpy is not None:
+        numpy = account.numpy
+        base58_array = numpy.array(base58_addresses)
+        raw_array = Address.to_hex_many(base58_array)
+        cases += [
+            ('to_hex_many numpy', lambda: Address.to_hex_many(base58_array)),
+            ('from_hex_many numpy', lambda: Address.from_hex_many(raw_array)),
+        ]
+
+    for name, func in cases:
+        elapsed = min(timeit.repeat(func, number=1, repeat=3))
+        print('{0:<22} {1:8.1f} ms  {2:10.0f} addresses/s'.format(name, elapsed * 1000, total / elapsed))
+
+
+if __name__ == '__main__':
+    main()
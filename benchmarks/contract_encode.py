@@ -0,0 +1,47 @@
+"""
+Compare encoding contract calls with and without prepared functions.
+
+Encodes calls of an overloaded function through Contract.encodeABI,
+which looks the function up in the ABI on every call, and through
+ContractFunction, which reuses the selector and encoders prepared when
+the contract class was created.
+
+    python benchmarks/contract_encode.py [calls]
+"""
+import sys
+import timeit
+
+from tronapi import Tron
+
+ABI = [
+    {'type': 'function', 'name': 'balanceOf', 'stateMutability': 'view',
+     'inputs': [{'name': 'who', 'type': 'address'}],
+     'outputs': [{'name': '', 'type': 'uint256'}]},
+    {'type': 'function', 'name': 'getRecord', 'stateMutability': 'view',
+     'inputs': [{'name': 'id', 'type': 'uint256'}],
+     'outputs': [{'name': '', 'type': 'string'}]},
+    {'type': 'function', 'name': 'getRecord', 'stateMutability': 'view',
+     'inputs': [{'name': 'name', 'type': 'string'}],
+     'outputs': [{'name': '', 'type': 'string'}]},
+]
+
+
+def main():
+    calls = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+
+    contract = Tron().trx.contract(abi=ABI)(address='TJRabPrwbZy45sbavfcjinPJC18kjpRTv8')
+    holder = bytes.fromhex('ab' * 20)
+
+    cases = [
+        ('encodeABI getRecord', lambda: contract.encodeABI('getRecord', [7])),
+        ('function getRecord', lambda: contract.functions.getRecord(7)._encode_transaction_data()),
+        ('function balanceOf', lambda: contract.functions.balanceOf(holder)._encode_transaction_data()),
+    ]
+
+    for name, func in cases:
+        elapsed = min(timeit.repeat(func, number=calls, repeat=3))
+        print('{0:<20} {1:8.1f} us/call  {2:10.0f} calls/s'.format(name, elapsed / calls * 1e6, calls / elapsed))
+
+
+if __name__ == '__main__':
+    main()
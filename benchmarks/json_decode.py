@@ -0,0 +1,85 @@
+"""
+Compare the response decoding paths of HttpProvider on a block-range payload.
+
+The "legacy" path mirrors what the provider used to do: decode the body to
+text, then parse it again with the standard library. The other paths parse
+the raw bytes once with each available backend.
+
+    python benchmarks/json_decode.py [blocks] [transactions per block]
+"""
+import json
+import sys
+import timeit
+
+from tronapi.common import fastjson
+
+
+def make_payload(blocks, transactions):
+    """Build a /wallet/getblockbylimitnext-like response body"""
+    def transaction(num, index):
+        return {
+            'ret': [{'contractRet': 'SUCCESS'}],
+            'signature': ['ab' * 65],
+            'txID': '%064x' % (num * 1000 + index),
+            'raw_data': {
+                'contract': [{
+                    'parameter': {
+                        'value': {
+                            'amount': 1000000 + index,
+                            'owner_address': '41' + 'a1' * 20,
+                            'to_address': '41' + 'b2' * 20
+                        },
+                        'type_url': 'type.googleapis.com/protocol.TransferContract'
+                    },
+                    'type': 'TransferContract'
+                }],
+                'ref_block_bytes': 'ab12',
+                'ref_block_hash': 'cd34ef56ab78cd90',
+                'expiration': 1550000000000,
+                'timestamp': 1549999990000
+            },
+            'raw_data_hex': 'ff' * 120
+        }
+
+    return json.dumps({'block': [{
+        'blockID': '%064x' % num,
+        'block_header': {
+            'raw_data': {
+                'number': num,
+                'txTrieRoot': '00' * 32,
+                'witness_address': '41' + 'c3' * 20,
+                'parentHash': '%064x' % (num - 1),
+                'version': 9,
+                'timestamp': 1549999990000 + num * 3000
+            },
+            'witness_signature': 'ef' * 65
+        },
+        'transactions': [transaction(num, index) for index in range(transactions)]
+    } for num in range(blocks)]}).encode('utf-8')
+
+
+def main():
+    blocks = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+    transactions = int(sys.argv[2]) if len(sys.argv) > 2 else 100
+    body = make_payload(blocks, transactions)
+    print('payload: {0:.1f} MB, {1} blocks x {2} transactions'.format(
+        len(body) / 1e6, blocks, transactions))
+
+    def legacy():
+        text = body.decode('utf-8')
+        json.loads(body.decode('utf-8'))
+        return text
+
+    cases = [('legacy (text + stdlib)', legacy)]
+    for name in sorted(fastjson.BACKENDS):
+        cases.append((name, lambda loads=fastjson.BACKENDS[name][0]: loads(body)))
+
+    baseline = None
+    for name, func in cases:
+        elapsed = min(timeit.repeat(func, number=3, repeat=5)) / 3
+        baseline = baseline or elapsed
+        print('{0:<24} {1:8.2f} ms  x{2:.2f}'.format(name, elapsed * 1000, baseline / elapsed))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,37 @@
+"""
+Compare the secp256k1 backends of tronapi.common.account.
+
+Times signing a transaction id, recovering the signer of a message
+(as Trx.verify_message does) and deriving a public key.
+
+    python benchmarks/secp256k1.py [iterations]
+"""
+import secrets
+import sys
+import timeit
+
+from tronapi.common import account
+
+
+def main():
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    private_key = secrets.token_bytes(32)
+    message_hash = secrets.token_bytes(32)
+
+    for name in sorted(account.BACKENDS):
+        backend = account.BACKENDS[name]()
+        signature = backend.sign(message_hash, private_key)
+
+        cases = [
+            ('sign', lambda: backend.sign(message_hash, private_key)),
+            ('recover', lambda: backend.recover(message_hash, signature)),
+            ('public key', lambda: backend.public_key(private_key)),
+        ]
+        for operation, func in cases:
+            elapsed = min(timeit.repeat(func, number=iterations, repeat=3)) / iterations
+            print('{0:<10} {1:<12} {2:10.1f} us  {3:10.0f} ops/s'.format(
+                name, operation, elapsed * 1e6, 1 / elapsed))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,20 @@
+import asyncio
+
+from tronapi import AsyncTron
+
+
+async def main():
+    async with AsyncTron() as tron:
+        current = await tron.trx.get_current_block()
+        height = current['block_header']['raw_data']['number']
+
+        # All requests are in flight at the same time
+        blocks = await asyncio.gather(*[
+            tron.trx.get_block(num) for num in range(height - 10, height)
+        ])
+
+        for block in blocks:
+            print(block['blockID'])
+
+
+asyncio.get_event_loop().run_until_complete(main())
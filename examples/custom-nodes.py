@@ -18,3 +18,14 @@ tron_v3 = Tron(
     default_address='TRWBqiqoFZysoAeyR1J35ibuyc8EvhUAoY',
     private_key='...'
 )
+
+# option 4
+# several nodes per role, requests go to the fastest, least busy node
+tron_v4 = Tron(
+    full_node=[
+        'http://127.0.0.1:8090',
+        HttpProvider('http://127.0.0.1:8091')
+    ],
+    solidity_node='http://127.0.0.1:8092',
+    event_server='https://api.trongrid.io'
+)
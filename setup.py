@@ -27,6 +27,20 @@ py_version = platform.python_version()
 PACKAGE_VERSION = '3.1.5'
 
 EXTRAS_REQUIRE = {
+    'async': [
+        'aiohttp>=3.5.0,<4.0.0'
+    ],
+
+    'fast': [
+        'orjson',
+        'ijson>=3.1',
+        'coincurve>=13.0.0'
+    ],
+
+    'archive': [
+        'numpy>=1.16'
+    ],
+
     'tester': [
         'coverage',
         'pep8',
@@ -90,7 +104,6 @@ install_requires = [
 
     "requests>=2.16.0,<3.0.0",
     "base58",
-    "ecdsa",
     'attrdict',
 ]
 
@@ -0,0 +1,74 @@
+import hashlib
+
+import pytest
+from eth_account import Account as ETHAccount
+from eth_keys import KeyAPI
+
+from tronapi.common import account
+from tronapi.common.account import Account, PrivateKey
+
+PRIVATE_KEYS = [
+    '4d1bc37b069b9f2e975c37770b7c87185dc3a10454e3ea024ce1fce8f3eb78bf',
+    'da146374a75310b9666e834ee4ad0866d6f4035967bfc76217c5a495fff9f0d0',
+    '0000000000000000000000000000000000000000000000000000000000000001',
+]
+
+MESSAGE_HASHES = [
+    '0x' + hashlib.sha256(str(i).encode()).hexdigest() for i in range(8)
+]
+
+
+@pytest.fixture(params=['eth_keys', 'coincurve'])
+def backend(request):
+    if request.param not in account.BACKENDS:
+        pytest.skip('{0} is not installed'.format(request.param))
+
+    previous = account.backend.name
+    account.set_backend(request.param)
+    yield request.param
+    account.set_backend(previous)
+
+
+@pytest.mark.parametrize('private_key', PRIVATE_KEYS)
+def test_sign_hash_matches_eth_account(backend, private_key):
+    for message_hash in MESSAGE_HASHES:
+        signed = Account.sign_hash(message_hash, private_key)
+        expected = ETHAccount.signHash(message_hash, private_key)
+
+        assert signed.messageHash == expected.messageHash
+        assert (signed.r, signed.s, signed.v) == (expected.r, expected.s, expected.v)
+        assert signed.signature == expected.signature
+
+
+@pytest.mark.parametrize('private_key', PRIVATE_KEYS)
+def test_recover_hash_matches_eth_account(backend, private_key):
+    for message_hash in MESSAGE_HASHES:
+        signature = ETHAccount.signHash(message_hash, private_key).signature
+
+        assert Account.recover_hash(message_hash, signature) == \
+            ETHAccount.recoverHash(message_hash, signature=signature)
+
+
+@pytest.mark.parametrize('private_key', PRIVATE_KEYS)
+def test_public_key_matches_eth_keys(backend, private_key):
+    expected = KeyAPI.PrivateKey(bytes.fromhex(private_key)).public_key.to_bytes()
+
+    assert PrivateKey(private_key).public_key == '04' + expected.hex()
+
+
+def test_address_is_lowercase_hex(backend):
+    address = PrivateKey(PRIVATE_KEYS[0]).address
+
+    assert address.hex == '41797d317f5c4deef9cde63faeb2cd301567e97540'
+    assert address.base58 == 'TM3ajretiJpiaGFFumNYrvsnfeKW6bBdF7'
+
+
+def test_invalid_private_key():
+    for private_key in ('00' * 32, 'ff' * 32, 'abcd'):
+        with pytest.raises(ValueError):
+            PrivateKey(private_key)
+
+
+def test_unknown_backend():
+    with pytest.raises(ValueError):
+        account.set_backend('openssl')
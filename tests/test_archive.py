@@ -0,0 +1,84 @@
+import pytest
+
+from tronapi import Tron
+from tronapi.archive import BlockArchive, export_blocks, transaction_rows
+from tronapi.common.account import Address
+from tronapi.common.protobuf import CONTRACT_TYPES
+from tronapi.exceptions import IncompleteBlockRange
+
+numpy = pytest.importorskip('numpy')
+
+OWNER = 'TM3ajretiJpiaGFFumNYrvsnfeKW6bBdF7'
+RECEIVER = 'TRJpw2uqohP7FUmAEJgt57wakRn6aGQU6Z'
+
+
+def make_block(number):
+    # The id of the first transaction of each block ends with zero bytes
+    transactions = [{
+        'txID': '{0:02x}'.format(number % 256) * 30 + '0000',
+        'raw_data': {'contract': [{
+            'type': 'TransferContract',
+            'parameter': {'value': {'owner_address': OWNER, 'to_address': RECEIVER, 'amount': number}}
+        }]}
+    }, {
+        'txID': '{0:064x}'.format(number + 1),
+        'raw_data': {'contract': [{
+            'type': 'FreezeBalanceV2Contract',
+            'parameter': {'value': {'owner_address': Address.to_hex(OWNER), 'frozen_balance': 5}}
+        }]}
+    }]
+    return {
+        'blockID': '{0:064x}'.format(number),
+        'block_header': {'raw_data': {'number': number, 'timestamp': number * 3000}},
+        'transactions': transactions
+    }
+
+
+@pytest.fixture
+def tron():
+    tron = Tron()
+    tron.trx.fetch_blocks = lambda start, end, concurrency=4: (
+        make_block(number) for number in range(start, min(end, 50))
+    )
+    return tron
+
+
+def test_transaction_rows():
+    rows = transaction_rows(make_block(7))
+
+    assert [row[3] for row in rows] == [
+        CONTRACT_TYPES['TransferContract'], CONTRACT_TYPES['FreezeBalanceV2Contract']
+    ]
+    assert rows[0][4] == rows[1][4] == bytes.fromhex(Address.to_hex(OWNER))
+    assert rows[1][5] == b''
+    assert [row[6] for row in rows] == [7, 5]
+
+
+def test_txids_keep_trailing_zero_bytes(tron, tmp_path):
+    archive = export_blocks(tron, 0, 20, str(tmp_path))
+
+    txids = [archive['txid'][i].tobytes().hex() for i in range(len(archive))]
+
+    assert txids == [
+        transaction['txID'] for number in range(20) for transaction in make_block(number)['transactions']
+    ]
+
+
+def test_columns_are_queryable(tron, tmp_path):
+    archive = export_blocks(tron, 0, 20, str(tmp_path))
+    transfers = archive['contract_type'] == CONTRACT_TYPES['TransferContract']
+
+    assert archive['amount'][transfers].sum() == sum(range(20))
+    assert list(Address.from_hex_many(archive['to'][transfers][:2])) == [RECEIVER, RECEIVER]
+
+
+def test_incomplete_export_can_be_continued(tron, tmp_path):
+    with pytest.raises(IncompleteBlockRange):
+        export_blocks(tron, 0, 60, str(tmp_path))
+
+    assert BlockArchive(str(tmp_path)).end == 50
+
+    tron.trx.fetch_blocks = lambda start, end, concurrency=4: (make_block(number) for number in range(start, end))
+    archive = export_blocks(tron, 50, 60, str(tmp_path), append=True)
+
+    assert (archive.start, archive.end, len(archive)) == (0, 60, 120)
@@ -0,0 +1,18 @@
+import pytest
+
+from tronapi import AsyncTron
+from tronapi.exceptions import TronError
+
+
+def test_block_store_is_rejected():
+    with pytest.raises(TronError):
+        AsyncTron(block_store=':memory:')
+
+
+def test_ref_block_cache_is_unavailable():
+    tron = AsyncTron()
+
+    with pytest.raises(TronError):
+        tron.ref_block_cache
+
+    assert tron.block_store is None
@@ -0,0 +1,64 @@
+import pytest
+
+from tronapi import Tron
+
+
+def make_block(number, fork=0):
+    return {
+        'blockID': '{0:016x}{1:048x}'.format(number, fork),
+        'block_header': {'raw_data': {'number': number}}
+    }
+
+
+class FakeNode(object):
+    """Full node whose solidified height moves up while a request is served"""
+
+    def __init__(self, solid_number, solidified_during_request=None):
+        self.solid_number = solid_number
+        self.solidified_during_request = solidified_during_request
+
+    def request(self, url, params=None, method=None):
+        if url == '/walletsolidity/getnowblock':
+            return make_block(self.solid_number)
+
+        if url == '/wallet/getblockbynum':
+            blocks = [make_block(params['num'], fork=1)]
+        elif url == '/wallet/getblockbylimitnext':
+            blocks = [make_block(number, fork=1) for number in range(params['startNum'], params['endNum'])]
+        else:
+            raise AssertionError(url)
+
+        if self.solidified_during_request is not None:
+            self.solid_number = self.solidified_during_request
+
+        return blocks[0] if url == '/wallet/getblockbynum' else {'block': blocks}
+
+
+@pytest.fixture
+def tron():
+    return Tron(block_store=':memory:')
+
+
+def test_block_solidified_during_request_is_not_stored(tron):
+    tron.manager.request = FakeNode(solid_number=100, solidified_during_request=110).request
+
+    tron.trx.get_block(105)
+
+    assert tron.block_store.get(105) is None
+
+
+def test_range_is_stored_up_to_height_solidified_before_request(tron):
+    tron.manager.request = FakeNode(solid_number=100, solidified_during_request=110).request
+
+    tron.trx.get_block_range(95, 105)
+
+    assert tron.block_store.count(90, 110) == 6
+    assert tron.block_store.missing(95, 106) == [(101, 106)]
+
+
+def test_solidified_block_is_stored(tron):
+    tron.manager.request = FakeNode(solid_number=100).request
+
+    block = tron.trx.get_block(100)
+
+    assert tron.block_store.get(100) == block
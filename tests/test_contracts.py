@@ -0,0 +1,94 @@
+import pytest
+from eth_abi import decode_abi, encode_abi
+
+from tronapi import Tron
+from tronapi.common.abi import map_abi_data
+from tronapi.common.normalizers import BASE_RETURN_NORMALIZERS
+
+RECEIVER = 'TRJpw2uqohP7FUmAEJgt57wakRn6aGQU6Z'
+
+ABI = [{
+    'type': 'function',
+    'name': 'distribute',
+    'stateMutability': 'nonpayable',
+    'inputs': [
+        {'name': 'token', 'type': 'address'},
+        {'name': 'amounts', 'type': 'uint256[]'},
+        {'name': 'ids', 'type': 'bytes32[2]'},
+        {'name': 'receivers', 'type': 'address[]'}
+    ],
+    'outputs': []
+}, {
+    'type': 'function',
+    'name': 'balances',
+    'stateMutability': 'view',
+    'inputs': [],
+    'outputs': [{'name': '', 'type': 'uint256[]'}]
+}, {
+    'type': 'function',
+    'name': 'holders',
+    'stateMutability': 'view',
+    'inputs': [],
+    'outputs': [
+        {'name': '', 'type': 'address[]'},
+        {'name': '', 'type': 'uint256[2]'}
+    ]
+}]
+
+ARGUMENTS = [RECEIVER, [1, 2], [b'\x01' * 32, b'\x00' * 32], [RECEIVER, RECEIVER]]
+
+
+@pytest.fixture
+def tron():
+    return Tron()
+
+
+@pytest.fixture
+def contract(tron):
+    return tron.trx.contract(abi=ABI)
+
+
+def answer(tron, types, values):
+    """Make the node answer constant calls with the given values"""
+    def request(url, params=None, method=None):
+        assert url == '/wallet/triggerconstantcontract'
+        return {
+            'result': {'result': True},
+            'constant_result': [encode_abi(types, values).hex()]
+        }
+
+    tron.manager.request = request
+
+
+def test_decode_function_input_returns_lists(contract):
+    data = contract.functions.distribute(*ARGUMENTS)._encode_transaction_data()
+
+    func, arguments = contract.decode_function_input(data)
+
+    assert func.fn_name == 'distribute'
+    assert arguments['amounts'] == [1, 2]
+    assert arguments['ids'] == [b'\x01' * 32, b'\x00' * 32]
+    assert all(isinstance(value, list) for name, value in arguments.items() if name != 'token')
+
+
+def test_decode_function_input_matches_map_abi_data(contract):
+    function = contract.functions.distribute(*ARGUMENTS)
+    data = function._encode_transaction_data()
+    types = [arg['type'] for arg in ABI[0]['inputs']]
+
+    expected = map_abi_data(BASE_RETURN_NORMALIZERS, types, decode_abi(types, bytes.fromhex(data[10:])))
+
+    assert list(contract.decode_function_input(data)[1].values()) == expected
+
+
+def test_call_returns_array_as_list(tron, contract):
+    answer(tron, ['uint256[]'], [[1, 2]])
+
+    assert contract(address=RECEIVER).functions.balances().call() == [1, 2]
+
+
+def test_call_returns_several_arrays_as_lists(tron, contract):
+    holder = tron.address.to_hex(RECEIVER)
+    answer(tron, ['address[]', 'uint256[2]'], [['0x' + holder[2:]], [3, 4]])
+
+    assert contract(address=RECEIVER).functions.holders().call() == [[RECEIVER], [3, 4]]
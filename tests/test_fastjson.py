@@ -0,0 +1,39 @@
+import pytest
+
+from tronapi.common import fastjson
+
+# Not representable as a float
+WIDE = 2 ** 70 + 1
+
+
+@pytest.fixture(params=sorted(fastjson.BACKENDS))
+def backend(request):
+    previous = fastjson.backend
+    fastjson.set_backend(request.param)
+    yield request.param
+    fastjson.set_backend(previous)
+
+
+def test_round_trip(backend):
+    value = {'blockID': '00' * 32, 'number': 2 ** 63 - 1, 'ret': [{'contractRet': 'SUCCESS'}], 'name': 'trön'}
+
+    assert fastjson.loads(fastjson.dumps(value)) == value
+    assert fastjson.loads(fastjson.dumps(value).decode('utf-8')) == value
+
+
+def test_wide_integers_are_serialized(backend):
+    assert fastjson.dumps({'amount': WIDE}).replace(b' ', b'') == b'{"amount":%d}' % WIDE
+
+
+def test_stdlib_parses_wide_integers():
+    previous = fastjson.backend
+    fastjson.set_backend('json')
+    try:
+        assert fastjson.loads(b'{"amount": %d}' % WIDE) == {'amount': WIDE}
+    finally:
+        fastjson.set_backend(previous)
+
+
+def test_unknown_backend():
+    with pytest.raises(ValueError):
+        fastjson.set_backend('simplejson')
@@ -0,0 +1,92 @@
+import pytest
+
+from tronapi import Tron
+from tronapi.exceptions import IncompleteBlockRange, InvalidTronError
+
+
+def make_block(number):
+    return {
+        'blockID': '{0:016x}'.format(number) + '00' * 24,
+        'block_header': {'raw_data': {'number': number}}
+    }
+
+
+class FakeNode(object):
+    """Answers getblockbylimitnext up to a head height, optionally dropping blocks"""
+
+    def __init__(self, head):
+        self.head = head
+        self.requests = []
+        # Chunk start -> number of answers missing the last blocks
+        self.short_answers = {}
+
+    def request(self, url, params=None, method=None):
+        assert url == '/wallet/getblockbylimitnext'
+        self.requests.append(params)
+
+        start = params['startNum']
+        end = min(params['endNum'], self.head + 1)
+        if self.short_answers.get(start):
+            self.short_answers[start] -= 1
+            end = start + (end - start) // 2
+
+        # Nodes do not return the blocks of a chunk in order
+        return {'block': [make_block(number) for number in reversed(range(start, end))]}
+
+
+@pytest.fixture
+def tron(monkeypatch):
+    monkeypatch.setattr('tronapi.trx.time.sleep', lambda seconds: None)
+    return Tron()
+
+
+@pytest.fixture
+def node(tron):
+    node = FakeNode(head=1000)
+    tron.manager.request = node.request
+    return node
+
+
+def heights(blocks):
+    return [block['block_header']['raw_data']['number'] for block in blocks]
+
+
+def test_blocks_are_contiguous_and_ordered(tron, node):
+    blocks = list(tron.trx.fetch_blocks(10, 460, concurrency=3, chunk=100))
+
+    assert heights(blocks) == list(range(10, 460))
+    assert len(node.requests) == 5
+    assert node.requests[-1] == {'startNum': 410, 'endNum': 460}
+
+
+def test_short_chunk_is_retried(tron, node):
+    node.short_answers[100] = 2
+
+    blocks = list(tron.trx.fetch_blocks(0, 300, retries=2))
+
+    assert heights(blocks) == list(range(300))
+    assert len(node.requests) == 5
+
+
+def test_short_chunk_raises_after_retries(tron, node):
+    node.short_answers[100] = 3
+
+    with pytest.raises(IncompleteBlockRange):
+        list(tron.trx.fetch_blocks(0, 300, retries=2))
+
+
+def test_range_past_the_head_raises(tron, node):
+    blocks = tron.trx.fetch_blocks(950, 1100, retries=1)
+
+    with pytest.raises(IncompleteBlockRange):
+        list(blocks)
+
+    assert node.requests.count({'startNum': 950, 'endNum': 1050}) == 2
+
+
+def test_invalid_arguments(tron, node):
+    with pytest.raises(InvalidTronError):
+        tron.trx.fetch_blocks(10, 10)
+
+    with pytest.raises(InvalidTronError):
+        tron.trx.fetch_blocks(0, 10, chunk=101)
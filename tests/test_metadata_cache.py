@@ -0,0 +1,66 @@
+import time
+
+import pytest
+
+from tronapi import Tron
+from tronapi.common.cache import TTLCache
+from tronapi.exceptions import HttpError
+from tronapi.manager import MAINTENANCE_PATH
+
+PARAMETERS = {'chainParameter': [{'key': 'getMaintenanceTimeInterval', 'value': 21600000}]}
+
+
+class FakeNode(object):
+    """Answers chain parameters, the maintenance time lookup fails when ``down``"""
+
+    def __init__(self, down=False):
+        self.down = down
+        self.calls = []
+
+    def request(self, path, json=None, params=None, method=None):
+        self.calls.append(path)
+        if path == MAINTENANCE_PATH:
+            if self.down:
+                raise HttpError(503, 'unavailable', None, path)
+            return {'num': int((time.time() + 3600) * 1000)}
+
+        assert path == '/wallet/getchainparameters'
+        return PARAMETERS
+
+
+def make_tron(node, metadata_cache):
+    tron = Tron(metadata_cache=metadata_cache)
+    tron.manager.select_provider = lambda url: node
+    return tron
+
+
+@pytest.mark.parametrize('option, max_entries', [(True, 1024), (16, 16), (TTLCache(8), 8)])
+def test_metadata_cache_option(option, max_entries):
+    tron = Tron(metadata_cache=option)
+
+    assert tron.manager.metadata_cache.max_entries == max_entries
+
+
+def test_metadata_cache_disabled():
+    assert Tron(metadata_cache=False).manager.metadata_cache is None
+
+
+def test_cached_until_next_maintenance():
+    node = FakeNode()
+    tron = make_tron(node, True)
+
+    for _ in range(3):
+        assert tron.manager.request('/wallet/getchainparameters') == PARAMETERS
+
+    assert node.calls == ['/wallet/getchainparameters', MAINTENANCE_PATH]
+
+
+def test_failed_maintenance_lookup_returns_response_uncached():
+    node = FakeNode(down=True)
+    tron = make_tron(node, True)
+
+    assert tron.manager.request('/wallet/getchainparameters') == PARAMETERS
+
+    node.down = False
+    assert tron.manager.request('/wallet/getchainparameters') == PARAMETERS
+    assert node.calls.count('/wallet/getchainparameters') == 2
@@ -0,0 +1,185 @@
+import asyncio
+import time
+
+import pytest
+from requests.exceptions import ConnectionError
+
+from tronapi.exceptions import NodeUnavailable
+from tronapi.providers.async_pool import AsyncProviderPool
+from tronapi.providers.pool import ProviderPool
+
+
+class FakeProvider(object):
+    """Provider answering from memory, or raising ``error`` when set"""
+
+    def __init__(self, name, error=None, delay=0):
+        self.name = name
+        self.error = error
+        self.delay = delay
+        self.calls = 0
+        self.status_page = None
+
+    def request(self, path, json=None, params=None, method=None):
+        self.calls += 1
+        if self.error is not None:
+            raise self.error
+        time.sleep(self.delay)
+        return {'node': self.name}
+
+    def is_connected(self):
+        if self.error is not None:
+            raise self.error
+        return True
+
+
+class AsyncFakeProvider(FakeProvider):
+
+    async def request(self, path, json=None, params=None, method=None):
+        self.calls += 1
+        if self.error is not None:
+            raise self.error
+        await asyncio.sleep(self.delay)
+        return {'node': self.name}
+
+    async def is_connected(self):
+        return super().is_connected()
+
+    async def close(self):
+        self.closed = True
+
+
+def wait_until(condition, timeout=2):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline
+        time.sleep(0.01)
+
+
+def test_read_fails_over_to_healthy_node():
+    dead, healthy = FakeProvider('dead', ConnectionError()), FakeProvider('healthy')
+    pool = ProviderPool([dead, healthy])
+
+    assert pool.request('/wallet/getnowblock', retry=True) == {'node': 'healthy'}
+    assert dead.calls == 1
+    assert pool.members[0].failures == 1
+
+
+def test_write_is_not_retried():
+    dead, healthy = FakeProvider('dead', ConnectionError()), FakeProvider('healthy')
+    pool = ProviderPool([dead, healthy])
+
+    with pytest.raises(ConnectionError):
+        pool.request('/wallet/broadcasttransaction')
+
+    assert healthy.calls == 0
+
+
+def test_request_errors_do_not_count_against_node():
+    faulty, healthy = FakeProvider('faulty', ValueError('bad request')), FakeProvider('healthy')
+    pool = ProviderPool([faulty, healthy])
+
+    with pytest.raises(ValueError):
+        pool.request('/wallet/getaccount', retry=True)
+
+    assert healthy.calls == 0
+    assert pool.members[0].failures == 0
+
+
+def test_breaker_opens_after_threshold():
+    dead, healthy = FakeProvider('dead', ConnectionError()), FakeProvider('healthy')
+    pool = ProviderPool([dead, healthy], failure_threshold=2, reset_timeout=60)
+
+    for _ in range(2):
+        # Forget the failure penalty, so the dead node is chosen first again
+        pool.members[0].latency = None
+        pool.request('/wallet/getnowblock', retry=True)
+
+    assert pool.members[0].is_open
+
+    for _ in range(5):
+        assert pool.request('/wallet/broadcasttransaction') == {'node': 'healthy'}
+    assert dead.calls == 2
+
+
+def test_no_healthy_node_left():
+    pool = ProviderPool([FakeProvider('dead', ConnectionError())], failure_threshold=1)
+
+    with pytest.raises(ConnectionError):
+        pool.request('/wallet/getnowblock', retry=True)
+
+    with pytest.raises(NodeUnavailable):
+        pool.request('/wallet/getnowblock', retry=True)
+
+
+def test_probe_closes_breaker_of_recovered_node():
+    flaky, healthy = FakeProvider('flaky', ConnectionError()), FakeProvider('healthy')
+    pool = ProviderPool([flaky, healthy], failure_threshold=1, reset_timeout=0)
+
+    pool.request('/wallet/getnowblock', retry=True)
+    assert pool.members[0].is_open
+
+    flaky.error = None
+    pool.request('/wallet/getnowblock', retry=True)
+
+    wait_until(lambda: not pool.members[0].is_open)
+    assert pool.members[0].failures == 0
+
+
+def test_failed_requests_are_penalized():
+    dead = FakeProvider('dead', ConnectionError())
+    healthy = FakeProvider('healthy', delay=0.01)
+    pool = ProviderPool([healthy, dead], failure_threshold=10)
+
+    pool.request('/wallet/getnowblock')
+    with pytest.raises(ConnectionError):
+        pool.request('/wallet/broadcasttransaction')
+
+    assert pool.members[1].latency > pool.members[0].latency
+
+    for _ in range(5):
+        assert pool.request('/wallet/broadcasttransaction') == {'node': 'healthy'}
+    assert dead.calls == 1
+
+
+def test_is_connected_with_one_node_down():
+    pool = ProviderPool([FakeProvider('dead', ConnectionError()), FakeProvider('healthy')])
+    assert pool.is_connected() is True
+
+    pool = ProviderPool([FakeProvider('dead', ConnectionError())])
+    assert pool.is_connected() is False
+
+
+def test_async_pool_fails_over():
+    dead, healthy = AsyncFakeProvider('dead', ConnectionError()), AsyncFakeProvider('healthy')
+    pool = AsyncProviderPool([dead, healthy], failure_threshold=1, reset_timeout=60)
+
+    async def run():
+        first = await pool.request('/wallet/getnowblock', retry=True)
+        second = await pool.request('/wallet/getnowblock', retry=True)
+        connected = await pool.is_connected()
+        await pool.close()
+        return first, second, connected
+
+    first, second, connected = asyncio.run(run())
+
+    assert first == second == {'node': 'healthy'}
+    assert dead.calls == 1
+    assert pool.members[0].is_open
+    assert connected is True
+    assert dead.closed and healthy.closed
+
+
+def test_async_hedged_read_fails_over():
+    dead, healthy = AsyncFakeProvider('dead', ConnectionError()), AsyncFakeProvider('healthy')
+    pool = AsyncProviderPool([dead, healthy])
+
+    result = asyncio.run(pool.request_hedged('/walletsolidity/getnowblock'))
+
+    assert result == {'node': 'healthy'}
+    assert [member.in_flight for member in pool.members] == [0, 0]
+
+
+def test_async_pool_does_not_stream():
+    pool = AsyncProviderPool([AsyncFakeProvider('a'), AsyncFakeProvider('b')])
+
+    assert not hasattr(pool, 'stream')
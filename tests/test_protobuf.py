@@ -0,0 +1,113 @@
+import hashlib
+import time
+
+import pytest
+
+from tronapi import Tron
+from tronapi.common import protobuf
+from tronapi.transactionbuilder import OfflineTransactionBuilder
+
+OWNER = 'TM3ajretiJpiaGFFumNYrvsnfeKW6bBdF7'
+RECEIVER = 'TRJpw2uqohP7FUmAEJgt57wakRn6aGQU6Z'
+
+
+@pytest.mark.parametrize('value, expected', [
+    (0, '00'),
+    (1, '01'),
+    (300, 'ac02'),
+    (1000000, 'c0843d'),
+    (-1, 'ffffffffffffffffff01'),
+])
+def test_encode_varint(value, expected):
+    assert protobuf.encode_varint(value).hex() == expected
+
+
+def test_transfer_raw_data():
+    raw_data = {
+        'contract': [{
+            'parameter': {
+                'value': {
+                    'owner_address': '41' + '11' * 20,
+                    'to_address': '41' + '22' * 20,
+                    'amount': 1000000
+                },
+                'type_url': 'type.googleapis.com/protocol.TransferContract'
+            },
+            'type': 'TransferContract'
+        }],
+        'ref_block_bytes': '4567',
+        'ref_block_hash': '89abcdef01234567',
+        'expiration': 1600000060000,
+        'timestamp': 1600000000000
+    }
+
+    transfer = '0a15' + '41' + '11' * 20 + '1215' + '41' + '22' * 20 + '18' + 'c0843d'
+    any_value = '0a2d' + b'type.googleapis.com/protocol.TransferContract'.hex() + '1232' + transfer
+    contract = '0801' + '1263' + any_value
+    expected = (
+        '0a02' + '4567' +
+        '2208' + '89abcdef01234567' +
+        '40' + 'e0d4bdbbc82e' +
+        '5a67' + contract +
+        '70' + '8080babbc82e'
+    )
+
+    assert protobuf.encode_raw_data(raw_data).hex() == expected
+
+
+def test_default_values_are_omitted():
+    value = {
+        'owner_address': '41' + '11' * 20,
+        'contract_address': '41' + '22' * 20,
+        'call_value': 0,
+        'data': 'a9059cbb'
+    }
+
+    encoded = protobuf.encode_message('TriggerSmartContract', value).hex()
+    assert encoded == '0a15' + '41' + '11' * 20 + '1215' + '41' + '22' * 20 + '2204' + 'a9059cbb'
+
+
+@pytest.fixture
+def builder():
+    tron = Tron(full_node='http://127.0.0.1:1',
+                solidity_node='http://127.0.0.1:1',
+                event_server='http://127.0.0.1:1')
+    tron.default_address = OWNER
+
+    block = {
+        'blockID': '0000000001234567' + '89abcdef01234567' + '00' * 16,
+        'block_header': {'raw_data': {'number': 0x1234567, 'timestamp': int(time.time() * 1000)}}
+    }
+    return OfflineTransactionBuilder(tron, ref_block=block)
+
+
+def transactions(builder):
+    yield builder.send_transaction(RECEIVER, 1.5, OWNER)
+    yield builder.freeze_balance(10, 3, 'ENERGY', OWNER)
+    yield builder.vote([(RECEIVER, 2)], OWNER)
+    yield builder.trigger_smart_contract(
+        contract_address=RECEIVER,
+        function_selector='transfer(address,uint256)',
+        fee_limit=1000000000,
+        parameters=[
+            {'type': 'address', 'value': RECEIVER},
+            {'type': 'uint256', 'value': 5}
+        ]
+    )['transaction']
+
+
+def test_txid_is_sha256_of_raw_data(builder):
+    for transaction in transactions(builder):
+        raw_bytes = bytes.fromhex(transaction['raw_data_hex'])
+
+        assert transaction['txID'] == hashlib.sha256(raw_bytes).hexdigest()
+        assert protobuf.encode_raw_data(transaction['raw_data']) == raw_bytes
+
+
+def test_reference_block_fields(builder):
+    raw_data = builder.send_transaction(RECEIVER, 1.5, OWNER)['raw_data']
+
+    assert raw_data['ref_block_bytes'] == '4567'
+    assert raw_data['ref_block_hash'] == '89abcdef01234567'
+    assert raw_data['expiration'] >= raw_data['timestamp'] + 60 * 1000
+    assert raw_data['contract'][0]['parameter']['value']['amount'] == 1500000
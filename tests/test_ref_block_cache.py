@@ -0,0 +1,29 @@
+import threading
+import time
+
+from tronapi import Tron
+
+
+def test_concurrent_first_use_creates_one_cache():
+    tron = Tron()
+    lookups = []
+
+    def get_current_block():
+        lookups.append(threading.get_ident())
+        time.sleep(0.1)
+        return {'blockID': '00' * 32, 'block_header': {'raw_data': {'number': 1, 'timestamp': 0}}}
+
+    tron.trx.get_current_block = get_current_block
+
+    caches = []
+    threads = [threading.Thread(target=lambda: caches.append(tron.ref_block_cache)) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    try:
+        assert len(lookups) == 1
+        assert all(cache is caches[0] for cache in caches)
+    finally:
+        caches[0].stop()
@@ -10,7 +10,8 @@ import pkg_resources
 
 from eth_account import Account  # noqa: E402
 from tronapi.providers.http import HttpProvider  # noqa: E402
-from tronapi.main import Tron  # noqa: E402
+from tronapi.providers.async_http import AsyncHttpProvider  # noqa: E402
+from tronapi.main import Tron, AsyncTron  # noqa: E402
 
 if sys.version_info < (3, 5):
     raise EnvironmentError("Python 3.5 or above is required")
@@ -21,6 +22,8 @@ __version__ = pkg_resources.get_distribution("tronapi").version
 __all__ = [
     '__version__',
     'HttpProvider',
+    'AsyncHttpProvider',
     'Account',
     'Tron',
+    'AsyncTron',
 ]
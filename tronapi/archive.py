@@ -0,0 +1,294 @@
+# --------------------------------------------------------------------
+# Copyright (c) iEXBase. All rights reserved.
+# Licensed under the MIT License.
+# See License.txt in the project root for license information.
+# --------------------------------------------------------------------
+
+"""
+    tronapi.archive
+    ===============
+
+    Columnar export of blocks for analytics.
+
+    An archive is a directory holding one raw NumPy column per field, one
+    row per transaction, and an ``archive.json`` manifest. Columns are
+    memory-mapped when read, so tens of millions of transactions can be
+    scanned with vectorized queries without parsing any JSON.
+
+    :copyright: © 2019 by the iEXBase.
+    :license: MIT License
+"""
+
+import json
+import os
+
+from tronapi.common.account import _base58_to_raw
+from tronapi.common.blocks import block_number
+from tronapi.common.protobuf import CONTRACT_TYPES
+from tronapi.exceptions import IncompleteBlockRange, InvalidTronError, TronError
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+MANIFEST = 'archive.json'
+
+# Column name -> NumPy dtype. Addresses are raw 21 byte values
+# (see Address.from_hex_many), an absent address is all zeros.
+# Transaction ids are void items: S32 items would lose trailing zero bytes.
+# contract_type holds the codes of protobuf.CONTRACT_TYPES.
+COLUMNS = (
+    ('height', '<i8'),
+    ('timestamp', '<i8'),
+    ('txid', 'V32'),
+    ('contract_type', '<i2'),
+    ('owner', 'S21'),
+    ('to', 'S21'),
+    ('amount', '<i8'),
+)
+
+# Contract fields read for the "to" and "amount" columns, first match wins
+TO_FIELDS = ('to_address', 'contract_address', 'receiver_address')
+AMOUNT_FIELDS = ('amount', 'call_value', 'frozen_balance', 'unfreeze_balance', 'balance')
+
+# Rows buffered in memory before they are appended to the columns
+FLUSH_ROWS = 100000
+
+
+def _require_numpy():
+    if numpy is None:
+        raise TronError('numpy is required for block archives, '
+                        'install it with "pip install numpy"')
+
+
+def _raw_address(value) -> bytes:
+    if not value:
+        return b''
+    if len(value) == 34:
+        return _base58_to_raw(value)
+    return bytes.fromhex(value)
+
+
+def transaction_rows(block):
+    """Archive rows of the transactions of a block
+
+    Args:
+        block (dict): Block as returned by the node
+
+    Returns:
+        list: tuples of values in the order of ``COLUMNS``
+
+    """
+    height = block_number(block)
+    timestamp = block['block_header']['raw_data'].get('timestamp', 0)
+
+    rows = []
+    for transaction in block.get('transactions', []):
+        contracts = transaction['raw_data'].get('contract') or [{}]
+        contract = contracts[0]
+        value = contract.get('parameter', {}).get('value', {})
+
+        to = next((value[field] for field in TO_FIELDS if value.get(field)), None)
+        amount = next((value[field] for field in AMOUNT_FIELDS if value.get(field)), 0)
+
+        rows.append((
+            height,
+            timestamp,
+            bytes.fromhex(transaction['txID']),
+            CONTRACT_TYPES.get(contract.get('type'), -1),
+            _raw_address(value.get('owner_address')),
+            _raw_address(to),
+            amount
+        ))
+
+    return rows
+
+
+def _read_manifest(path):
+    manifest_path = os.path.join(path, MANIFEST)
+    if not os.path.exists(manifest_path):
+        return None
+
+    with open(manifest_path) as f:
+        return json.load(f)
+
+
+def _column_path(path, name):
+    return os.path.join(path, name + '.bin')
+
+
+class ArchiveWriter(object):
+    """Appends blocks to an archive.
+
+    Rows are buffered and appended to the column files every
+    ``FLUSH_ROWS`` transactions, after which the manifest is replaced.
+    Rows written after the last manifest update (an interrupted export)
+    are discarded when the archive is reopened.
+
+    """
+
+    def __init__(self, path, start, append=False):
+        """Open an archive for writing
+
+        Args:
+            path (str): Archive directory, created if needed
+            start (int): Height of the first block to be added
+            append (bool): Continue an existing archive ending at ``start``,
+                instead of replacing it
+
+        """
+        _require_numpy()
+
+        self.path = path
+        self.start = start
+        self.end = start
+        self.rows = 0
+        self._buffer = []
+
+        os.makedirs(path, exist_ok=True)
+
+        manifest = _read_manifest(path) if append else None
+        if manifest is not None:
+            if manifest['end'] != start:
+                raise InvalidTronError('The archive ends at block {0}, '
+                                       'cannot append from block {1}'.format(manifest['end'], start))
+            self.start = manifest['start']
+            self.rows = manifest['rows']
+
+        self._files = {}
+        for name, dtype in COLUMNS:
+            f = open(_column_path(path, name), 'r+b' if manifest else 'wb')
+            f.truncate(self.rows * numpy.dtype(dtype).itemsize)
+            f.seek(0, os.SEEK_END)
+            self._files[name] = f
+
+        self._save_manifest()
+
+    def add_block(self, block):
+        """Buffer the transactions of the next block"""
+        number = block_number(block)
+        if number < self.end:
+            raise InvalidTronError('Blocks must be added in height order')
+
+        self._buffer.extend(transaction_rows(block))
+        self.end = number + 1
+
+        if len(self._buffer) >= FLUSH_ROWS:
+            self.flush()
+
+    def flush(self):
+        """Append the buffered rows and record them in the manifest"""
+        if self._buffer:
+            values = list(zip(*self._buffer))
+            for (name, dtype), column in zip(COLUMNS, values):
+                numpy.array(column, dtype=dtype).tofile(self._files[name])
+                self._files[name].flush()
+
+            self.rows += len(self._buffer)
+            self._buffer = []
+
+        self._save_manifest()
+
+    def close(self):
+        self.flush()
+        for f in self._files.values():
+            f.close()
+
+    def _save_manifest(self):
+        manifest_path = os.path.join(self.path, MANIFEST)
+        tmp_path = manifest_path + '.tmp'
+        with open(tmp_path, 'w') as f:
+            json.dump({
+                'start': self.start,
+                'end': self.end,
+                'rows': self.rows,
+                'columns': [[name, dtype] for name, dtype in COLUMNS]
+            }, f)
+        os.replace(tmp_path, manifest_path)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+class BlockArchive(object):
+    """Read-only view of an archive, one memory-mapped array per column.
+
+    Examples:
+        >>> archive = BlockArchive('blocks')
+        >>> transfers = archive['contract_type'] == CONTRACT_TYPES['TransferContract']
+        >>> archive['amount'][transfers].sum()
+        >>> Address.from_hex_many(archive['owner'][transfers][:10])
+
+    """
+
+    def __init__(self, path):
+        _require_numpy()
+
+        manifest = _read_manifest(path)
+        if manifest is None:
+            raise InvalidTronError('No block archive found in {0}'.format(path))
+
+        self.path = path
+        self.start = manifest['start']
+        self.end = manifest['end']
+        self.rows = manifest['rows']
+        self.dtypes = dict((name, dtype) for name, dtype in manifest['columns'])
+        self._columns = {}
+
+    @property
+    def columns(self):
+        return list(self.dtypes)
+
+    def __getitem__(self, name):
+        column = self._columns.get(name)
+        if column is None:
+            if name not in self.dtypes:
+                raise KeyError(name)
+
+            dtype = numpy.dtype(self.dtypes[name])
+            if self.rows:
+                column = numpy.memmap(_column_path(self.path, name), dtype=dtype,
+                                      mode='r', shape=(self.rows,))
+            else:
+                column = numpy.empty(0, dtype=dtype)
+            self._columns[name] = column
+
+        return column
+
+    def __len__(self):
+        return self.rows
+
+
+def export_blocks(tron, start, end, path, concurrency=4, append=False):
+    """Download a range of blocks into a columnar archive
+
+    Args:
+        tron (Tron): Instance used to download blocks
+        start (int): starting block height, including this block
+        end (int): ending block height, excluding that block
+        path (str): Archive directory
+        concurrency (int): number of requests in flight
+        append (bool): Continue an existing archive ending at ``start``
+
+    Returns:
+        BlockArchive: the written archive
+
+    Raises:
+        IncompleteBlockRange: If fewer blocks than requested were received
+
+    """
+    with ArchiveWriter(path, start, append=append) as writer:
+        for block in tron.trx.fetch_blocks(start, end, concurrency=concurrency):
+            writer.add_block(block)
+
+    # The manifest only claims the blocks received, so the export can be
+    # continued with append=True from the height it reached
+    if writer.end < end:
+        raise IncompleteBlockRange('Archived blocks {0} to {1}, expected up to {2}'.format(
+            writer.start, writer.end - 1, end - 1))
+
+    return BlockArchive(path)
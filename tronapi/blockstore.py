@@ -0,0 +1,257 @@
+# --------------------------------------------------------------------
+# Copyright (c) iEXBase. All rights reserved.
+# Licensed under the MIT License.
+# See License.txt in the project root for license information.
+# --------------------------------------------------------------------
+
+"""
+    tronapi.blockstore
+    ==================
+
+    Persistent local storage of confirmed blocks.
+
+    :copyright: © 2019 by the iEXBase.
+    :license: MIT License
+"""
+
+import sqlite3
+import threading
+import time
+import zlib
+
+from trx_utils import is_integer
+
+from tronapi.common import fastjson
+from tronapi.common.blocks import block_number
+from tronapi.exceptions import InvalidTronError
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS blocks (
+    number INTEGER PRIMARY KEY,
+    block_id TEXT NOT NULL,
+    data BLOB NOT NULL
+);
+CREATE UNIQUE INDEX IF NOT EXISTS blocks_block_id ON blocks (block_id);
+"""
+
+# Blocks written per transaction while prefetching
+WRITE_BATCH = 1000
+
+
+class BlockStore(object):
+    """SQLite database of solidified blocks.
+
+    Blocks are stored as zlib compressed JSON, keyed by height and id.
+    Only blocks at or below the solidified height are ever written, so a
+    stored block never has to be invalidated.
+
+    When attached to a :class:`~tronapi.main.Tron` instance (with the
+    ``block_store`` option), :meth:`Trx.get_block` and
+    :meth:`Trx.get_block_range` read from the store before the network and
+    keep the confirmed blocks they download.
+
+    Examples:
+        >>> tron = Tron(block_store='blocks.sqlite')
+        >>> tron.block_store.prefetch(10000000, 10100000)
+        >>> tron.trx.get_block(10000001)  # read from disk
+
+    """
+
+    # Seconds between two lookups of the solidified height
+    solid_refresh_interval = 3
+
+    def __init__(self, path, compression_level=6, tron=None):
+        """Open or create a store
+
+        Args:
+            path (str): Database file, or ``':memory:'``
+            compression_level (int): zlib level, from 1 (fast) to 9 (small)
+            tron (Tron): Instance used to download blocks
+
+        """
+        self.path = path
+        self.compression_level = compression_level
+        self.tron = tron
+        self.solid_number = -1
+        self._solid_checked_at = None
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._connection.executescript(SCHEMA)
+
+    def get(self, number):
+        """Block at the given height, or None if it is not stored"""
+        with self._lock:
+            row = self._connection.execute(
+                'SELECT data FROM blocks WHERE number = ?', (number,)
+            ).fetchone()
+        return self._decode(row[0]) if row else None
+
+    def get_by_id(self, block_id):
+        """Block with the given id, or None if it is not stored"""
+        with self._lock:
+            row = self._connection.execute(
+                'SELECT data FROM blocks WHERE block_id = ?', (block_id,)
+            ).fetchone()
+        return self._decode(row[0]) if row else None
+
+    def get_range(self, start, end):
+        """Stored blocks with a height from ``start`` up to ``end`` excluded, in order"""
+        with self._lock:
+            rows = self._connection.execute(
+                'SELECT data FROM blocks WHERE number >= ? AND number < ? ORDER BY number',
+                (start, end)
+            ).fetchall()
+        return [self._decode(row[0]) for row in rows]
+
+    def count(self, start=None, end=None):
+        """Number of stored blocks, optionally from ``start`` up to ``end`` excluded"""
+        query = 'SELECT COUNT(*) FROM blocks'
+        args = ()
+        if start is not None and end is not None:
+            query += ' WHERE number >= ? AND number < ?'
+            args = (start, end)
+
+        with self._lock:
+            return self._connection.execute(query, args).fetchone()[0]
+
+    def put(self, blocks):
+        """Store blocks, replacing the stored copies
+
+        The caller is responsible for passing solidified blocks only.
+
+        Args:
+            blocks (list): Blocks as returned by the node
+
+        """
+        rows = [
+            (block_number(block), block['blockID'], self._encode(block))
+            for block in blocks
+        ]
+        with self._lock, self._connection:
+            self._connection.executemany(
+                'INSERT OR REPLACE INTO blocks (number, block_id, data) VALUES (?, ?, ?)', rows
+            )
+
+    def add_confirmed(self, blocks, solid_number):
+        """Store the downloaded blocks which are known to be solidified
+
+        Stored blocks replace the block at their height, so only pass blocks
+        the node returned for a height. A block fetched by id may be from
+        a fork that never solidified.
+
+        Args:
+            blocks (list): Blocks as returned by the node for their heights
+            solid_number (int): Solidified height returned by
+                :meth:`solid_number_for` before the blocks were requested
+
+        Returns:
+            int: number of blocks stored
+
+        """
+        confirmed = [
+            block for block in blocks
+            if block and 'blockID' in block and block_number(block) <= solid_number
+        ]
+        if confirmed:
+            self.put(confirmed)
+        return len(confirmed)
+
+    def solid_number_for(self, number):
+        """Solidified height to check blocks up to ``number`` against
+
+        Call it before requesting the blocks. A block the node returned
+        while its height was not solidified yet may be from a fork that
+        lost, even if the height is solidified by the time it arrives.
+
+        Args:
+            number (int): Highest height about to be requested
+
+        """
+        if number > self.solid_number:
+            self.refresh_solid_number()
+        return self.solid_number
+
+    def refresh_solid_number(self, force=False):
+        """Look up the solidified height, at most once per ``solid_refresh_interval``"""
+        now = time.monotonic()
+        if not force and self._solid_checked_at is not None and \
+                now - self._solid_checked_at < self.solid_refresh_interval:
+            return self.solid_number
+
+        self._solid_checked_at = now
+        confirmed = self.tron.trx.get_confirmed_current_block()
+        self.solid_number = max(self.solid_number, block_number(confirmed))
+        return self.solid_number
+
+    def missing(self, start, end):
+        """Ranges of heights without a stored block
+
+        Returns:
+            list: ``(start, end)`` pairs, ``end`` excluded
+
+        """
+        with self._lock:
+            numbers = [row[0] for row in self._connection.execute(
+                'SELECT number FROM blocks WHERE number >= ? AND number < ? ORDER BY number',
+                (start, end)
+            )]
+
+        ranges = []
+        cursor = start
+        for number in numbers:
+            if number > cursor:
+                ranges.append((cursor, number))
+            cursor = number + 1
+        if cursor < end:
+            ranges.append((cursor, end))
+
+        return ranges
+
+    def prefetch(self, start, end, concurrency=4):
+        """Download the missing solidified blocks of a range
+
+        Heights above the solidified block are skipped.
+
+        Args:
+            start (int): starting block height, including this block
+            end (int): ending block height, excluding that block
+            concurrency (int): number of requests in flight
+
+        Returns:
+            int: number of blocks downloaded
+
+        """
+        if not is_integer(start) or start < 0:
+            raise InvalidTronError('Invalid start of range provided')
+
+        if not is_integer(end) or end <= start:
+            raise InvalidTronError('Invalid end of range provided')
+
+        end = min(end, self.refresh_solid_number(force=True) + 1)
+
+        fetched = 0
+        for range_start, range_end in self.missing(start, end):
+            batch = []
+            for block in self.tron.trx.fetch_blocks(range_start, range_end, concurrency=concurrency):
+                batch.append(block)
+                if len(batch) >= WRITE_BATCH:
+                    self.put(batch)
+                    fetched += len(batch)
+                    batch = []
+
+            if batch:
+                self.put(batch)
+                fetched += len(batch)
+
+        return fetched
+
+    def close(self):
+        with self._lock:
+            self._connection.close()
+
+    def _encode(self, block):
+        return zlib.compress(fastjson.dumps(block), self.compression_level)
+
+    @staticmethod
+    def _decode(data):
+        return fastjson.loads(zlib.decompress(data))
@@ -5,54 +5,319 @@
 # --------------------------------------------------------------------
 
 import codecs
-from binascii import unhexlify
+import secrets
+from functools import lru_cache, wraps
 
-import base58
-import ecdsa
+from eth_account.datastructures import AttributeDict as SignedMessage
 from eth_keys import KeyAPI
-from eth_account import Account as ETHAccount
-from trx_utils import is_hex, is_bytes
+from eth_utils import keccak, to_checksum_address
+from hexbytes import HexBytes
+from trx_utils import is_hex, remove_0x_prefix
+from trx_utils import is_address as _is_address
 
+from tronapi.common import b58
 from tronapi.common.datastructures import AttributeDict
 
+try:
+    import coincurve
+except ImportError:
+    coincurve = None
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+# Order of the secp256k1 group
+SECP256K1_N = 0xFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFEBAAEDCE6AF48A03BBFD25E8CD0364141
+
+# Length of a raw address: the 0x41 prefix and 20 bytes
+ADDRESS_SIZE = 21
+
+# Addresses remembered by each of the address caches
+ADDRESS_CACHE_SIZE = 65536
+
+
+class EthKeysBackend(object):
+    """Pure Python secp256k1 through eth_keys, always available"""
+
+    name = 'eth_keys'
+
+    def __init__(self):
+        self._keys = KeyAPI('eth_keys.backends.NativeECCBackend')
+
+    def sign(self, message_hash: bytes, private_key: bytes) -> bytes:
+        """65 byte signature: r, s and the recovery id (0 or 1)"""
+        return self._keys.ecdsa_sign(message_hash, self._keys.PrivateKey(private_key)).to_bytes()
+
+    def recover(self, message_hash: bytes, signature: bytes) -> bytes:
+        """64 byte uncompressed public key, without the 0x04 prefix"""
+        return self._keys.ecdsa_recover(message_hash, self._keys.Signature(signature)).to_bytes()
+
+    def public_key(self, private_key: bytes) -> bytes:
+        """64 byte uncompressed public key, without the 0x04 prefix"""
+        return self._keys.PrivateKey(private_key).public_key.to_bytes()
+
+
+class CoincurveBackend(object):
+    """libsecp256k1 through coincurve"""
+
+    name = 'coincurve'
+
+    def sign(self, message_hash: bytes, private_key: bytes) -> bytes:
+        return coincurve.PrivateKey(private_key).sign_recoverable(message_hash, hasher=None)
+
+    def recover(self, message_hash: bytes, signature: bytes) -> bytes:
+        public_key = coincurve.PublicKey.from_signature_and_message(signature, message_hash, hasher=None)
+        return public_key.format(compressed=False)[1:]
+
+    def public_key(self, private_key: bytes) -> bytes:
+        return coincurve.PublicKey.from_secret(private_key).format(compressed=False)[1:]
+
+
+BACKENDS = {
+    'eth_keys': EthKeysBackend,
+}
+
+if coincurve is not None:
+    BACKENDS['coincurve'] = CoincurveBackend
+
+backend = None
+
+
+def set_backend(name):
+    """Select the secp256k1 implementation used for keys and signatures
+
+    Args:
+        name (str): One of "coincurve" or "eth_keys"
+
+    """
+    global backend
+
+    if name not in BACKENDS:
+        raise ValueError(
+            'secp256k1 backend {0!r} is not available, choose from: {1}'.format(
+                name, ', '.join(sorted(BACKENDS))
+            )
+        )
+
+    backend = BACKENDS[name]()
+
+
+set_backend('coincurve' if 'coincurve' in BACKENDS else 'eth_keys')
+
+
+def to_private_key_bytes(private_key) -> bytes:
+    """Raw 32 bytes of a private key given as hex, bytes or :class:`PrivateKey`"""
+    if isinstance(private_key, (bytes, bytearray)):
+        raw = bytes(private_key)
+    elif isinstance(private_key, str):
+        raw = bytes.fromhex(remove_0x_prefix(private_key))
+    else:
+        raw = bytes(private_key)
+
+    if len(raw) != 32 or not 0 < int.from_bytes(raw, 'big') < SECP256K1_N:
+        raise ValueError('Invalid private key provided')
+
+    return raw
+
+
+def public_key_to_address(public_key: bytes) -> str:
+    """Lowercase hex address of a 64 byte public key, with the 41 prefix"""
+    return '41' + keccak(public_key)[-20:].hex()
+
 
 class Account:
     @staticmethod
     def create():
-        generate_key = ecdsa.SigningKey.generate(curve=ecdsa.SECP256k1)
-        return PrivateKey(generate_key.to_string().hex())
+        while True:
+            raw_key = secrets.token_bytes(32)
+            if 0 < int.from_bytes(raw_key, 'big') < SECP256K1_N:
+                return PrivateKey(raw_key.hex())
 
     @staticmethod
     def sign_hash(message_hash, private_key):
         if not is_hex(message_hash):
             raise ValueError('Invalid message_hash provided')
 
-        return ETHAccount.signHash(message_hash, private_key)
+        message_hash = HexBytes(message_hash)
+        signature = backend.sign(bytes(message_hash), to_private_key_bytes(private_key))
+
+        r = int.from_bytes(signature[:32], 'big')
+        s = int.from_bytes(signature[32:64], 'big')
+        v = signature[64] + 27
+
+        return SignedMessage({
+            'messageHash': message_hash,
+            'r': r,
+            's': s,
+            'v': v,
+            'signature': HexBytes(signature[:64] + bytes([v]))
+        })
 
     @staticmethod
     def recover_hash(message_hash, signature):
         if not is_hex(message_hash):
             raise ValueError('Invalid message_hash provided')
 
-        return ETHAccount.recoverHash(message_hash, signature=signature)
+        signature = bytes(HexBytes(signature))
+        if len(signature) != 65:
+            raise ValueError('Invalid signature provided')
+
+        v = signature[64]
+        if v >= 27:
+            v -= 27
+
+        public_key = backend.recover(bytes(HexBytes(message_hash)), signature[:64] + bytes([v]))
+        return to_checksum_address(keccak(public_key)[-20:])
+
+
+# Memoized address functions, by name
+_ADDRESS_CACHES = {}
+
+
+def address_cache(func):
+    """Memoize a function of a single address in a process-wide LRU cache
+
+    Only string and bytes arguments are cached, anything else is passed
+    straight through. Results must be immutable.
+    """
+    cached = lru_cache(maxsize=ADDRESS_CACHE_SIZE)(func)
+
+    @wraps(func)
+    def wrapper(value):
+        if isinstance(value, (str, bytes)):
+            return cached(value)
+        return func(value)
+
+    wrapper.cache_info = cached.cache_info
+    wrapper.cache_clear = cached.cache_clear
+    _ADDRESS_CACHES[func.__name__.lstrip('_')] = cached
+    return wrapper
+
+
+def address_cache_info():
+    """Hit and miss counters of the address caches
+
+    Returns:
+        dict: ``functools`` cache info (hits, misses, maxsize, currsize) by function
+
+    """
+    return {name: cached.cache_info() for name, cached in _ADDRESS_CACHES.items()}
+
+
+def clear_address_caches():
+    """Empty the address caches and reset their counters"""
+    for cached in _ADDRESS_CACHES.values():
+        cached.cache_clear()
+
+
+@address_cache
+def is_address(value) -> bool:
+    """Whether the value is a base58 or hex address, memoized"""
+    return _is_address(value)
+
+
+@address_cache
+def _to_hex(address):
+    if is_hex(address):
+        return address.lower().replace('0x', '41', 2)
+
+    return b58.b58decode_check(address).hex().upper()
+
+
+@address_cache
+def _from_hex(address):
+    if not is_hex(address):
+        return address
+
+    return b58.b58encode_check(bytes.fromhex(address)).encode()
+
+
+@address_cache
+def _base58_to_raw(address) -> bytes:
+    raw = b58.b58decode_check(address)
+    if len(raw) != ADDRESS_SIZE:
+        raise ValueError('Invalid address provided: {0}'.format(address))
+    return raw
+
+
+@address_cache
+def _raw_to_base58(raw) -> str:
+    return b58.b58encode_check(raw)
 
 
 class Address(object):
     @staticmethod
     def from_hex(address):
         """Helper function that will convert a generic value from hex"""
-        if not is_hex(address):
-            return address
-
-        return base58.b58encode_check(bytes.fromhex(address))
+        return _from_hex(address)
 
     @staticmethod
     def to_hex(address):
         """Helper function that will convert a generic value to hex"""
-        if is_hex(address):
-            return address.lower().replace('0x', '41', 2)
+        return _to_hex(address)
+
+    @staticmethod
+    def to_hex_many(addresses):
+        """Convert many addresses to hex at once
+
+        Base58 conversions go through a bounded LRU cache, so recurring
+        addresses are only decoded once.
+
+        Args:
+            addresses (Any): list of addresses, or a NumPy array of base58 strings
 
-        return base58.b58decode_check(address).hex().upper()
+        Returns:
+            A list of hex strings as returned by :meth:`to_hex`, or for
+            a NumPy array, an array of raw 21 byte addresses (dtype ``S21``)
+
+        """
+        if numpy is not None and isinstance(addresses, numpy.ndarray):
+            raw = b''.join(
+                _base58_to_raw(address.decode() if isinstance(address, bytes) else str(address))
+                for address in addresses.ravel().tolist()
+            )
+            return numpy.frombuffer(raw, dtype='S%d' % ADDRESS_SIZE).reshape(addresses.shape)
+
+        return [
+            _base58_to_raw(address).hex().upper() if len(address) == 34
+            else Address.to_hex(address)
+            for address in addresses
+        ]
+
+    @staticmethod
+    def from_hex_many(addresses):
+        """Convert many hex addresses to base58 at once
+
+        Args:
+            addresses (Any): list of hex strings or raw 21 byte addresses,
+                or a NumPy array of raw addresses (dtype ``S21`` or ``uint8``
+                with a last dimension of 21)
+
+        Returns:
+            A list of base58 strings, or for a NumPy array,
+            an array of them (dtype ``U34``)
+
+        """
+        if numpy is not None and isinstance(addresses, numpy.ndarray):
+            # Raw bytes are sliced from the buffer, reading S21 items
+            # would strip trailing zero bytes
+            data = numpy.ascontiguousarray(addresses).tobytes()
+            if len(data) % ADDRESS_SIZE:
+                raise ValueError('Expected addresses of {0} bytes'.format(ADDRESS_SIZE))
+
+            shape = addresses.shape if addresses.dtype.itemsize == ADDRESS_SIZE else addresses.shape[:-1]
+            return numpy.array([
+                _raw_to_base58(data[i:i + ADDRESS_SIZE])
+                for i in range(0, len(data), ADDRESS_SIZE)
+            ], dtype='U34').reshape(shape)
+
+        return [
+            _raw_to_base58(bytes(address) if isinstance(address, (bytes, bytearray))
+                           else bytes.fromhex(address))
+            for address in addresses
+        ]
 
     @staticmethod
     def from_private_key(private_key):
@@ -67,41 +332,41 @@ class PrivateKey(object):
         Example:::
             PrivateKey("4d1bc37b069b9f2e975c37770b7c87185dc3a10454e3ea024ce1fce8f3eb78bf")
         """
-        _private = unhexlify(bytes(private_key, encoding='utf8'))
-        self._key = KeyAPI.PrivateKey(_private)
-        _length = len(self._key)
-
-        # Key length must not exceed 64 length
-        if _length < 64:
-            raise ValueError('Key length must not exceed 64 length')
+        self._raw_key = to_private_key_bytes(private_key)
+        self._public_key = None
+        self._address = None
 
     @property
     def private_key(self):
-        _raw_key = self._key.to_bytes()
-        return codecs.decode(codecs.encode(_raw_key, 'hex'), 'ascii')
+        return codecs.decode(codecs.encode(self._raw_key, 'hex'), 'ascii')
+
+    @property
+    def public_key_bytes(self) -> bytes:
+        """64 byte uncompressed public key, derived on first use"""
+        if self._public_key is None:
+            self._public_key = backend.public_key(self._raw_key)
+        return self._public_key
 
     @property
     def public_key(self) -> str:
-        public_key = self._key.public_key
-        return '04' + str(public_key)[2:]
+        return '04' + self.public_key_bytes.hex()
 
     @property
     def address(self):
-        public_key = self._key.public_key
-        address = '41' + public_key.to_address()[2:]
-        to_base58 = base58.b58encode_check(bytes.fromhex(address))
+        """Hex and base58 address, derived on first use"""
+        if self._address is None:
+            address = public_key_to_address(self.public_key_bytes)
+            to_base58 = b58.b58encode_check(bytes.fromhex(address))
 
-        # If bytecode then convert to string
-        if is_bytes(to_base58):
-            to_base58 = to_base58.decode()
+            self._address = AttributeDict({
+                'hex': address,
+                'base58': to_base58
+            })
 
-        return AttributeDict({
-            'hex': address,
-            'base58': to_base58
-        })
+        return self._address
 
     def __str__(self):
         return self.private_key
 
     def __bytes__(self):
-        return self._key.to_bytes()
+        return self._raw_key
@@ -0,0 +1,93 @@
+# --------------------------------------------------------------------
+# Copyright (c) iEXBase. All rights reserved.
+# Licensed under the MIT License.
+# See License.txt in the project root for license information.
+# --------------------------------------------------------------------
+
+"""
+    tronapi.common.b58
+    ==================
+
+    Base58check encoding tuned for addresses.
+
+    Compatible with the ``base58`` package, but digits are produced and
+    consumed two at a time through lookup tables, which roughly halves
+    the number of big integer operations per address.
+
+    :copyright: © 2019 by the iEXBase.
+    :license: MIT License
+"""
+
+import hashlib
+
+ALPHABET = '123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz'
+
+# All pairs of digits, indexed by their value
+_PAIRS = [a + b for a in ALPHABET for b in ALPHABET]
+_PAIR_VALUES = {pair: value for value, pair in enumerate(_PAIRS)}
+_DIGIT_VALUES = {digit: value for value, digit in enumerate(ALPHABET)}
+_PAIR_BASE = 58 * 58
+
+
+def b58encode(data: bytes) -> str:
+    """Encode bytes to a base58 string"""
+    stripped = data.lstrip(b'\0')
+    pad = len(data) - len(stripped)
+
+    number = int.from_bytes(stripped, 'big')
+    pairs = []
+    while number:
+        number, value = divmod(number, _PAIR_BASE)
+        pairs.append(_PAIRS[value])
+
+    encoded = ''.join(reversed(pairs)).lstrip('1')
+    return '1' * pad + encoded
+
+
+def b58decode(value: str) -> bytes:
+    """Decode a base58 string to bytes
+
+    Raises:
+        ValueError: If the string holds characters outside of the alphabet
+
+    """
+    stripped = value.lstrip('1')
+    pad = len(value) - len(stripped)
+
+    number = 0
+    try:
+        if len(stripped) % 2:
+            number = _DIGIT_VALUES[stripped[0]]
+            stripped = stripped[1:]
+
+        for i in range(0, len(stripped), 2):
+            number = number * _PAIR_BASE + _PAIR_VALUES[stripped[i:i + 2]]
+    except KeyError:
+        raise ValueError('Invalid base58 string: {0!r}'.format(value)) from None
+
+    return b'\0' * pad + number.to_bytes((number.bit_length() + 7) // 8, 'big')
+
+
+def checksum(data: bytes) -> bytes:
+    """First four bytes of the double sha256 of the data"""
+    return hashlib.sha256(hashlib.sha256(data).digest()).digest()[:4]
+
+
+def b58encode_check(data: bytes) -> str:
+    """Encode bytes to base58 with a four byte checksum appended"""
+    return b58encode(data + checksum(data))
+
+
+def b58decode_check(value: str) -> bytes:
+    """Decode a base58check string and verify its checksum
+
+    Raises:
+        ValueError: If the string is not valid base58 or the checksum does not match
+
+    """
+    decoded = b58decode(value)
+    data, check = decoded[:-4], decoded[-4:]
+    if len(decoded) < 4 or checksum(data) != check:
+        raise ValueError('Invalid checksum')
+
+    return data
@@ -41,3 +41,8 @@ def select_method_for_block(value, if_hash, if_number):
         raise ValueError(
             "Value did not match any of the recognized block identifiers: {0}".format(value)
         )
+
+
+def block_number(block):
+    """Height of a block as returned by the node"""
+    return block['block_header']['raw_data'].get('number', 0)
@@ -0,0 +1,211 @@
+# --------------------------------------------------------------------
+# Copyright (c) iEXBase. All rights reserved.
+# Licensed under the MIT License.
+# See License.txt in the project root for license information.
+# --------------------------------------------------------------------
+
+"""
+    tronapi.common.cache
+    ====================
+
+    Caches for node responses.
+
+    :copyright: © 2019 by the iEXBase.
+    :license: MIT License
+"""
+
+import threading
+import time
+from collections import OrderedDict
+
+
+class ByteLRUCache(object):
+    """Least recently used cache bounded by the total size of its values.
+
+    Values are byte strings, so callers store serialized data and decode
+    a fresh copy on every hit: a cached response can never be modified
+    through an object handed out earlier.
+
+    Examples:
+        >>> cache = ByteLRUCache(max_bytes=64 * 1024 * 1024)
+        >>> cache.set('key', b'{"blockID": "..."}')
+        >>> cache.get('key')
+
+    """
+
+    def __init__(self, max_bytes):
+        """Create a new cache
+
+        Args:
+            max_bytes (int): Upper bound of the summed size of the values
+
+        """
+        if max_bytes <= 0:
+            raise ValueError('Invalid max_bytes provided')
+
+        self.max_bytes = max_bytes
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        """Value stored under the key, or None"""
+        with self._lock:
+            value = self._data.get(key)
+            if value is None:
+                self.misses += 1
+                return None
+
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key, value):
+        """Store a value, evicting the least recently used ones to make room
+
+        Values larger than the whole cache are not stored.
+
+        """
+        if len(value) > self.max_bytes:
+            return
+
+        with self._lock:
+            previous = self._data.pop(key, None)
+            if previous is not None:
+                self.size -= len(previous)
+
+            self._data[key] = value
+            self.size += len(value)
+
+            while self.size > self.max_bytes:
+                _, evicted = self._data.popitem(last=False)
+                self.size -= len(evicted)
+                self.evictions += 1
+
+    def delete(self, key):
+        """Remove a key if present"""
+        with self._lock:
+            value = self._data.pop(key, None)
+            if value is not None:
+                self.size -= len(value)
+
+    def clear(self):
+        """Remove every entry, the counters are kept"""
+        with self._lock:
+            self._data.clear()
+            self.size = 0
+
+    def stats(self):
+        """Counters of the cache
+
+        Returns:
+            dict: hits, misses, evictions, entries, size and max_bytes
+
+        """
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'entries': len(self._data),
+                'size': self.size,
+                'max_bytes': self.max_bytes
+            }
+
+    def __len__(self):
+        return len(self._data)
+
+    def __contains__(self, key):
+        return key in self._data
+
+
+class TTLCache(object):
+    """Cache whose entries expire at a given time.
+
+    Like :class:`ByteLRUCache` the values are byte strings. The number of
+    entries is bounded, the least recently used one is evicted first.
+
+    Examples:
+        >>> cache = TTLCache(max_entries=1024)
+        >>> cache.set('key', b'{"num": 1}', expires_at=time.time() + 60)
+
+    """
+
+    def __init__(self, max_entries=1024):
+        """Create a new cache
+
+        Args:
+            max_entries (int): Upper bound of the number of entries
+
+        """
+        if max_entries <= 0:
+            raise ValueError('Invalid max_entries provided')
+
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, now=None):
+        """Value stored under the key if it did not expire yet, or None"""
+        now = time.time() if now is None else now
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None or entry[0] <= now:
+                if entry is not None:
+                    del self._data[key]
+                self.misses += 1
+                return None
+
+            self._data.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def set(self, key, value, expires_at):
+        """Store a value until ``expires_at`` (seconds since the epoch)"""
+        if expires_at <= time.time():
+            return
+
+        with self._lock:
+            self._data.pop(key, None)
+            self._data[key] = (expires_at, value)
+            while len(self._data) > self.max_entries:
+                self._data.popitem(last=False)
+
+    def invalidate(self, predicate=None):
+        """Remove entries
+
+        Args:
+            predicate (callable): Called with each key, the entry is removed when
+                it returns True. Every entry is removed when omitted.
+
+        """
+        with self._lock:
+            if predicate is None:
+                self._data.clear()
+                return
+
+            for key in [key for key in self._data if predicate(key)]:
+                del self._data[key]
+
+    def stats(self):
+        """Counters of the cache
+
+        Returns:
+            dict: hits, misses, entries and max_entries
+
+        """
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'entries': len(self._data),
+                'max_entries': self.max_entries
+            }
+
+    def __len__(self):
+        return len(self._data)
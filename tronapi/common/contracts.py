@@ -10,27 +10,37 @@ from hexbytes import HexBytes
 
 from eth_utils import (
     to_hex,
+    event_abi_to_log_topic,
     function_abi_to_4byte_selector
 )
-from trx_utils import is_text, encode_hex
+from trx_utils import is_text, encode_hex, remove_0x_prefix
 
 from tronapi.common.abi import (
     filter_by_name,
+    filter_by_type,
     filter_by_encodability,
     filter_by_argument_count,
     get_fallback_func_abi,
     abi_to_signature,
     get_abi_input_types,
+    get_abi_input_names,
+    get_abi_output_types,
     check_if_arguments_can_be_encoded,
     map_abi_data,
-    merge_args_and_kwargs
+    merge_args_and_kwargs,
+    process_type
 )
 
 from tronapi.common.normalizers import (
     abi_address_to_hex,
     abi_bytes_to_bytes,
-    abi_string_to_text
+    abi_string_to_text,
+    addresses_checksummed,
+    to_checksum_address,
+    BASE_RETURN_NORMALIZERS
 )
+from tronapi.common.datastructures import AttributeDict
+from tronapi.exceptions import MismatchedABI
 from tronapi.common.toolz import (
     pipe,
     valmap,
@@ -38,11 +48,34 @@ from tronapi.common.toolz import (
 from eth_abi import (
     encode_abi as eth_abi_encode_abi,
 )
+from eth_abi.decoding import ContextFramesBytesIO, TupleDecoder
+from eth_abi.encoding import TupleEncoder
+from eth_abi.registry import registry as default_registry
 
 from eth_abi.exceptions import (
+    DecodingError,
     EncodingError,
 )
 
+# Normalizers applied to the arguments before they are encoded
+ENCODE_NORMALIZERS = [
+    abi_address_to_hex,
+    abi_bytes_to_bytes,
+    abi_string_to_text,
+]
+
+# Normalizer of the values of each base type, the others leave them untouched
+BASE_TYPE_NORMALIZERS = {
+    'address': abi_address_to_hex,
+    'bytes': abi_bytes_to_bytes,
+    'string': abi_string_to_text,
+}
+
+# Same as BASE_TYPE_NORMALIZERS, for BASE_RETURN_NORMALIZERS
+BASE_TYPE_RETURN_NORMALIZERS = {
+    'address': addresses_checksummed,
+}
+
 
 class FallbackFn:
     pass
@@ -118,14 +151,8 @@ def encode_abi(tron, abi, arguments, data=None):
         )
 
     try:
-        normalizers = [
-            abi_address_to_hex,
-            abi_bytes_to_bytes,
-            abi_string_to_text,
-        ]
-
         normalized_arguments = map_abi_data(
-            normalizers,
+            ENCODE_NORMALIZERS,
             argument_types,
             arguments,
         )
@@ -160,3 +187,279 @@ def get_function_info(fn_name, contract_abi=None, fn_abi=None, args=None, kwargs
     fn_arguments = merge_args_and_kwargs(fn_abi, args, kwargs)
 
     return fn_abi, fn_selector, fn_arguments
+
+
+def _value_normalizer(abi_type, normalizers, base_type_normalizers):
+    """Function applying normalizers to the values of a type,
+    or None when they leave them untouched
+
+    Arrays and tuples always go through :func:`map_abi_data`, so they are
+    returned as lists.
+    """
+    try:
+        base, _, arrlist = process_type(abi_type)
+    except ValueError:
+        base = arrlist = None
+
+    if base is not None and not arrlist:
+        if base not in base_type_normalizers:
+            return None
+
+        normalizer = base_type_normalizers[base]
+        return lambda value: normalizer(abi_type, value)[1]
+
+    return lambda value: map_abi_data(normalizers, [abi_type], [value])[0]
+
+
+class PreparedFunction(object):
+    """A function of an ABI with its selector, encoder and decoder built once.
+
+    Encoding an argument list then only normalizes the arguments of the
+    types which need it (addresses, bytes and strings) and runs the
+    eth_abi encoders, the result is the same as :func:`encode_abi`.
+
+    """
+
+    def __init__(self, fn_abi):
+        self.abi = fn_abi
+        self.input_types = get_abi_input_types(fn_abi)
+        self.input_names = get_abi_input_names(fn_abi)
+
+        if fn_abi.get('type') == 'fallback':
+            self.selector = b''
+        else:
+            self.selector = function_abi_to_4byte_selector(fn_abi)
+        self.selector_hex = encode_hex(self.selector)
+
+        self._normalizers = [
+            _value_normalizer(abi_type, ENCODE_NORMALIZERS, BASE_TYPE_NORMALIZERS)
+            for abi_type in self.input_types
+        ]
+        self._encoder = TupleEncoder(encoders=[
+            default_registry.get_encoder(abi_type) for abi_type in self.input_types
+        ])
+
+        self._input_normalizers = [
+            _value_normalizer(abi_type, BASE_RETURN_NORMALIZERS, BASE_TYPE_RETURN_NORMALIZERS)
+            for abi_type in self.input_types
+        ]
+        self._input_decoder = TupleDecoder(decoders=[
+            default_registry.get_decoder(abi_type) for abi_type in self.input_types
+        ])
+
+        self.output_types = get_abi_output_types(fn_abi) if 'outputs' in fn_abi else []
+        self._output_normalizers = [
+            _value_normalizer(abi_type, BASE_RETURN_NORMALIZERS, BASE_TYPE_RETURN_NORMALIZERS)
+            for abi_type in self.output_types
+        ]
+        self._output_decoder = TupleDecoder(decoders=[
+            default_registry.get_decoder(abi_type) for abi_type in self.output_types
+        ])
+
+    def encode_arguments(self, arguments) -> bytes:
+        """Encode arguments, ordered as the inputs of the function"""
+        try:
+            normalized_arguments = [
+                argument if normalizer is None else normalizer(argument)
+                for normalizer, argument in zip(self._normalizers, arguments)
+            ]
+            return self._encoder(normalized_arguments)
+        except EncodingError as e:
+            raise TypeError(
+                "One or more arguments could not be encoded to the necessary "
+                "ABI type: {0}".format(str(e))
+            )
+
+    def encode(self, arguments, data=None) -> str:
+        """Call data: the selector, or ``data`` if given, followed by the arguments"""
+        prefix = self.selector if data is None else HexBytes(data)
+        return encode_hex(prefix + self.encode_arguments(arguments))
+
+    def decode_arguments(self, data) -> dict:
+        """Decode encoded arguments, without the selector
+
+        Returns:
+            dict: input name -> value
+
+        """
+        values = self._input_decoder(ContextFramesBytesIO(bytes(data)))
+        return dict(zip(self.input_names, (
+            value if normalizer is None else normalizer(value)
+            for normalizer, value in zip(self._input_normalizers, values)
+        )))
+
+    def decode_output(self, data) -> list:
+        """Decode the values returned by the function"""
+        values = self._output_decoder(ContextFramesBytesIO(bytes(data)))
+        return [
+            value if normalizer is None else normalizer(value)
+            for normalizer, value in zip(self._output_normalizers, values)
+        ]
+
+    def __repr__(self):
+        return '<PreparedFunction {0}>'.format(abi_to_signature(self.abi))
+
+
+def prepare_functions(contract_abi):
+    """Prepare every function of an ABI
+
+    Returns:
+        dict: function name -> {argument count: [PreparedFunction]}
+
+    """
+    prepared = {}
+    for fn_abi in filter_by_type('function', contract_abi or []):
+        prepared.setdefault(fn_abi['name'], {}).setdefault(
+            len(fn_abi.get('inputs', [])), []
+        ).append(PreparedFunction(fn_abi))
+
+    return prepared
+
+
+def index_by_selector(prepared_functions):
+    """Index prepared functions by their 4 byte selector
+
+    Args:
+        prepared_functions (dict): As returned by :func:`prepare_functions`
+
+    Returns:
+        dict: selector (bytes) -> PreparedFunction
+
+    """
+    return {
+        prepared.selector: prepared
+        for by_count in prepared_functions.values()
+        for candidates in by_count.values()
+        for prepared in candidates
+    }
+
+
+def _is_hashed_topic(abi_type):
+    """Whether indexed values of a type are stored as their keccak hash"""
+    try:
+        base, sub, arrlist = process_type(abi_type)
+    except ValueError:
+        # Tuples
+        return True
+
+    return bool(arrlist) or base == 'string' or (base == 'bytes' and not sub)
+
+
+def log_bytes(value) -> bytes:
+    """Decode a topic or the data of a log, given as hex"""
+    return bytes.fromhex(remove_0x_prefix(value or ''))
+
+
+class PreparedEvent(object):
+    """An event of an ABI with its topic and decoders built once.
+
+    Decodes logs as found in the ``log`` list of transaction infos:
+    topics and data are hex strings and the address holds the 20 bytes
+    of the emitting contract.
+
+    Indexed values of dynamic types (strings, bytes, arrays) are only
+    stored as a hash in the log, they are returned as the raw 32 bytes.
+
+    """
+
+    def __init__(self, event_abi):
+        self.abi = event_abi
+        self.name = event_abi['name']
+        self.anonymous = event_abi.get('anonymous', False)
+        self.topic = event_abi_to_log_topic(event_abi)
+
+        inputs = event_abi.get('inputs', [])
+        self.indexed = [arg for arg in inputs if arg.get('indexed')]
+        self.not_indexed = [arg for arg in inputs if not arg.get('indexed')]
+        self.input_names = [arg['name'] for arg in inputs]
+
+        self._topic_decoders = [
+            None if _is_hashed_topic(arg['type']) else default_registry.get_decoder(arg['type'])
+            for arg in self.indexed
+        ]
+        self._data_decoder = TupleDecoder(decoders=[
+            default_registry.get_decoder(arg['type']) for arg in self.not_indexed
+        ])
+        self._normalizers = {
+            arg['name']: _value_normalizer(arg['type'], BASE_RETURN_NORMALIZERS, BASE_TYPE_RETURN_NORMALIZERS)
+            for arg in inputs
+            if not (arg.get('indexed') and _is_hashed_topic(arg['type']))
+        }
+
+    def decode_args(self, topics, data) -> AttributeDict:
+        """Decode the arguments of a log
+
+        Args:
+            topics (list): Topics as bytes, the event topic first unless anonymous
+            data (bytes): Data of the log
+
+        Raises:
+            MismatchedABI: If the log does not match the event
+
+        """
+        if not self.anonymous:
+            if not topics or topics[0] != self.topic:
+                raise MismatchedABI('The log is not a {0} event'.format(self.name))
+            topics = topics[1:]
+
+        if len(topics) != len(self.indexed):
+            raise MismatchedABI('Expected {0} indexed arguments for {1}, the log has {2}'.format(
+                len(self.indexed), self.name, len(topics)))
+
+        try:
+            values = {
+                arg['name']: topic if decoder is None else decoder(ContextFramesBytesIO(topic))
+                for arg, decoder, topic in zip(self.indexed, self._topic_decoders, topics)
+            }
+            values.update(zip(
+                (arg['name'] for arg in self.not_indexed),
+                self._data_decoder(ContextFramesBytesIO(data))
+            ))
+        except DecodingError as e:
+            raise MismatchedABI('Could not decode the {0} event: {1}'.format(self.name, e))
+
+        return AttributeDict({
+            name: values[name] if self._normalizers.get(name) is None
+            else self._normalizers[name](values[name])
+            for name in self.input_names
+        })
+
+    def decode_log(self, log, receipt=None, log_index=None) -> AttributeDict:
+        """Decode a log of a transaction info
+
+        Args:
+            log (dict): Item of the ``log`` list of a transaction info
+            receipt (dict): Transaction info holding the log
+            log_index (int): Position of the log in the transaction
+
+        Raises:
+            MismatchedABI: If the log does not match the event
+
+        """
+        args = self.decode_args(
+            [log_bytes(topic) for topic in log.get('topics', [])],
+            log_bytes(log.get('data'))
+        )
+
+        address = log.get('address')
+        return AttributeDict({
+            'event': self.name,
+            'args': args,
+            'address': to_checksum_address('0x' + address[-40:]) if address else None,
+            'logIndex': log_index,
+            'transactionHash': receipt.get('id') if receipt else None,
+            'blockNumber': receipt.get('blockNumber') if receipt else None,
+        })
+
+    def __repr__(self):
+        return '<PreparedEvent {0}>'.format(abi_to_signature(self.abi))
+
+
+def prepare_events(contract_abi):
+    """Prepare every event of an ABI
+
+    Returns:
+        list: PreparedEvent of each event
+
+    """
+    return [PreparedEvent(event_abi) for event_abi in filter_by_type('event', contract_abi or [])]
@@ -0,0 +1,95 @@
+# --------------------------------------------------------------------
+# Copyright (c) iEXBase. All rights reserved.
+# Licensed under the MIT License.
+# See License.txt in the project root for license information.
+# --------------------------------------------------------------------
+
+"""
+    tronapi.common.fastjson
+    =======================
+
+    Pluggable JSON backend used for node requests and responses.
+
+    ``orjson`` is used when installed, then ``ujson``, and the standard
+    library otherwise. Both functions work on bytes, so response bodies
+    can be parsed without decoding them to text first.
+
+    ``orjson`` parses integers wider than 64 bits as floats, losing
+    precision. Node responses never hold such values, but when parsing
+    other JSON that may, select another backend, e.g. with
+    ``set_backend('json')``. Serializing them works with every backend.
+
+    :copyright: © 2019 by the iEXBase.
+    :license: MIT License
+"""
+
+import json
+
+
+def _stdlib_loads(data):
+    if isinstance(data, (bytes, bytearray)):
+        data = data.decode('utf-8')
+    return json.loads(data)
+
+
+def _stdlib_dumps(value):
+    return json.dumps(value, separators=(',', ':')).encode('utf-8')
+
+
+BACKENDS = {
+    'json': (_stdlib_loads, _stdlib_dumps),
+}
+
+try:
+    import orjson
+
+    def _orjson_dumps(value):
+        try:
+            return orjson.dumps(value)
+        except TypeError:
+            # Integers wider than 64 bits and non-string keys
+            return _stdlib_dumps(value)
+
+    BACKENDS['orjson'] = (orjson.loads, _orjson_dumps)
+except ImportError:
+    pass
+
+try:
+    import ujson
+
+    def _ujson_dumps(value):
+        return ujson.dumps(value, ensure_ascii=False).encode('utf-8')
+
+    BACKENDS['ujson'] = (ujson.loads, _ujson_dumps)
+except ImportError:
+    pass
+
+backend = None
+loads = None
+dumps = None
+
+
+def set_backend(name):
+    """Select the JSON implementation used by the providers
+
+    Unlike the others, "orjson" parses integers wider than 64 bits as
+    floats.
+
+    Args:
+        name (str): One of "orjson", "ujson" or "json"
+
+    """
+    global backend, loads, dumps
+
+    if name not in BACKENDS:
+        raise ValueError(
+            'JSON backend {0!r} is not available, choose from: {1}'.format(
+                name, ', '.join(sorted(BACKENDS))
+            )
+        )
+
+    backend = name
+    loads, dumps = BACKENDS[name]
+
+
+set_backend(next(name for name in ('orjson', 'ujson', 'json') if name in BACKENDS))
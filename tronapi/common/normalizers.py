@@ -2,7 +2,9 @@ import functools
 import json
 
 from eth_utils import (
+    is_0x_prefixed,
     is_binary_address,
+    is_text,
     to_hex,
     hexstr_if_str
 )
@@ -10,7 +12,7 @@ from hexbytes import HexBytes
 from toolz import curry
 
 from tronapi.common.abi import process_type
-from tronapi.common.account import Address
+from tronapi.common.account import Address, is_address
 from tronapi.common.encoding import (
     to_bytes,
     text_if_str,
@@ -50,6 +52,10 @@ def normalize_bytecode(bytecode):
 @implicitly_identity
 def abi_address_to_hex(abi_type, data):
     if abi_type == 'address':
+        # Tron addresses, in base58 or hex with the 41 prefix
+        if is_text(data) and not is_0x_prefixed(data) and is_address(data):
+            return abi_type, '0x' + Address.to_hex(data)[2:].lower()
+
         validate_address(data)
         if is_binary_address(data):
             return abi_type, to_hex(data)
@@ -75,7 +81,12 @@ def addresses_checksummed(abi_type, data):
 
 
 def to_checksum_address(address: str):
-    return Address().from_hex(address)
+    """Base58 form of a decoded address, given as 20 bytes of hex with a 0x prefix"""
+    if is_0x_prefixed(address):
+        address = '41' + address[2:]
+
+    address = Address().from_hex(address)
+    return address.decode() if isinstance(address, bytes) else address
 
 
 @curry
@@ -0,0 +1,255 @@
+# --------------------------------------------------------------------
+# Copyright (c) iEXBase. All rights reserved.
+# Licensed under the MIT License.
+# See License.txt in the project root for license information.
+# --------------------------------------------------------------------
+
+"""
+    tronapi.common.protobuf
+    =======================
+
+    Minimal protobuf serializer for TRON transactions.
+
+    Only encoding is supported, and only for the messages listed in
+    ``MESSAGES``. Values use the same JSON representation as the node
+    (hex strings for bytes, names for enums), and fields holding their
+    default value are skipped, as protobuf 3 does. The output is
+    therefore byte for byte what the node produces for ``raw_data_hex``.
+
+    :copyright: © 2019 by the iEXBase.
+    :license: MIT License
+"""
+
+from trx_utils import remove_0x_prefix
+
+WIRE_VARINT = 0
+WIRE_LENGTH_DELIMITED = 2
+
+TYPE_URL_PREFIX = 'type.googleapis.com/protocol.'
+
+# Transaction.Contract.ContractType
+CONTRACT_TYPES = {
+    'AccountCreateContract': 0,
+    'TransferContract': 1,
+    'TransferAssetContract': 2,
+    'VoteAssetContract': 3,
+    'VoteWitnessContract': 4,
+    'WitnessCreateContract': 5,
+    'AssetIssueContract': 6,
+    'WitnessUpdateContract': 8,
+    'ParticipateAssetIssueContract': 9,
+    'AccountUpdateContract': 10,
+    'FreezeBalanceContract': 11,
+    'UnfreezeBalanceContract': 12,
+    'WithdrawBalanceContract': 13,
+    'UnfreezeAssetContract': 14,
+    'UpdateAssetContract': 15,
+    'ProposalCreateContract': 16,
+    'ProposalApproveContract': 17,
+    'ProposalDeleteContract': 18,
+    'SetAccountIdContract': 19,
+    'CustomContract': 20,
+    'CreateSmartContract': 30,
+    'TriggerSmartContract': 31,
+    'GetContract': 32,
+    'UpdateSettingContract': 33,
+    'ExchangeCreateContract': 41,
+    'ExchangeInjectContract': 42,
+    'ExchangeWithdrawContract': 43,
+    'ExchangeTransactionContract': 44,
+    'UpdateEnergyLimitContract': 45,
+    'AccountPermissionUpdateContract': 46,
+    'ClearABIContract': 48,
+    'UpdateBrokerageContract': 49,
+    'ShieldedTransferContract': 51,
+    'MarketSellAssetContract': 52,
+    'MarketCancelOrderContract': 53,
+    'FreezeBalanceV2Contract': 54,
+    'UnfreezeBalanceV2Contract': 55,
+    'WithdrawExpireUnfreezeContract': 56,
+    'DelegateResourceContract': 57,
+    'UnDelegateResourceContract': 58,
+    'CancelAllUnfreezeV2Contract': 59,
+}
+
+# ResourceCode
+RESOURCE_CODES = {
+    'BANDWIDTH': 0,
+    'ENERGY': 1,
+}
+
+# Message name -> fields as (json name, field number, kind).
+# Kinds are "int", "bool", "bytes", "string", "resource" or the name
+# of another message; a list value encodes a repeated field.
+MESSAGES = {
+    'Transaction.raw': (
+        ('ref_block_bytes', 1, 'bytes'),
+        ('ref_block_num', 3, 'int'),
+        ('ref_block_hash', 4, 'bytes'),
+        ('expiration', 8, 'int'),
+        ('data', 10, 'bytes'),
+        ('contract', 11, 'Transaction.Contract'),
+        ('timestamp', 14, 'int'),
+        ('fee_limit', 18, 'int'),
+    ),
+    'Any': (
+        ('type_url', 1, 'string'),
+        ('value', 2, 'bytes'),
+    ),
+    'Transaction.Contract': (
+        ('type', 1, 'contract_type'),
+        ('parameter', 2, 'Any'),
+        ('Permission_id', 5, 'int'),
+    ),
+    'AccountCreateContract': (
+        ('owner_address', 1, 'bytes'),
+        ('account_address', 2, 'bytes'),
+    ),
+    'TransferContract': (
+        ('owner_address', 1, 'bytes'),
+        ('to_address', 2, 'bytes'),
+        ('amount', 3, 'int'),
+    ),
+    'TransferAssetContract': (
+        ('asset_name', 1, 'bytes'),
+        ('owner_address', 2, 'bytes'),
+        ('to_address', 3, 'bytes'),
+        ('amount', 4, 'int'),
+    ),
+    'VoteWitnessContract.Vote': (
+        ('vote_address', 1, 'bytes'),
+        ('vote_count', 2, 'int'),
+    ),
+    'VoteWitnessContract': (
+        ('owner_address', 1, 'bytes'),
+        ('votes', 2, 'VoteWitnessContract.Vote'),
+        ('support', 3, 'bool'),
+    ),
+    'WitnessCreateContract': (
+        ('owner_address', 1, 'bytes'),
+        ('url', 2, 'bytes'),
+    ),
+    'AccountUpdateContract': (
+        ('account_name', 1, 'bytes'),
+        ('owner_address', 2, 'bytes'),
+    ),
+    'FreezeBalanceContract': (
+        ('owner_address', 1, 'bytes'),
+        ('frozen_balance', 2, 'int'),
+        ('frozen_duration', 3, 'int'),
+        ('resource', 10, 'resource'),
+        ('receiver_address', 15, 'bytes'),
+    ),
+    'UnfreezeBalanceContract': (
+        ('owner_address', 1, 'bytes'),
+        ('resource', 10, 'resource'),
+        ('receiver_address', 13, 'bytes'),
+    ),
+    'WithdrawBalanceContract': (
+        ('owner_address', 1, 'bytes'),
+    ),
+    'TriggerSmartContract': (
+        ('owner_address', 1, 'bytes'),
+        ('contract_address', 2, 'bytes'),
+        ('call_value', 3, 'int'),
+        ('data', 4, 'bytes'),
+        ('call_token_value', 5, 'int'),
+        ('token_id', 6, 'int'),
+    ),
+}
+
+
+def encode_varint(value) -> bytes:
+    """Encode an integer as a base 128 varint.
+
+    Negative values are encoded as 64 bit two's complement, like int64 fields.
+    """
+    if value < 0:
+        value += 1 << 64
+
+    out = bytearray()
+    while value > 0x7f:
+        out.append((value & 0x7f) | 0x80)
+        value >>= 7
+    out.append(value)
+
+    return bytes(out)
+
+
+def hex_to_bytes(value) -> bytes:
+    """Decode a JSON bytes value, given as a hex string with or without 0x"""
+    if isinstance(value, (bytes, bytearray)):
+        return bytes(value)
+
+    return bytes.fromhex(remove_0x_prefix(value))
+
+
+def _encode_scalar(kind, value):
+    if kind in ('int', 'bool'):
+        return WIRE_VARINT, int(value)
+
+    if kind == 'resource':
+        return WIRE_VARINT, RESOURCE_CODES[value] if isinstance(value, str) else int(value)
+
+    if kind == 'contract_type':
+        return WIRE_VARINT, CONTRACT_TYPES[value] if isinstance(value, str) else int(value)
+
+    if kind == 'bytes':
+        return WIRE_LENGTH_DELIMITED, hex_to_bytes(value)
+
+    if kind == 'string':
+        return WIRE_LENGTH_DELIMITED, value.encode('utf-8')
+
+    if kind == 'Any':
+        payload = encode_any(value)
+    else:
+        payload = encode_message(kind, value)
+
+    return WIRE_LENGTH_DELIMITED, payload
+
+
+def encode_message(name, value) -> bytes:
+    """Serialize a message given in its JSON representation
+
+    Args:
+        name (str): Message name, one of ``MESSAGES``
+        value (dict): Message fields
+
+    """
+    out = bytearray()
+    for field, number, kind in MESSAGES[name]:
+        items = value.get(field)
+        if not isinstance(items, (list, tuple)):
+            items = (items,)
+
+        for item in items:
+            if item is None:
+                continue
+
+            wire_type, payload = _encode_scalar(kind, item)
+            # Default values are not serialized, embedded messages always are
+            if not payload and not isinstance(item, dict):
+                continue
+
+            out += encode_varint(number << 3 | wire_type)
+            if wire_type == WIRE_VARINT:
+                out += encode_varint(payload)
+            else:
+                out += encode_varint(len(payload))
+                out += payload
+
+    return bytes(out)
+
+
+def encode_any(parameter) -> bytes:
+    """Serialize the ``google.protobuf.Any`` wrapping a contract"""
+    type_url = parameter['type_url']
+    name = type_url[type_url.rindex('.') + 1:]
+
+    value = encode_message(name, parameter['value'])
+    return encode_message('Any', {'type_url': type_url, 'value': value})
+
+
+def encode_raw_data(raw_data) -> bytes:
+    """Serialize the ``raw_data`` of a transaction, whose sha256 is the txID"""
+    return encode_message('Transaction.raw', raw_data)
@@ -7,13 +7,10 @@
 import copy
 
 from eth_abi import decode_abi
-from eth_utils import (
-    function_abi_to_4byte_selector,
-    to_hex
-)
+from eth_abi.exceptions import DecodingError
+from eth_utils import to_hex
 from hexbytes import HexBytes
 from trx_utils import (
-    encode_hex,
     is_text,
     deprecated_for,
     combomethod
@@ -24,30 +21,40 @@ from tronapi.common.abi import (
     merge_args_and_kwargs,
     abi_to_signature,
     fallback_func_abi_exists,
-    check_if_arguments_can_be_encoded,
-    map_abi_data
+    check_if_arguments_can_be_encoded
 )
 
 from tronapi.common.contracts import (
     find_matching_fn_abi,
     encode_abi,
     get_function_info,
-    FallbackFn
+    prepare_functions,
+    index_by_selector,
+    prepare_events,
+    FallbackFn,
+    PreparedEvent,
+    PreparedFunction,
+    log_bytes
 )
 from tronapi.common.datatypes import PropertyCheckingFactory
 from tronapi.common.encoding import to_4byte_hex
 from tronapi.common.normalizers import (
     normalize_abi,
-    normalize_bytecode,
-    BASE_RETURN_NORMALIZERS
+    normalize_bytecode
 )
 from tronapi.exceptions import (
+    ContractLogicError,
+    NoABIEventsFound,
     NoABIFunctionsFound,
     MismatchedABI,
     FallbackNotFound
 )
 
 
+# Selector of Error(string), the data returned by revert("reason")
+REVERT_SELECTOR = bytes.fromhex('08c379a0')
+
+
 class NonExistentFallbackFunction:
     @staticmethod
     def _raise_exception():
@@ -67,9 +74,18 @@ class ContractFunction:
     transaction = None
     arguments = None
 
+    # Functions sharing this name, {argument count: [PreparedFunction]}
+    prepared_functions = None
+    # Overload chosen for each signature of argument types, per function name
+    overloads = None
+    # PreparedFunction of the function, once resolved
+    prepared = None
+
     def __init__(self, abi=None):
         self.abi = abi
         self.fn_name = type(self).__name__
+        if abi and self.prepared is None:
+            self.prepared = PreparedFunction(abi)
 
     def __call__(self, *args, **kwargs):
         clone = copy.copy(self)
@@ -86,22 +102,99 @@ class ContractFunction:
         return clone
 
     def _set_function_info(self):
-        if not self.abi:
-            self.abi = find_matching_fn_abi(
-                self.contract_abi,
-                self.function_identifier,
-                self.args,
-                self.kwargs
-            )
-        if self.function_identifier is FallbackFn:
-            self.selector = encode_hex(b'')
-        elif is_text(self.function_identifier):
-            self.selector = encode_hex(function_abi_to_4byte_selector(self.abi))
-        else:
-            raise TypeError("Unsupported function identifier")
+        if self.prepared is None:
+            self.prepared = self._find_prepared_function()
 
+        self.abi = self.prepared.abi
+        self.selector = self.prepared.selector_hex
         self.arguments = merge_args_and_kwargs(self.abi, self.args, self.kwargs)
 
+    def _find_prepared_function(self):
+        """Resolve the function matching the arguments
+
+        A name without overloads for the number of arguments resolves
+        directly. Otherwise the overload found for a signature of argument
+        types is reused as long as it can encode the arguments.
+
+        """
+        candidates = ()
+        if self.prepared_functions and is_text(self.function_identifier):
+            candidates = self.prepared_functions.get(len(self.args) + len(self.kwargs), ())
+
+        if len(candidates) == 1:
+            return candidates[0]
+
+        key = None
+        if candidates and self.overloads is not None:
+            key = (
+                tuple(type(arg) for arg in self.args),
+                tuple(sorted((name, type(arg)) for name, arg in self.kwargs.items()))
+            )
+            prepared = self.overloads.get(key)
+            if prepared is not None and \
+                    check_if_arguments_can_be_encoded(prepared.abi, self.args, self.kwargs):
+                return prepared
+
+        fn_abi = find_matching_fn_abi(
+            self.contract_abi,
+            self.function_identifier,
+            self.args,
+            self.kwargs
+        )
+        prepared = next(
+            (candidate for candidate in candidates if candidate.abi is fn_abi), None
+        ) or PreparedFunction(fn_abi)
+
+        if key is not None:
+            self.overloads[key] = prepared
+        return prepared
+
+    def _encode_transaction_data(self, data=None):
+        """Hex encoded call data of the function bound to its arguments
+
+        Args:
+            data (str): Prefix used instead of the function selector
+
+        """
+        return self.prepared.encode(self.arguments, data)
+
+    def call(self, owner_address=None, call_value=0):
+        """Execute the function on a node, without creating a transaction
+
+        Reads the state of the contract through ``triggerconstantcontract``.
+
+        Examples:
+            >>> token = tron.trx.contract(abi=trc20_abi)(address='TR7NHqjeKQxGTCi8q8ZY4pL8otSzgjLj6t')
+            >>> token.functions.balanceOf('TJRabPrwbZy45sbavfcjinPJC18kjpRTv8').call()
+
+        Args:
+            owner_address (str): Caller, the default address or else the contract when omitted
+            call_value (int): Amount of SUN sent with the call
+
+        Returns:
+            The returned value, or a list when the function returns several values
+
+        Raises:
+            ContractLogicError: If the call fails or reverts
+
+        """
+        if not self.address:
+            raise TypeError("The contract address is required to call a function.")
+
+        if not is_text(self.function_identifier):
+            raise TypeError("Only named functions can be called.")
+
+        data = constant_call(
+            self.tron,
+            self.address,
+            abi_to_signature(self.abi),
+            self.prepared.encode_arguments(self.arguments),
+            owner_address=owner_address,
+            call_value=call_value
+        )
+        values = self.prepared.decode_output(data)
+        return values[0] if len(values) == 1 else values
+
     @classmethod
     def factory(cls, class_name, **kwargs):
         return PropertyCheckingFactory(class_name, (cls,), kwargs)(kwargs.get('abi'))
@@ -119,10 +212,13 @@ class ContractFunctions:
     """Class containing contract function objects
     """
 
-    def __init__(self, abi, tron, address=None):
+    def __init__(self, abi, tron, address=None, prepared_functions=None):
         if abi:
             self.abi = abi
             self._functions = filter_by_type('function', self.abi)
+            if prepared_functions is None:
+                prepared_functions = prepare_functions(self.abi)
+
             for func in self._functions:
                 setattr(
                     self,
@@ -132,7 +228,9 @@ class ContractFunctions:
                         tron=tron,
                         contract_abi=self.abi,
                         address=address,
-                        function_identifier=func['name']))
+                        function_identifier=func['name'],
+                        prepared_functions=prepared_functions[func['name']],
+                        overloads={}))
 
     def __iter__(self):
         if not hasattr(self, '_functions') or not self._functions:
@@ -159,6 +257,249 @@ class ContractFunctions:
         return getattr(self, function_name)
 
 
+class ContractEvent:
+    """Base class for contract events"""
+    address = None
+    event_name = None
+    tron = None
+    contract_abi = None
+    abi = None
+
+    # PreparedEvent of the event
+    prepared = None
+
+    def __init__(self, abi=None):
+        self.abi = abi
+        self.event_name = type(self).__name__
+        if abi and self.prepared is None:
+            self.prepared = PreparedEvent(abi)
+
+    def process_log(self, log, receipt=None, log_index=None):
+        """Decode a log of a transaction info
+
+        Raises:
+            MismatchedABI: If the log is not this event
+
+        """
+        return self.prepared.decode_log(log, receipt, log_index)
+
+    def process_receipt(self, receipt):
+        """Decode the logs of a transaction info which are this event
+
+        Logs emitted by other contracts are skipped when the event is
+        bound to a contract address.
+
+        """
+        address = _log_address(self.address)
+        events = []
+        for log_index, log in enumerate(receipt.get('log', [])):
+            if address and _log_address(log.get('address')) != address:
+                continue
+
+            try:
+                events.append(self.prepared.decode_log(log, receipt, log_index))
+            except MismatchedABI:
+                continue
+
+        return events
+
+    @classmethod
+    def factory(cls, class_name, **kwargs):
+        return PropertyCheckingFactory(class_name, (cls,), kwargs)(kwargs.get('abi'))
+
+    def __repr__(self):
+        return '<Event %s>' % abi_to_signature(self.abi)
+
+
+class ContractEvents:
+    """Class containing contract event objects
+
+    Events are indexed by topic, so the logs of many transactions can be
+    decoded in one pass with :meth:`process_receipts`.
+
+    """
+
+    def __init__(self, abi, tron, address=None, prepared_events=None):
+        if abi:
+            self.abi = abi
+            self._events = filter_by_type('event', self.abi)
+            if prepared_events is None:
+                prepared_events = prepare_events(self.abi)
+
+            self._address = _log_address(address)
+            self._topics = {
+                prepared.topic: prepared
+                for prepared in prepared_events
+                if not prepared.anonymous
+            }
+
+            for prepared in prepared_events:
+                setattr(
+                    self,
+                    prepared.name,
+                    ContractEvent.factory(
+                        prepared.name,
+                        tron=tron,
+                        contract_abi=self.abi,
+                        address=address,
+                        abi=prepared.abi,
+                        prepared=prepared))
+
+    def __iter__(self):
+        if not hasattr(self, '_events') or not self._events:
+            return
+
+        for event in self._events:
+            yield event['name']
+
+    def __getattr__(self, event_name):
+        if not self.__dict__.get('_events'):
+            raise NoABIEventsFound(
+                "The abi for this contract contains no event definitions. ",
+                "Are you sure you provided the correct contract abi?"
+            )
+        elif event_name not in [event['name'] for event in self.__dict__['_events']]:
+            raise MismatchedABI(
+                "The event '{}' was not found in this contract's abi. ".format(event_name),
+                "Are you sure you provided the correct contract abi?"
+            )
+        else:
+            return super().__getattribute__(event_name)
+
+    def __getitem__(self, event_name):
+        return getattr(self, event_name)
+
+    def process_receipt(self, receipt):
+        """Decode the logs of a transaction info matching an event of the ABI"""
+        return self.process_receipts([receipt])
+
+    def process_receipts(self, receipts):
+        """Decode the logs of many transaction infos
+
+        Each log is matched to an event of the ABI by its first topic.
+        Logs of unknown or anonymous events, logs which do not fit the
+        event ABI and, when the contract has an address, logs emitted by
+        other contracts are skipped.
+
+        Examples:
+            >>> infos = tron.trx.get_transaction_info_by_block_num(block)
+            >>> for event in contract.events.process_receipts(infos):
+            >>>     print(event.event, event.args)
+
+        Args:
+            receipts (list): Transaction infos, as returned by ``gettransactioninfobyid``
+
+        Returns:
+            list: Decoded events, in order
+
+        """
+        if '_events' not in self.__dict__:
+            return []
+
+        topics = self._topics
+        address = self._address
+        events = []
+        for receipt in receipts:
+            for log_index, log in enumerate(receipt.get('log', [])):
+                log_topics = log.get('topics')
+                if not log_topics:
+                    continue
+
+                prepared = topics.get(log_bytes(log_topics[0]))
+                if prepared is None:
+                    continue
+
+                if address and _log_address(log.get('address')) != address:
+                    continue
+
+                try:
+                    events.append(prepared.decode_log(log, receipt, log_index))
+                except MismatchedABI:
+                    continue
+
+        return events
+
+
+def constant_call(tron, contract_address, function_selector, parameter,
+                  owner_address=None, call_value=0):
+    """Run a function through ``triggerconstantcontract``
+
+    Args:
+        tron (Tron): Tron instance
+        contract_address (str): Address of the contract
+        function_selector (str): Signature of the function, e.g. ``'balanceOf(address)'``
+        parameter (bytes): Encoded arguments
+        owner_address (str): Caller, the default address or else the contract when omitted
+        call_value (int): Amount of SUN sent with the call
+
+    Returns:
+        bytes: the data returned by the function
+
+    Raises:
+        ContractLogicError: If the call fails or reverts
+
+    """
+    owner_address = owner_address or tron.default_address.get('hex') or contract_address
+    params = {
+        'owner_address': tron.address.to_hex(owner_address),
+        'contract_address': tron.address.to_hex(contract_address),
+        'function_selector': function_selector,
+        'parameter': parameter.hex()
+    }
+    if call_value:
+        params['call_value'] = int(call_value)
+
+    response = tron.manager.request('/wallet/triggerconstantcontract', params)
+
+    error = constant_call_error(response)
+    if error is not None:
+        raise ContractLogicError('Call to {0} failed: {1}'.format(function_selector, error))
+
+    return bytes.fromhex(response['constant_result'][0])
+
+
+def revert_reason(data):
+    """Reason given to revert(), or None when the data is not an Error(string)"""
+    if data[:4] != REVERT_SELECTOR:
+        return None
+
+    try:
+        return decode_abi(['string'], data[4:])[0]
+    except DecodingError:
+        return ''
+
+
+def constant_call_error(response):
+    """Reason of a failed ``triggerconstantcontract`` call, or None when it succeeded"""
+    result = response.get('result') or {}
+    constant_result = response.get('constant_result') or []
+    data = bytes.fromhex(constant_result[0]) if constant_result else b''
+
+    reason = revert_reason(data)
+    if reason is not None:
+        return 'reverted: ' + reason if reason else 'reverted'
+
+    ret = (response.get('transaction') or {}).get('ret') or [{}]
+    if result.get('result') and constant_result and ret[0].get('ret') != 'FAILED':
+        return None
+
+    message = result.get('message') or response.get('Error') or 'no result'
+    try:
+        message = bytes.fromhex(message).decode()
+    except ValueError:
+        pass
+
+    code = result.get('code')
+    return '{0} {1}'.format(code, message) if code else message
+
+
+def _log_address(address):
+    """The 20 bytes of an address in hex, as found in logs"""
+    if not address:
+        return None
+    return address[-40:].lower()
+
+
 class Contract:
     # set during class construction
     tron = None
@@ -175,6 +516,13 @@ class Contract:
     functions = None
     events = None
 
+    # Prepared functions of the ABI, shared by the instances of the class
+    prepared_functions = None
+    # Selector (4 bytes) -> PreparedFunction
+    selector_index = None
+    # Prepared events of the ABI, shared by the instances of the class
+    prepared_events = None
+
     def __init__(self, address=None):
         """Create a new smart contract proxy object.
         :param address: Contract address as 0x hex string
@@ -191,7 +539,10 @@ class Contract:
         if not self.address:
             raise TypeError("The address argument is required to instantiate a contract.")
 
-        self.functions = ContractFunctions(self.abi, self.tron, self.address)
+        self.functions = ContractFunctions(self.abi, self.tron, self.address,
+                                           self.prepared_functions)
+        self.events = ContractEvents(self.abi, self.tron, self.address,
+                                     self.prepared_events)
         self.fallback = Contract.get_fallback_function(self.abi, self.tron, self.address)
 
     @classmethod
@@ -211,7 +562,13 @@ class Contract:
             normalizers=normalizers
         )
 
-        setattr(contract, 'functions', ContractFunctions(contract.abi, contract.tron))
+        setattr(contract, 'prepared_functions', prepare_functions(contract.abi))
+        setattr(contract, 'selector_index', index_by_selector(contract.prepared_functions))
+        setattr(contract, 'functions', ContractFunctions(contract.abi, contract.tron,
+                                                         prepared_functions=contract.prepared_functions))
+        setattr(contract, 'prepared_events', prepare_events(contract.abi))
+        setattr(contract, 'events', ContractEvents(contract.abi, contract.tron,
+                                                   prepared_events=contract.prepared_events))
         setattr(contract, 'fallback', Contract.get_fallback_function(contract.abi, contract.tron))
 
         return contract
@@ -316,22 +673,80 @@ class Contract:
 
     @combomethod
     def get_function_by_selector(self, selector):
-        def callable_check(fn_abi):
-            return encode_hex(function_abi_to_4byte_selector(fn_abi)) == to_4byte_hex(selector)
-
-        fns = find_functions_by_identifier(self.abi, self.tron, self.address, callable_check)
-        return get_function_by_identifier(fns, 'selector')
+        return self._get_function_by_selector(HexBytes(to_4byte_hex(selector)))
 
     @combomethod
     def decode_function_input(self, data):
         data = HexBytes(data)
-        selector, params = data[:4], data[4:]
-        func = self.get_function_by_selector(selector)
-        names = [x['name'] for x in func.abi['inputs']]
-        types = [x['type'] for x in func.abi['inputs']]
-        decoded = decode_abi(types, params)
-        normalized = map_abi_data(BASE_RETURN_NORMALIZERS, types, decoded)
-        return func, dict(zip(names, normalized))
+        func = self._get_function_by_selector(data[:4])
+        return func, func.prepared.decode_arguments(data[4:])
+
+    @combomethod
+    def decode_function_inputs(self, batch):
+        """Decode the call data of many transactions
+
+        Functions are looked up by selector in an index built once per
+        contract class.
+
+        Examples:
+            >>> for func, arguments in contract.decode_function_inputs(calls):
+            >>>     print(func.fn_name, arguments)
+
+        Args:
+            batch (list): Call data, as hex strings or bytes
+
+        Returns:
+            list: ``(function, arguments)`` for each call data as returned by
+            :meth:`decode_function_input`, or None when its selector is not
+            part of the ABI
+
+        """
+        index = self._get_selector_index()
+        functions = {}
+        decoded = []
+        for data in batch:
+            data = HexBytes(data)
+            selector = bytes(data[:4])
+
+            func = functions.get(selector)
+            if func is None and selector in index:
+                func = functions[selector] = self._get_function_by_selector(selector)
+
+            decoded.append(None if func is None else (func, func.prepared.decode_arguments(data[4:])))
+
+        return decoded
+
+    @combomethod
+    def _get_selector_index(self):
+        if self.selector_index is None:
+            self.selector_index = index_by_selector(prepare_functions(self.abi))
+        return self.selector_index
+
+    @combomethod
+    def _get_function_by_selector(self, selector):
+        prepared = self._get_selector_index().get(bytes(selector))
+        if prepared is None:
+            raise ValueError('Could not find any function with matching selector')
+
+        # One function object per selector, on the class or instance the
+        # method is called on, as they are bound to its address
+        functions = vars(self).get('_selector_functions')
+        if functions is None:
+            functions = {}
+            setattr(self, '_selector_functions', functions)
+
+        func = functions.get(prepared.selector)
+        if func is None:
+            func = functions[prepared.selector] = ContractFunction.factory(
+                prepared.abi['name'],
+                tron=self.tron,
+                contract_abi=self.abi,
+                address=self.address,
+                function_identifier=prepared.abi['name'],
+                abi=prepared.abi,
+                prepared=prepared
+            )
+        return func
 
     @combomethod
     def find_functions_by_args(self, *args):
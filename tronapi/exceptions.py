@@ -13,6 +13,10 @@ class InvalidTronError(TronError):
     """Raised Tron Error"""
 
 
+class ContractLogicError(TronError):
+    """Raised when a constant call of a contract function fails or reverts"""
+
+
 class FallbackNotFound(Exception):
     """
     Raised when fallback function doesn't exist in contract.
@@ -42,6 +46,13 @@ class NoABIFunctionsFound(AttributeError):
     pass
 
 
+class NoABIEventsFound(AttributeError):
+    """
+    Raised when an ABI doesn't contain any events.
+    """
+    pass
+
+
 class ValidationError(Exception):
     """
     Raised when a supplied value is invalid.
@@ -94,6 +105,14 @@ class GatewayTimeout(TransportError):
     """Exception for HTTP 503 errors."""
 
 
+class NodeUnavailable(TronError):
+    """Raised when every node able to serve a request is marked as unhealthy."""
+
+
+class IncompleteBlockRange(TronError):
+    """Raised when a node keeps returning fewer blocks than requested."""
+
+
 class TimeExhausted(Exception):
     """
     Raised when a method has not retrieved the desired result within a specified timeout.
@@ -0,0 +1,271 @@
+# --------------------------------------------------------------------
+# Copyright (c) iEXBase. All rights reserved.
+# Licensed under the MIT License.
+# See License.txt in the project root for license information.
+# --------------------------------------------------------------------
+
+"""
+    tronapi.follower
+    ================
+
+    Follow the chain head, handling reorganizations
+    of blocks that are not solidified yet.
+
+    :copyright: © 2019 by the iEXBase.
+    :license: MIT License
+"""
+
+import json
+import os
+import time
+from collections import deque, namedtuple
+
+from trx_utils import is_integer
+
+from tronapi.common.blocks import block_number
+from tronapi.exceptions import IncompleteBlockRange, TronError
+
+# A new block on the followed chain. It may still be rolled back.
+BLOCK_NEW = 'new'
+# A block previously reported as new which left the chain.
+BLOCK_ROLLBACK = 'rollback'
+# A block which reached the solidified height and is final.
+BLOCK_SOLIDIFIED = 'solidified'
+
+BlockEvent = namedtuple('BlockEvent', ('kind', 'number', 'block_id', 'block'))
+
+
+def parent_hash(block):
+    """Hash of the parent of a block as returned by the node"""
+    return block['block_header']['raw_data'].get('parentHash')
+
+
+class JsonCheckpoint(object):
+    """Stores the follower position in a JSON file.
+
+    The file is replaced atomically, so an interrupted write
+    never leaves a corrupt checkpoint behind.
+
+    """
+
+    def __init__(self, path):
+        self.path = path
+
+    def load(self):
+        """Read the saved state, or None when there is none yet"""
+        if not os.path.exists(self.path):
+            return None
+
+        with open(self.path) as f:
+            return json.load(f)
+
+    def save(self, state):
+        """Persist the state
+
+        Args:
+            state (dict): Follower state
+
+        """
+        tmp_path = self.path + '.tmp'
+        with open(tmp_path, 'w') as f:
+            json.dump(state, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.path)
+
+
+class BlockFollower(object):
+    """Tails the chain and reports new, rolled back and solidified blocks.
+
+    Blocks above the solidified height are kept in a window together with
+    their hashes. When a new block does not extend the last block of the
+    window, the window is unwound (reporting ``rollback`` events) until
+    the new branch connects again. Blocks leave the window as ``solidified``
+    once the solidity node confirms their height.
+
+    Gaps, e.g. after a restart, are caught up in bulk with
+    :meth:`~tronapi.trx.Trx.fetch_blocks`. With a checkpoint the position
+    and window survive restarts, so following resumes without rescanning.
+
+    Examples:
+        >>> follower = BlockFollower(tron, checkpoint='follower.json')
+        >>> for event in follower.follow():
+        >>>     if event.kind == BLOCK_NEW:
+        >>>         index(event.block)
+        >>>     elif event.kind == BLOCK_ROLLBACK:
+        >>>         unindex(event.number, event.block_id)
+
+    """
+
+    def __init__(self, tron, start=None, checkpoint=None, concurrency=4, checkpoint_every=1000):
+        """Create a new follower
+
+        Args:
+            tron (Tron): Tron instance
+            start (int): First height to report, defaults to the current head.
+                Ignored when a checkpoint is found.
+            checkpoint (Any): Path to a JSON checkpoint file, or any object
+                with ``load()`` and ``save(state)`` methods
+            concurrency (int): Requests in flight while catching up
+            checkpoint_every (int): Blocks between two checkpoint saves while catching up
+
+        """
+        if start is not None and (not is_integer(start) or start < 0):
+            raise ValueError('Invalid start block provided')
+
+        if isinstance(checkpoint, str):
+            checkpoint = JsonCheckpoint(checkpoint)
+
+        self.tron = tron
+        self.checkpoint = checkpoint
+        self.concurrency = concurrency
+        self.checkpoint_every = checkpoint_every
+
+        self.next_number = start
+        self.solid_number = -1
+        # Last accepted block: (number, block_id)
+        self.tip = None
+        # Last solidified block: (number, block_id), the parent of the window
+        self.anchor = None
+        # Accepted blocks above the solidified height: (number, block_id, block)
+        self.window = deque()
+
+        state = checkpoint.load() if checkpoint is not None else None
+        if state:
+            self.next_number = state['next_number']
+            self.solid_number = state['solid_number']
+            self.tip = tuple(state['tip']) if state['tip'] else None
+            self.anchor = tuple(state['anchor']) if state.get('anchor') else None
+            self.window.extend((number, block_id, None) for number, block_id in state['window'])
+
+    @property
+    def state(self):
+        """Position of the follower, as saved in the checkpoint"""
+        return {
+            'next_number': self.next_number,
+            'solid_number': self.solid_number,
+            'tip': list(self.tip) if self.tip else None,
+            'anchor': list(self.anchor) if self.anchor else None,
+            'window': [[number, block_id] for number, block_id, _ in self.window]
+        }
+
+    def poll(self):
+        """Bring the follower up to the current head
+
+        Returns:
+            list: :class:`BlockEvent` items in the order they happened
+
+        """
+        return list(self.iter_events())
+
+    def iter_events(self):
+        """Bring the follower up to the current head, yielding events as they happen
+
+        The checkpoint is saved once the caller has consumed the events
+        it covers, so after a crash events are replayed rather than lost.
+
+        """
+        head = self.tron.trx.get_current_block()
+        head_number = block_number(head)
+        self.solid_number = max(
+            self.solid_number,
+            block_number(self.tron.trx.get_confirmed_current_block())
+        )
+
+        if self.next_number is None:
+            self.next_number = head_number
+
+        unsaved = 0
+        while self.next_number <= head_number:
+            if self.next_number == head_number:
+                blocks = [head]
+            else:
+                blocks = self.tron.trx.fetch_blocks(self.next_number, head_number + 1,
+                                                    concurrency=self.concurrency)
+
+            reorganized = False
+            try:
+                for block in blocks:
+                    if not self._extends_tip(block):
+                        yield self._rollback()
+                        reorganized = True
+                        break
+
+                    number = block_number(block)
+                    self.tip = (number, block['blockID'])
+                    self.window.append((number, block['blockID'], block))
+                    self.next_number = number + 1
+                    yield BlockEvent(BLOCK_NEW, number, block['blockID'], block)
+
+                    for event in self._solidify():
+                        yield event
+
+                    unsaved += 1
+                    if unsaved >= self.checkpoint_every:
+                        self._save()
+                        unsaved = 0
+            except IncompleteBlockRange:
+                # The node is behind the head it reported, try again later
+                break
+            finally:
+                if hasattr(blocks, 'close'):
+                    blocks.close()
+
+            if not reorganized and self.next_number <= head_number:
+                # The node returned fewer blocks than asked for, try again later
+                break
+
+        for event in self._solidify():
+            yield event
+
+        self._save()
+
+    def follow(self, interval=3):
+        """Yield block events forever
+
+        Args:
+            interval (float): Seconds to wait when the head has been reached.
+                TRON produces a block every 3 seconds.
+
+        """
+        while True:
+            received = False
+            for event in self.iter_events():
+                received = received or event.kind == BLOCK_NEW
+                yield event
+
+            if not received:
+                time.sleep(interval)
+
+    def _extends_tip(self, block):
+        """Whether the block is the child of the last accepted block"""
+        if self.tip is None:
+            return True
+
+        number, block_id = self.tip
+        return block_number(block) == number + 1 and parent_hash(block) == block_id
+
+    def _rollback(self):
+        """Drop the last accepted block, it is not on the canonical chain"""
+        if not self.window:
+            number, block_id = self.tip
+            raise TronError(
+                'Block {0} ({1}) was replaced although it is solidified'.format(number, block_id)
+            )
+
+        number, block_id, block = self.window.pop()
+        self.next_number = number
+        # The replacement must still link to the solidified chain
+        self.tip = self.window[-1][:2] if self.window else self.anchor
+        return BlockEvent(BLOCK_ROLLBACK, number, block_id, block)
+
+    def _solidify(self):
+        """Release the blocks which reached the solidified height"""
+        while self.window and self.window[0][0] <= self.solid_number:
+            number, block_id, block = self.window.popleft()
+            self.anchor = (number, block_id)
+            yield BlockEvent(BLOCK_SOLIDIFIED, number, block_id, block)
+
+    def _save(self):
+        if self.checkpoint is not None:
+            self.checkpoint.save(self.state)
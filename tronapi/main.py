@@ -15,6 +15,8 @@
     :license: MIT License
 """
 
+import threading
+
 from eth_account.datastructures import AttributeDict
 from urllib.parse import urlencode
 from eth_utils import (
@@ -27,15 +29,15 @@ from trx_utils import (
     to_sun,
     from_sun,
     is_integer,
+    is_string,
     add_0x_prefix,
-    remove_0x_prefix,
-    is_address
+    remove_0x_prefix
 )
 
 from tronapi.common.abi import map_abi_data
 
 
-from tronapi.common.account import Address, PrivateKey, Account
+from tronapi.common.account import Address, PrivateKey, Account, is_address
 from tronapi.common.normalizers import abi_resolver
 from tronapi.common.encoding import (
     to_bytes,
@@ -49,22 +51,34 @@ from tronapi.exceptions import (
     InvalidTronError,
     TronError
 )
-from tronapi.manager import TronManager
-from tronapi import HttpProvider, constants
+from tronapi.blockstore import BlockStore
+from tronapi.manager import TronManager, AsyncTronManager
+from tronapi.refblock import RefBlockCache
+from tronapi import HttpProvider, AsyncHttpProvider, constants
 from tronapi.transactionbuilder import TransactionBuilder
-from tronapi.trx import Trx
+from tronapi.trx import Trx, AsyncTrx
 
 
 DEFAULT_MODULES = {
     'trx': Trx
 }
 
+ASYNC_DEFAULT_MODULES = {
+    'trx': AsyncTrx
+}
+
 
 class Tron:
     # Providers
     HTTPProvider = HttpProvider
 
+    # Node manager and transaction builder implementations
+    manager_class = TronManager
+    transaction_builder_class = TransactionBuilder
+
     _default_block = None
+    _ref_block_cache = None
+    block_store = None
     _private_key = None
     _default_address = AttributeDict({})
 
@@ -100,11 +114,28 @@ class Tron:
         # The node manager allows you to automatically determine the node
         # on the router or manually refer to a specific node.
         # solidity_node, full_node or event_server
-        self.manager = TronManager(self, dict(
-            full_node=kwargs.get('full_node'),
-            solidity_node=kwargs.get('solidity_node'),
-            event_server=kwargs.get('event_server')
-        ))
+        self.manager = self.manager_class(
+            self,
+            dict(
+                full_node=kwargs.get('full_node'),
+                solidity_node=kwargs.get('solidity_node'),
+                event_server=kwargs.get('event_server')
+            ),
+            hedge_percentile=kwargs.get('hedge_percentile'),
+            response_cache=kwargs.get('response_cache'),
+            metadata_cache=kwargs.get('metadata_cache')
+        )
+
+        # Guards the creation of the reference block cache
+        self._ref_block_lock = threading.Lock()
+
+        # Confirmed blocks are read from and kept in a local store
+        block_store = kwargs.get('block_store')
+        if is_string(block_store):
+            block_store = BlockStore(block_store)
+        if block_store is not None:
+            block_store.tron = self
+            self.block_store = block_store
 
         # If the parameter of the private key is not empty,
         # then write to the variable
@@ -122,7 +153,9 @@ class Tron:
         for module_name, module_class in modules.items():
             module_class.attach(self, module_name)
 
-        self.transaction_builder = TransactionBuilder(self)
+        self.transaction_builder = None
+        if self.transaction_builder_class is not None:
+            self.transaction_builder = self.transaction_builder_class(self)
 
     @property
     def default_block(self):
@@ -145,9 +178,30 @@ class Tron:
         """List providers"""
         return self.manager.providers
 
+    @property
+    def ref_block_cache(self) -> RefBlockCache:
+        """Reference block shared by the transaction builders
+
+        The cache is started on first use and then refreshed
+        in the background.
+
+        """
+        if self._ref_block_cache is None:
+            with self._ref_block_lock:
+                if self._ref_block_cache is None:
+                    self._ref_block_cache = RefBlockCache(self).start()
+        return self._ref_block_cache
+
     @property
     def private_key(self):
         """Get a private key"""
+        if self._private_key is None:
+            return None
+        return str(self._private_key)
+
+    @property
+    def signing_key(self) -> PrivateKey:
+        """Parsed private key, with its public key and address cached"""
         return self._private_key
 
     @private_key.setter
@@ -163,7 +217,7 @@ class Tron:
         except ValueError:
             raise TronError('Invalid private key provided')
 
-        self._private_key = str(private_key).lower()
+        self._private_key = private_key
 
     @property
     def default_address(self) -> AttributeDict:
@@ -185,10 +239,9 @@ class Tron:
 
         _hex = self.address.to_hex(address)
         _base58 = self.address.from_hex(address)
-        _private_base58 = self.address.from_private_key(self._private_key).base58
 
         # check the addresses
-        if self._private_key and _private_base58 != _base58:
+        if self._private_key and self._private_key.address.base58 != _base58:
             self._private_key = None
 
         self._default_address = AttributeDict({
@@ -353,3 +406,51 @@ class Tron:
     def is_connected(self):
         """List of available providers"""
         return self.manager.is_connected()
+
+
+class AsyncTron(Tron):
+    """Connect to the Tron network using asyncio.
+
+    All node requests made through ``AsyncTron`` (``tron.trx``, ``tron.manager``,
+    event queries) are coroutines, which lets a single process keep many requests
+    in flight without a thread per request.
+
+    Transactions are not built through the node here, ``transaction_builder``
+    is therefore ``None``; build them with a synchronous :class:`Tron`
+    and sign/broadcast them with ``AsyncTron``. For the same reason the
+    ``block_store`` option and :attr:`Tron.ref_block_cache` are not
+    available.
+
+    Examples:
+        >>> async with AsyncTron() as tron:
+        >>>     block = await tron.trx.get_current_block()
+
+    """
+
+    HTTPProvider = AsyncHttpProvider
+
+    manager_class = AsyncTronManager
+    transaction_builder_class = None
+
+    def __init__(self, **kwargs):
+        if kwargs.get('block_store') is not None:
+            raise TronError('AsyncTron does not support block_store, '
+                            'the store is only used by the synchronous Tron')
+
+        kwargs.setdefault('modules', ASYNC_DEFAULT_MODULES)
+        super().__init__(**kwargs)
+
+    @property
+    def ref_block_cache(self):
+        raise TronError('AsyncTron has no ref_block_cache, '
+                        'use the one of a synchronous Tron')
+
+    async def close(self):
+        """Close the sessions of all providers"""
+        await self.manager.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
@@ -14,10 +14,24 @@
     :copyright: © 2019 by the iEXBase.
     :license: MIT License
 """
-from trx_utils import is_string
+import asyncio
+import json
+import logging
+import time
+from urllib.parse import urlparse
+
+from trx_utils import is_integer, is_string, is_list_like
 
 from tronapi import HttpProvider
+from tronapi.common import fastjson
+from tronapi.common.cache import ByteLRUCache, TTLCache
 from tronapi.constants import DEFAULT_NODES
+from tronapi.providers.async_http import AsyncHttpProvider
+from tronapi.providers.async_pool import AsyncProviderPool
+from tronapi.providers.http import create_session
+from tronapi.providers.pool import ProviderPool
+
+log = logging.getLogger(__name__)
 
 # In this variable, you can specify the base paths
 # to test the connection with the nodes.
@@ -28,6 +42,111 @@ STATUS_PAGE = {
     'event_server': '/healthcheck'
 }
 
+# Requests to these paths only read the state of the chain,
+# so they can safely be repeated on another node.
+READ_ONLY_PREFIXES = (
+    '/walletsolidity/',
+    '/walletextension/',
+    '/wallet/get',
+    '/wallet/list',
+    '/event/',
+    '/healthcheck',
+)
+
+READ_ONLY_PATHS = (
+    '/wallet/totaltransaction',
+    '/wallet/validateaddress',
+    '/wallet/triggerconstantcontract',
+)
+
+
+# Reads which may be duplicated to a second node to cut tail latency
+HEDGEABLE_PREFIXES = (
+    '/walletsolidity/',
+    '/wallet/get',
+)
+
+
+# Confirmed data which never changes once the solidity node returns it.
+# Range queries are left out, they may cover heights that are not solid yet.
+IMMUTABLE_PATHS = (
+    '/walletsolidity/getblockbynum',
+    '/walletsolidity/getblockbyid',
+    '/walletsolidity/gettransactionbyid',
+    '/walletsolidity/gettransactioninfobyid',
+    '/walletsolidity/gettransactioninfobyblocknum',
+)
+
+
+def is_immutable(url) -> bool:
+    """Check whether a successful response of the path never changes
+
+    Args:
+        url (str): Path to send
+
+    """
+    return url.split('?', 1)[0] in IMMUTABLE_PATHS
+
+
+# Marks metadata which only changes at the next maintenance period,
+# when votes are counted and approved proposals take effect (every 6 hours)
+MAINTENANCE = 'maintenance'
+
+MAINTENANCE_PATH = '/wallet/getnextmaintenancetime'
+
+# Slow-changing chain metadata, with the number of seconds it is cached for
+METADATA_TTLS = {
+    MAINTENANCE_PATH: MAINTENANCE,
+    '/wallet/getchainparameters': MAINTENANCE,
+    '/wallet/listwitnesses': MAINTENANCE,
+    '/wallet/listproposals': 60,
+    '/wallet/getproposalbyid': 60,
+    '/wallet/getassetissuelist': 300,
+    '/wallet/getpaginatedassetissuelist': 300,
+    '/wallet/getassetissuebyid': 3600,
+    '/wallet/getassetissuebyname': 3600,
+    '/wallet/getassetissuelistbyname': 3600,
+    '/wallet/getcontract': 3600,
+}
+
+
+def is_metadata(url) -> bool:
+    """Check whether the path returns slow-changing metadata, see ``METADATA_TTLS``
+
+    Args:
+        url (str): Path to send
+
+    """
+    return url.split('?', 1)[0] in METADATA_TTLS
+
+
+def is_cacheable_response(response) -> bool:
+    """Whether a response holds data, rather than "not found" or an error"""
+    if isinstance(response, dict):
+        return bool(response) and 'Error' not in response
+    return isinstance(response, list) and bool(response)
+
+
+def is_hedgeable(url) -> bool:
+    """Check whether a request to the path may be sent to two nodes at once
+
+    Args:
+        url (str): Path to send
+
+    """
+    return url.split('?', 1)[0].startswith(HEDGEABLE_PREFIXES)
+
+
+def is_read_only(url) -> bool:
+    """Check whether a request to the path leaves the chain state untouched
+
+    Args:
+        url (str): Path to send
+
+    """
+    path = url.split('?', 1)[0]
+    return path.startswith(READ_ONLY_PREFIXES) or path in READ_ONLY_PATHS
+
 
 class TronManager(object):
     """This class is designed to configure and define nodes
@@ -37,31 +156,90 @@ class TronManager(object):
 
     _providers = None
 
-    def __init__(self, tron, providers):
+    # Provider class used for nodes given as plain URLs
+    provider_class = HttpProvider
+
+    # Pool class grouping several nodes of the same role
+    pool_class = ProviderPool
+
+    def __init__(self, tron, providers, hedge_percentile=None, response_cache=None,
+                 metadata_cache=None):
         """Create new manager tron instance
 
         Args:
             tron: The tron implementation
             providers: List of providers
+            hedge_percentile (float): Enables hedged reads on node pools. A read
+                that takes longer than this percentile of the node's recent latency
+                (e.g. 0.95) is sent to a second node as well.
+            response_cache (Any): Enables caching of confirmed blocks and
+                transactions, see ``IMMUTABLE_PATHS``. Either the cache size
+                in bytes or a :class:`~tronapi.common.cache.ByteLRUCache`.
+            metadata_cache (Any): Enables caching of slow-changing metadata for the
+                durations in ``METADATA_TTLS``. Either True, the maximum number
+                of entries or a :class:`~tronapi.common.cache.TTLCache`.
 
         """
+        if hedge_percentile is not None and not 0 < hedge_percentile < 1:
+            raise ValueError('Invalid hedge_percentile provided, expected a value in (0, 1)')
+
+        if is_integer(response_cache):
+            response_cache = ByteLRUCache(response_cache)
+
+        if metadata_cache is True:
+            metadata_cache = TTLCache()
+        elif metadata_cache is False:
+            metadata_cache = None
+        elif is_integer(metadata_cache):
+            metadata_cache = TTLCache(metadata_cache)
+
         self.tron = tron
         self.providers = providers
-        self.preferred_node = None
+        self.hedge_percentile = hedge_percentile
+        self.response_cache = response_cache
+        self.metadata_cache = metadata_cache
+
+        # Connection pools shared by the nodes created from URLs, per host
+        self._sessions = dict()
 
         for key, value in self.providers.items():
             # This condition checks the nodes,
             # if the link to the node is not specified,
             # we insert the default value to avoid an error.
             if not providers[key]:
-                self.providers[key] = HttpProvider(DEFAULT_NODES[key])
+                self.providers[key] = self.create_provider(DEFAULT_NODES[key])
 
             # If the type of the accepted provider is lower-case,
             # then we transform it to “HttpProvider”,
             if is_string(value):
-                self.providers[key] = HttpProvider(value)
+                self.providers[key] = self.create_provider(value)
+
+            # Several nodes for the same role are grouped in a pool,
+            # which balances the requests between them.
+            if value and is_list_like(value):
+                self.providers[key] = self.pool_class([
+                    self.create_provider(item) if is_string(item) else item
+                    for item in value
+                ])
             self.providers[key].status_page = STATUS_PAGE[key]
 
+    def create_provider(self, node_url):
+        """Create a provider for a node given by URL.
+
+        Nodes on the same host share one connection pool, which is the case
+        for the default configuration where every role points to the same URL.
+
+        Args:
+            node_url (str): Url of the node
+
+        """
+        uri = urlparse(node_url)
+        host = (uri.scheme, uri.netloc)
+        if host not in self._sessions:
+            self._sessions[host] = create_session()
+
+        return self.provider_class(node_url, session=self._sessions[host])
+
     @property
     def providers(self):
         """Getting a list of all providers
@@ -103,33 +281,263 @@ class TronManager(object):
             raise ValueError('Event server is not activated.')
         return self.providers.get('event_server')
 
-    def request(self, url, params=None, method=None):
-        """Prepare and route the request object according to the manager's configuration.
+    def select_provider(self, url):
+        """Determine the node responsible for the given path.
 
         Args:
             url (str): Path to send
-            params (dict): Options
-            method (str): Request method
 
         """
-        method = 'post' if method is None else method
-
         # In this variable, we divide the resulting reference
         # into 2 parts to determine the type of node
         split = url[1:].split('/', 2)
 
         if split[0] in ('walletsolidity', 'walletextension',):
-            return self.solidity_node.request(url, json=params, method=method)
+            return self.solidity_node
         elif split[0] in ('wallet',):
-            return self.full_node.request(url, json=params, method=method)
+            return self.full_node
         elif split[0] in ('event', 'healthcheck',):
-            return self.event_server.request(url, json=params, method=method)
+            return self.event_server
 
         raise ValueError('Could not determine the type of node')
 
+    def request(self, url, params=None, method=None):
+        """Prepare and route the request object according to the manager's configuration.
+
+        Args:
+            url (str): Path to send
+            params (dict): Options
+            method (str): Request method
+
+        """
+        method = 'post' if method is None else method
+
+        if self.response_cache is not None and is_immutable(url):
+            return self._request_immutable(url, params, method)
+
+        if self.metadata_cache is not None and is_metadata(url):
+            return self._request_metadata(url, params, method)
+
+        return self._send(url, params, method)
+
+    def invalidate(self, url=None):
+        """Drop cached metadata, e.g. after changing it with a transaction
+
+        Args:
+            url (str): Path whose responses are dropped, all of them when omitted
+
+        """
+        if self.metadata_cache is None:
+            return
+
+        if url is None:
+            self.metadata_cache.invalidate()
+        else:
+            self.metadata_cache.invalidate(lambda key: key[0] == url)
+
+    @staticmethod
+    def cache_key(url, params, method):
+        """Key of a request in the response cache"""
+        return '{0} {1} {2}'.format(
+            method.lower(), url, json.dumps(params, sort_keys=True, separators=(',', ':'))
+        )
+
+    @staticmethod
+    def _cache_get(cache, key):
+        """Cached response stored under the key, or None"""
+        cached = cache.get(key)
+        return fastjson.loads(cached) if cached is not None else None
+
+    def _request_immutable(self, url, params, method):
+        key = self.cache_key(url, params, method)
+        cached = self._cache_get(self.response_cache, key)
+        if cached is not None:
+            return cached
+
+        response = self._send(url, params, method)
+        self._store_immutable(key, response)
+        return response
+
+    def _store_immutable(self, key, response):
+        """Cache a confirmed response, unless it is empty or an error"""
+        if is_cacheable_response(response):
+            self.response_cache.set(key, fastjson.dumps(response))
+
+    def _request_metadata(self, url, params, method):
+        key = self._metadata_key(url, params, method)
+        cached = self._cache_get(self.metadata_cache, key)
+        if cached is not None:
+            return cached
+
+        response = self._send(url, params, method)
+        next_maintenance = None
+        if self._expires_at_maintenance(key, response):
+            try:
+                next_maintenance = self.request(MAINTENANCE_PATH).get('num')
+            except Exception as exc:
+                # The response is still returned, only not cached
+                log.warning('Could not look up the next maintenance time: %s', exc)
+
+        self._store_metadata(key, response, next_maintenance)
+        return response
+
+    def _metadata_key(self, url, params, method):
+        """Key of a request in the metadata cache, grouped by path for invalidation"""
+        return url.split('?', 1)[0], self.cache_key(url, params, method)
+
+    @staticmethod
+    def _expires_at_maintenance(key, response) -> bool:
+        """Whether storing the response needs the time of the next maintenance"""
+        return is_cacheable_response(response) and \
+            METADATA_TTLS[key[0]] == MAINTENANCE and key[0] != MAINTENANCE_PATH
+
+    def _store_metadata(self, key, response, next_maintenance=None):
+        """Cache a metadata response until it may have changed"""
+        if not is_cacheable_response(response):
+            return
+
+        url = key[0]
+        ttl = METADATA_TTLS[url]
+
+        if url == MAINTENANCE_PATH:
+            expires_at = response.get('num', 0) / 1000
+        elif ttl == MAINTENANCE:
+            if not next_maintenance or next_maintenance < 0:
+                return
+            expires_at = next_maintenance / 1000
+        else:
+            expires_at = time.time() + ttl
+
+        self.metadata_cache.set(key, fastjson.dumps(response), expires_at)
+
+    def _send(self, url, params, method):
+        """Route the request to its provider"""
+        return self._dispatch(self.select_provider(url), url, params, method)
+
+    def _dispatch(self, provider, url, params, method):
+        """Send the request through the provider, or through the pool with the
+        failover and hedging allowed for the path"""
+        # Pools fail over to another node, but only when repeating
+        # the request can not change the state twice.
+        if isinstance(provider, ProviderPool):
+            if self.hedge_percentile and is_hedgeable(url):
+                return provider.request_hedged(url, json=params, method=method,
+                                               percentile=self.hedge_percentile)
+
+            return provider.request(url, json=params, method=method,
+                                    retry=is_read_only(url))
+
+        return provider.request(url, json=params, method=method)
+
+    def stream(self, url, prefix, params=None, method=None):
+        """Route a request and yield the items of its response as they are parsed.
+
+        Args:
+            url (str): Path to send
+            prefix (str): ijson-style path of the items, e.g. ``'block.item'``
+            params (dict): Options
+            method (str): Request method
+
+        """
+        method = 'post' if method is None else method
+
+        return self.select_provider(url).stream(url, prefix, json=params, method=method)
+
     def is_connected(self):
         """Check connection with providers"""
         is_node = dict()
         for key, value in self.providers.items():
             is_node.update({key: value.is_connected()})
         return is_node
+
+
+class AsyncTronManager(TronManager):
+    """Node manager whose requests are coroutines.
+
+    Nodes given as plain URLs are wrapped in
+    :class:`~tronapi.providers.async_http.AsyncHttpProvider`, and several
+    nodes of the same role in
+    :class:`~tronapi.providers.async_pool.AsyncProviderPool`.
+
+    """
+
+    provider_class = AsyncHttpProvider
+    pool_class = AsyncProviderPool
+
+    def create_provider(self, node_url):
+        """Create a provider for a node given by URL.
+
+        Args:
+            node_url (str): Url of the node
+
+        """
+        return self.provider_class(node_url)
+
+    @property
+    def stream(self):
+        # Asynchronous providers can not stream, hide the inherited method
+        raise AttributeError("'{0}' object has no attribute 'stream'".format(type(self).__name__))
+
+    async def request(self, url, params=None, method=None):
+        """Prepare and route the request object according to the manager's configuration.
+
+        Args:
+            url (str): Path to send
+            params (dict): Options
+            method (str): Request method
+
+        """
+        method = 'post' if method is None else method
+
+        if self.response_cache is not None and is_immutable(url):
+            return await self._request_immutable(url, params, method)
+
+        if self.metadata_cache is not None and is_metadata(url):
+            return await self._request_metadata(url, params, method)
+
+        return await self._send(url, params, method)
+
+    async def _request_immutable(self, url, params, method):
+        key = self.cache_key(url, params, method)
+        cached = self._cache_get(self.response_cache, key)
+        if cached is not None:
+            return cached
+
+        response = await self._send(url, params, method)
+        self._store_immutable(key, response)
+        return response
+
+    async def _request_metadata(self, url, params, method):
+        key = self._metadata_key(url, params, method)
+        cached = self._cache_get(self.metadata_cache, key)
+        if cached is not None:
+            return cached
+
+        response = await self._send(url, params, method)
+        next_maintenance = None
+        if self._expires_at_maintenance(key, response):
+            try:
+                next_maintenance = (await self.request(MAINTENANCE_PATH)).get('num')
+            except Exception as exc:
+                # The response is still returned, only not cached
+                log.warning('Could not look up the next maintenance time: %s', exc)
+
+        self._store_metadata(key, response, next_maintenance)
+        return response
+
+    async def _send(self, url, params, method):
+        """Route the request to its provider"""
+        return await self._dispatch(self.select_provider(url), url, params, method)
+
+    async def is_connected(self):
+        """Check connection with providers"""
+        keys = list(self.providers.keys())
+        results = await asyncio.gather(*[
+            self.providers[key].is_connected() for key in keys
+        ])
+        return dict(zip(keys, results))
+
+    async def close(self):
+        """Close the sessions of all providers"""
+        for provider in set(self.providers.values()):
+            await provider.close()
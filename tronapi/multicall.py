@@ -0,0 +1,161 @@
+# --------------------------------------------------------------------
+# Copyright (c) iEXBase. All rights reserved.
+# Licensed under the MIT License.
+# See License.txt in the project root for license information.
+# --------------------------------------------------------------------
+
+"""
+    tronapi.multicall
+    =================
+
+    Read many contract functions with one constant call
+    of a deployed Multicall aggregator.
+
+    :copyright: © 2019 by the iEXBase.
+    :license: MIT License
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+
+from eth_abi import decode_abi, encode_abi
+from eth_abi.exceptions import DecodingError
+from trx_utils import is_integer
+
+from tronapi.common.abi import abi_to_signature
+from tronapi.contract import constant_call, revert_reason
+from tronapi.exceptions import ContractLogicError, InvalidTronError
+
+# tryAggregate of the Multicall2 and Multicall3 contracts
+TRY_AGGREGATE = 'tryAggregate(bool,(address,bytes)[])'
+TRY_AGGREGATE_OUTPUT = ['(bool,bytes)[]']
+
+# Calls packed into one request, bounded by the energy a node
+# allows a constant call to use
+MULTICALL_BATCH_SIZE = 200
+
+
+class Multicall(object):
+    """Packs reads of contract functions into calls of an aggregator.
+
+    Functions bound to their arguments (as for
+    :meth:`ContractFunction.call`) are sent ``batch_size`` at a time to
+    the ``tryAggregate`` function of a Multicall2 or Multicall3 contract,
+    which runs them and returns every result at once. A failed call does
+    not fail the others, its :class:`ContractLogicError` takes the place
+    of its result.
+
+    Examples:
+        >>> multicall = Multicall(tron, multicall_address)
+        >>> balances = multicall.call([
+        >>>     token.functions.balanceOf(holder) for holder in holders
+        >>> ])
+
+    """
+
+    def __init__(self, tron, address, batch_size=MULTICALL_BATCH_SIZE, require_success=False):
+        """Create a new helper
+
+        Args:
+            tron (Tron): Tron instance
+            address (str): Address of the aggregator contract
+            batch_size (int): Calls packed into one request
+            require_success (bool): Raise when any call of a batch fails,
+                instead of returning the error in its place
+
+        """
+        if not is_integer(batch_size) or batch_size < 1:
+            raise InvalidTronError('Invalid batch size provided')
+
+        self.tron = tron
+        self.address = address
+        self.batch_size = batch_size
+        self.require_success = require_success
+
+    def call(self, calls, concurrency=1, owner_address=None):
+        """Run contract functions through the aggregator
+
+        Args:
+            calls (list): Contract functions bound to their arguments
+            concurrency (int): number of batches in flight
+            owner_address (str): Caller of the aggregator
+
+        Returns:
+            list: results, decoded as by :meth:`ContractFunction.call`,
+            in the order of the calls
+
+        Raises:
+            ContractLogicError: If the aggregator call fails, or a call
+                fails while ``require_success`` is set
+
+        """
+        if not is_integer(concurrency) or concurrency < 1:
+            raise InvalidTronError('Invalid concurrency provided')
+
+        calls = list(calls)
+        batches = [calls[i:i + self.batch_size] for i in range(0, len(calls), self.batch_size)]
+
+        def call_batch(batch):
+            return self._call_batch(batch, owner_address)
+
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            return [
+                result
+                for results in executor.map(call_batch, batches)
+                for result in results
+            ]
+
+    def encode(self, calls) -> bytes:
+        """Arguments of ``tryAggregate`` running the given calls"""
+        return encode_abi(['bool', '(address,bytes)[]'], [
+            self.require_success,
+            [(_target(function), _call_data(function)) for function in calls]
+        ])
+
+    def _call_batch(self, batch, owner_address):
+        data = constant_call(
+            self.tron,
+            self.address,
+            TRY_AGGREGATE,
+            self.encode(batch),
+            owner_address=owner_address
+        )
+
+        try:
+            results = decode_abi(TRY_AGGREGATE_OUTPUT, data)[0]
+        except DecodingError as e:
+            raise ContractLogicError('Unexpected result of {0}: {1}'.format(TRY_AGGREGATE, e))
+
+        if len(results) != len(batch):
+            raise ContractLogicError('{0} returned {1} results for {2} calls'.format(
+                TRY_AGGREGATE, len(results), len(batch)))
+
+        return [_decode_result(function, success, output)
+                for function, (success, output) in zip(batch, results)]
+
+
+def _target(function):
+    if not function.address:
+        raise TypeError("The contract address is required to call a function.")
+
+    # 20 bytes of the address, without the 41 prefix
+    return '0x' + function.tron.address.to_hex(function.address)[-40:].lower()
+
+
+def _call_data(function):
+    prepared = function.prepared
+    return prepared.selector + prepared.encode_arguments(function.arguments)
+
+
+def _decode_result(function, success, output):
+    if not success:
+        reason = revert_reason(output)
+        return ContractLogicError('Call to {0} failed: {1}'.format(
+            abi_to_signature(function.abi), 'reverted: ' + reason if reason else 'reverted'))
+
+    try:
+        values = function.prepared.decode_output(output)
+    except DecodingError as e:
+        return ContractLogicError('Call to {0} returned invalid data: {1}'.format(
+            abi_to_signature(function.abi), e))
+
+    return values[0] if len(values) == 1 else values
@@ -0,0 +1,151 @@
+# --------------------------------------------------------------------
+# Copyright (c) iEXBase. All rights reserved.
+# Licensed under the MIT License.
+# See License.txt in the project root for license information.
+# --------------------------------------------------------------------
+
+
+"""
+    tronapi.providers.async_http
+    ============================
+
+    Class for configuring asyncio http providers
+
+    :copyright: © 2019 by the iEXBase.
+    :license: MIT License
+"""
+import logging
+from urllib.parse import urlparse
+
+from trx_utils import is_integer
+
+from tronapi.common import fastjson
+from tronapi.providers.base import BaseProvider
+from tronapi.providers.http import HTTP_SCHEMES, HttpResponse
+from tronapi.exceptions import HTTP_EXCEPTIONS, TransportError
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+log = logging.getLogger(__name__)
+
+
+class AsyncHttpProvider(BaseProvider):
+    """A Connection object to make non-blocking HTTP requests to a particular node.
+
+    All network methods are coroutines and must be awaited. The underlying
+    :class:`aiohttp.ClientSession` is created lazily on first use, so the provider
+    may be constructed outside of a running event loop.
+
+    """
+
+    def __init__(self, node_url, request_kwargs=None, session=None, timeout=60):
+        """Initializes a :class:`~tronapi.providers.async_http.AsyncHttpProvider`
+        instance.
+
+         Args:
+            node_url (str):  Url of the node to connect to.
+            request_kwargs (dict): Optional params to send with each request.
+            session (aiohttp.ClientSession): Optional session to share between providers.
+            timeout (float): Seconds to wait for the node before giving up.
+
+        """
+        if aiohttp is None:
+            raise ImportError(
+                'AsyncHttpProvider requires aiohttp. '
+                'Install it with "pip install tronapi[async]"'
+            )
+
+        self.node_url = node_url.rstrip('/')
+        uri = urlparse(node_url)
+        # This condition checks the node that will connect
+        # to work with methods.
+        if uri.scheme not in HTTP_SCHEMES:
+            raise NotImplementedError(
+                'TronAPI does not know how to connect to scheme %r in %r' % (
+                    uri.scheme,
+                    self.node_url,
+                )
+            )
+
+        self._request_kwargs = request_kwargs or {}
+        self._session = session
+        self.timeout = timeout
+
+    @property
+    def session(self):
+        """Get the client session, creating it inside the running loop if needed"""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession()
+        return self._session
+
+    async def request(self, path, json=None, params=None, method=None):
+        """Performs an HTTP request with the given parameters.
+
+           Args:
+               path (str): API endpoint path (e.g.: ``'/transactions'``).
+               json (dict): JSON data to send along with the request.
+               params (dict): Dictionary of URL (query) parameters.
+               method (str): HTTP method (e.g.: ``'GET'``).
+
+        """
+        response = await self._request(
+            method=method or 'post',
+            url=self.node_url + path if path else self.node_url,
+            json=json,
+            params=params,
+            **self.get_request_kwargs(),
+        )
+
+        return response.data
+
+    async def is_connected(self) -> bool:
+        """Connection check
+
+        This method sends a test request to the connected node
+        to determine its health.
+
+        Returns:
+            bool: True if successful,
+            False otherwise.
+        """
+        response = await self.request(path=self.status_page, method='get')
+        if 'blockID' in response or response == 'OK':
+            return True
+
+        return False
+
+    async def close(self):
+        """Close the underlying client session"""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+
+    async def _request(self, **kwargs):
+
+        timeout = kwargs.setdefault('timeout', self.timeout)
+        if is_integer(timeout) or isinstance(timeout, float):
+            kwargs['timeout'] = aiohttp.ClientTimeout(total=timeout)
+        self._encode_body(kwargs)
+
+        async with self.session.request(**kwargs) as response:
+            status_code = response.status
+            headers = response.headers
+            content = await response.read()
+
+        try:
+            json = fastjson.loads(content)
+        except ValueError:
+            json = None
+
+        if not (200 <= status_code < 300):
+            exc_cls = HTTP_EXCEPTIONS.get(status_code, TransportError)
+            raise exc_cls(status_code, content.decode('utf-8', 'replace'), json, kwargs.get('url'))
+
+        data = json if json is not None else content.decode('utf-8', 'replace')
+        log.debug(data)
+
+        self._error_manager(data)
+
+        return HttpResponse(status_code, headers, data)
@@ -0,0 +1,182 @@
+# --------------------------------------------------------------------
+# Copyright (c) iEXBase. All rights reserved.
+# Licensed under the MIT License.
+# See License.txt in the project root for license information.
+# --------------------------------------------------------------------
+
+
+"""
+    tronapi.providers.async_pool
+    ============================
+
+    Group several asyncio providers serving the same node role
+    and balance requests between them.
+
+    :copyright: © 2019 by the iEXBase.
+    :license: MIT License
+"""
+import asyncio
+import logging
+import time
+
+from tronapi.exceptions import NodeUnavailable
+from tronapi.providers.pool import ProviderPool, is_node_failure
+
+log = logging.getLogger(__name__)
+
+
+class AsyncProviderPool(ProviderPool):
+    """A set of interchangeable asyncio providers for one node role.
+
+    Selection, circuit breakers, failover and hedging work as in
+    :class:`~tronapi.providers.pool.ProviderPool`, but every network
+    method is a coroutine and hedged requests run as tasks on the
+    event loop instead of threads.
+
+    Examples:
+        >>> from tronapi import AsyncTron
+        >>> tron = AsyncTron(full_node=[
+        >>>     'http://10.0.0.1:8090',
+        >>>     'http://10.0.0.2:8090'
+        >>> ])
+
+    """
+
+    def __init__(self, providers, **kwargs):
+        super().__init__(providers, **kwargs)
+        # Running half-open probes, referenced until they finish
+        self._probes = set()
+
+    async def request(self, path, json=None, params=None, method=None, retry=False):
+        """Performs an HTTP request on the least loaded provider.
+
+           Args:
+               path (str): API endpoint path (e.g.: ``'/transactions'``).
+               json (dict): JSON data to send along with the request.
+               params (dict): Dictionary of URL (query) parameters.
+               method (str): HTTP method (e.g.: ``'GET'``).
+               retry (bool): Retry on the next healthy provider if the node fails.
+                Only safe for requests that do not change the chain state.
+
+        """
+        tried = []
+        while True:
+            member = self._reserve(exclude=tried)
+            if member is None:
+                raise NodeUnavailable(
+                    'No healthy node left to send {0} to'.format(path)
+                )
+            tried.append(member)
+
+            try:
+                return await self._send(member, path, json=json, params=params, method=method)
+            except Exception as exc:
+                if not retry or not is_node_failure(exc) or len(tried) == len(self.members):
+                    raise
+
+                log.warning('Node %r failed (%s), retrying %s on another node',
+                            member, exc, path)
+
+    async def request_hedged(self, path, json=None, params=None, method=None, percentile=0.95):
+        """Performs a read request, duplicating it to a second provider when slow.
+
+        See :meth:`ProviderPool.request_hedged`. The losing request is cancelled.
+
+        Args:
+            path (str): API endpoint path (e.g.: ``'/transactions'``).
+            json (dict): JSON data to send along with the request.
+            params (dict): Dictionary of URL (query) parameters.
+            method (str): HTTP method (e.g.: ``'GET'``).
+            percentile (float): Latency percentile after which the request is hedged
+
+        """
+        kwargs = dict(json=json, params=params, method=method)
+
+        primary = self._reserve()
+        if primary is None:
+            raise NodeUnavailable('No healthy node left to send {0} to'.format(path))
+
+        with self._lock:
+            delay = primary.latency_percentile(percentile)
+        if len(self.members) < 2:
+            return await self._send(primary, path, **kwargs)
+
+        # Without latency history there is no deadline, but a failed
+        # primary is still retried on the secondary
+        tasks = [asyncio.ensure_future(self._send(primary, path, **kwargs))]
+        try:
+            done, _ = await asyncio.wait(tasks, timeout=delay)
+
+            if done:
+                exc = tasks[0].exception()
+                if exc is None:
+                    return tasks[0].result()
+                if not is_node_failure(exc):
+                    raise exc
+
+            secondary = self._reserve(exclude=[primary])
+            if secondary is not None:
+                tasks.append(asyncio.ensure_future(self._send(secondary, path, **kwargs)))
+
+            error = None
+            for next_done in asyncio.as_completed(tasks):
+                try:
+                    return await next_done
+                except Exception as exc:
+                    error = exc
+
+            raise error
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    @property
+    def stream(self):
+        # Asynchronous providers can not stream, hide the inherited method
+        raise AttributeError("'{0}' object has no attribute 'stream'".format(type(self).__name__))
+
+    async def is_connected(self) -> bool:
+        """Connection check
+
+        Returns:
+            bool: True if at least one provider is healthy,
+            False otherwise.
+        """
+        results = await asyncio.gather(*[
+            self._check(provider) for provider in self.providers
+        ])
+        return any(results)
+
+    async def close(self):
+        """Close the sessions of all providers"""
+        for provider in self.providers:
+            await provider.close()
+
+    @staticmethod
+    async def _check(provider) -> bool:
+        """Connection check of a single provider, an unreachable node is not connected"""
+        try:
+            return await provider.is_connected()
+        except Exception:
+            return False
+
+    def _start_probe(self, member):
+        task = asyncio.ensure_future(self._probe(member))
+        self._probes.add(task)
+        task.add_done_callback(self._probes.discard)
+
+    async def _probe(self, member):
+        """Half-open check: close the breaker if the status page answers"""
+        self._end_probe(member, await self._check(member.provider))
+
+    async def _send(self, member, path, **kwargs):
+        """Send the request through an already reserved member"""
+        started = time.monotonic()
+        try:
+            response = await member.provider.request(path, **kwargs)
+        except (Exception, asyncio.CancelledError) as exc:
+            self._release(member, started, exc)
+            raise
+
+        self._release(member, started)
+        return response
@@ -5,11 +5,16 @@
 # --------------------------------------------------------------------
 import platform
 
+from eth_utils import to_dict
+
 import tronapi
+from tronapi.common import fastjson
+from tronapi.common.encoding import to_text
 
 
 class BaseProvider(object):
     _status_page = None
+    _request_kwargs = None
 
     @property
     def status_page(self):
@@ -20,6 +25,43 @@ class BaseProvider(object):
     def status_page(self, page):
         self._status_page = page
 
+    @to_dict
+    def get_request_kwargs(self):
+        """Header settings"""
+        request_kwargs = self._request_kwargs or {}
+        if 'headers' not in request_kwargs:
+            yield 'headers', self._http_default_headers()
+        for key, value in request_kwargs.items():
+            yield key, value
+
+    @staticmethod
+    def _encode_body(kwargs):
+        """Serialize the ``json`` request argument with the fast JSON backend"""
+        payload = kwargs.pop('json', None)
+        if payload is None:
+            return
+
+        headers = dict(kwargs.get('headers') or {})
+        headers.setdefault('Content-Type', 'application/json')
+        kwargs['headers'] = headers
+        kwargs['data'] = fastjson.dumps(payload)
+
+    @staticmethod
+    def _error_manager(data):
+        """Manager error
+
+        Args:
+            data (any): response data
+
+        """
+        # Additional error interceptor that will occur in case of failed requests
+        if 'Error' in data:
+            raise ValueError(data['Error'])
+
+        # Convert hash errors
+        if 'code' in data and 'message' in data:
+            data['message'] = to_text(hexstr=data['message'])
+
     @staticmethod
     def _http_default_headers():
         """Add default headers"""
@@ -15,35 +15,138 @@
     :license: MIT License
 """
 import logging
+import socket
 from collections import namedtuple
 from urllib.parse import urlparse
 
-from eth_utils import to_dict
 from requests import Session
+from requests.adapters import HTTPAdapter
 from requests.exceptions import (
     ConnectionError as TrxConnectionError
 )
 
-from tronapi.common.encoding import to_text
+from tronapi.common import fastjson
 from tronapi.providers.base import BaseProvider
 from tronapi.exceptions import HTTP_EXCEPTIONS, TransportError
 
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
 HTTP_SCHEMES = {'http', 'https'}
 HttpResponse = namedtuple('HttpResponse', ('status_code', 'headers', 'data'))
 
+# Number of host pools to cache and of connections kept per host
+DEFAULT_POOL_CONNECTIONS = 10
+DEFAULT_POOL_MAXSIZE = 50
+
 log = logging.getLogger(__name__)
 
 
+class TcpOptionsAdapter(HTTPAdapter):
+    """Transport adapter which applies socket options to new connections"""
+
+    def __init__(self, socket_options=None, **kwargs):
+        # Must be set before the parent creates the pool manager
+        self.socket_options = socket_options
+        super().__init__(**kwargs)
+
+    def init_poolmanager(self, *args, **kwargs):
+        if self.socket_options is not None:
+            kwargs['socket_options'] = self.socket_options
+        super().init_poolmanager(*args, **kwargs)
+
+
+def create_session(pool_connections=DEFAULT_POOL_CONNECTIONS,
+                   pool_maxsize=DEFAULT_POOL_MAXSIZE,
+                   keep_alive=True,
+                   tcp_nodelay=True):
+    """Create a session with a tuned connection pool.
+
+    A session can be shared by several providers pointing at the same host,
+    so that they reuse the same pool of connections.
+
+    Args:
+        pool_connections (int): Number of host connection pools to cache.
+        pool_maxsize (int): Maximum number of connections kept open per host.
+        keep_alive (bool): Reuse connections between requests and enable
+            TCP keep-alive probes on them.
+        tcp_nodelay (bool): Disable Nagle's algorithm on the sockets.
+
+    """
+    socket_options = []
+    if tcp_nodelay:
+        socket_options.append((socket.IPPROTO_TCP, socket.TCP_NODELAY, 1))
+    if keep_alive:
+        socket_options.append((socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1))
+
+    adapter = TcpOptionsAdapter(
+        socket_options=socket_options,
+        pool_connections=pool_connections,
+        pool_maxsize=pool_maxsize
+    )
+
+    session = Session()
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+
+    if not keep_alive:
+        session.headers['Connection'] = 'close'
+
+    return session
+
+
+def select_items(data, prefix):
+    """Yield the values of an already parsed document found under an ijson-style prefix
+
+    Args:
+        data (any): Parsed JSON document
+        prefix (str): Dotted path, where ``item`` stands for every element of an array
+
+    """
+    if not prefix:
+        yield data
+        return
+
+    key, _, rest = prefix.partition('.')
+    if key == 'item':
+        if isinstance(data, list):
+            for element in data:
+                yield from select_items(element, rest)
+    elif isinstance(data, dict) and key in data:
+        yield from select_items(data[key], rest)
+
+
+def watch_error(events, errors):
+    """Pass ijson events through, collecting the top-level ``Error`` of the document
+
+    Args:
+        events (iterable): ``(prefix, event, value)`` tuples from ``ijson.parse``
+        errors (list): Receives the error messages
+
+    """
+    for prefix, event, value in events:
+        if prefix == 'Error' and event not in ('start_map', 'start_array', 'map_key'):
+            errors.append(value)
+        yield prefix, event, value
+
+
 class HttpProvider(BaseProvider):
     """A Connection object to make HTTP requests to a particular node."""
 
-    def __init__(self, node_url, request_kwargs=None):
+    def __init__(self, node_url, request_kwargs=None, timeout=60, session=None, **pool_options):
         """Initializes a :class:`~tronapi.providers.http.HttpProvider`
         instance.
 
          Args:
             node_url (str):  Url of the node to connect to.
             request_kwargs (dict): Optional params to send with each request.
+            timeout (float): Seconds to wait for the node before giving up.
+            session (requests.Session): Optional session to share the connection
+                pool with other providers, see :func:`create_session`.
+            **pool_options: Options for a new session when none is given
+                (``pool_connections``, ``pool_maxsize``, ``keep_alive``, ``tcp_nodelay``).
 
         """
 
@@ -60,15 +163,11 @@ class HttpProvider(BaseProvider):
             )
 
         self._request_kwargs = request_kwargs or {}
-        self.session = Session()
+        self.timeout = timeout
 
-    @to_dict
-    def get_request_kwargs(self):
-        """Header settings"""
-        if 'headers' not in self._request_kwargs:
-            yield 'headers', self._http_default_headers()
-        for key, value in self._request_kwargs.items():
-            yield key, value
+        if session is not None and pool_options:
+            raise ValueError('Pool options can not be applied to a shared session')
+        self.session = session or create_session(**pool_options)
 
     def request(self, path, json=None, params=None, method=None):
         """Performs an HTTP request with the given parameters.
@@ -93,6 +192,56 @@ class HttpProvider(BaseProvider):
 
         return response.data
 
+    def stream(self, path, prefix, json=None, params=None, method=None):
+        """Performs an HTTP request and yields items of the response as they arrive.
+
+        With ``ijson`` installed the body is parsed incrementally off the socket,
+        so memory stays proportional to a single item. Without it, the whole body
+        is parsed first and the items are yielded from the result.
+
+           Args:
+               path (str): API endpoint path (e.g.: ``'/transactions'``).
+               prefix (str): ijson-style path of the items, e.g. ``'block.item'``
+                for every element of the ``block`` array.
+               json (dict): JSON data to send along with the request.
+               params (dict): Dictionary of URL (query) parameters.
+               method (str): HTTP method (e.g.: ``'GET'``).
+
+        """
+        kwargs = dict(
+            method=method,
+            url=self.node_url + path if path else self.node_url,
+            json=json,
+            params=params,
+            stream=True,
+            **self.get_request_kwargs()
+        )
+        kwargs.setdefault('timeout', self.timeout)
+        self._encode_body(kwargs)
+
+        response = self.session.request(**kwargs)
+        try:
+            if not (200 <= response.status_code < 300):
+                exc_cls = HTTP_EXCEPTIONS.get(response.status_code, TransportError)
+                raise exc_cls(response.status_code, response.text, None, kwargs.get('url'))
+
+            if ijson is None:
+                data = fastjson.loads(response.content)
+                self._error_manager(data)
+                yield from select_items(data, prefix)
+                return
+
+            response.raw.decode_content = True
+            errors = []
+            events = watch_error(ijson.parse(response.raw, use_float=True), errors)
+            yield from ijson.items(events, prefix)
+
+            # A failed request has no items, its error is only known once parsed
+            if errors:
+                self._error_manager({'Error': errors[0]})
+        finally:
+            response.close()
+
     def is_connected(self) -> bool:
         """Connection check
 
@@ -111,43 +260,28 @@ class HttpProvider(BaseProvider):
 
     def _request(self, **kwargs):
 
-        kwargs.setdefault('timeout', 60)
+        kwargs.setdefault('timeout', self.timeout)
+        self._encode_body(kwargs)
 
         response = self.session.request(**kwargs)
-        text = response.text
+        content = response.content
 
         try:
-            json = response.json()
+            json = fastjson.loads(content)
         except ValueError:
             json = None
 
         if not (200 <= response.status_code < 300):
             exc_cls = HTTP_EXCEPTIONS.get(response.status_code, TransportError)
-            raise exc_cls(response.status_code, text, json, kwargs.get('url'))
+            raise exc_cls(response.status_code, response.text, json, kwargs.get('url'))
 
-        data = json if json is not None else text
+        data = json if json is not None else response.text
         log.debug(data)
 
         # Additional error interceptor that will occur in case of failed requests
         if 'Error' in data:
             raise ValueError(data['Error'])
 
-        self.__error_manager(data)
+        self._error_manager(data)
 
         return HttpResponse(response.status_code, response.headers, data)
-
-    @staticmethod
-    def __error_manager(data):
-        """Manager error
-
-        Args:
-            data (any): response data
-
-        """
-        # Additional error interceptor that will occur in case of failed requests
-        if 'Error' in data:
-            raise ValueError(data['Error'])
-
-        # Convert hash errors
-        if 'code' in data and 'message' in data:
-            data['message'] = to_text(hexstr=data['message'])
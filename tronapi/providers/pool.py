@@ -0,0 +1,464 @@
+# --------------------------------------------------------------------
+# Copyright (c) iEXBase. All rights reserved.
+# Licensed under the MIT License.
+# See License.txt in the project root for license information.
+# --------------------------------------------------------------------
+
+
+"""
+    tronapi.providers.pool
+    ======================
+
+    Group several providers serving the same node role
+    and balance requests between them.
+
+    :copyright: © 2019 by the iEXBase.
+    :license: MIT License
+"""
+import asyncio
+import logging
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed, wait
+
+from requests.exceptions import RequestException
+
+from tronapi.common.threads import spawn
+from tronapi.exceptions import NodeUnavailable, TransportError
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+log = logging.getLogger(__name__)
+
+# Errors raised when a node could not be reached or did not answer in time
+CONNECTION_ERRORS = (RequestException, asyncio.TimeoutError)
+if aiohttp is not None:
+    CONNECTION_ERRORS += (aiohttp.ClientError,)
+
+
+def is_node_failure(exc) -> bool:
+    """Whether an exception means the node itself is unhealthy.
+
+    Connection errors, timeouts and 5xx responses count against the node,
+    errors reported by a healthy node for a bad request do not.
+
+    Args:
+        exc (Exception): Exception raised by a provider
+
+    """
+    if isinstance(exc, CONNECTION_ERRORS):
+        return True
+
+    if isinstance(exc, TransportError):
+        return exc.status_code is None or exc.status_code >= 500
+
+    return False
+
+
+class PoolMember(object):
+    """Book-keeping for a single provider inside a :class:`ProviderPool`.
+
+    Besides the latency statistics, every member carries a circuit breaker:
+    after ``failure_threshold`` consecutive failures the member is opened and
+    receives no traffic until a probe of its status page succeeds, which is
+    attempted at most once every ``reset_timeout`` seconds.
+
+    """
+
+    # Number of recent latency samples kept for percentiles
+    sample_size = 100
+
+    # A failed request counts as this many times the slowest latency of the pool
+    failure_penalty = 4
+
+    def __init__(self, provider, smoothing, failure_threshold, reset_timeout):
+        self.provider = provider
+        self.smoothing = smoothing
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.samples = deque(maxlen=self.sample_size)
+        self.latency = None
+        self.in_flight = 0
+        self.failures = 0
+        self.opened_at = None
+        self.probing = False
+
+    @property
+    def score(self):
+        """Expected cost of sending one more request to this provider.
+
+        The observed latency is weighted by the number of requests already
+        waiting on the node, so a fast but saturated node loses to
+        a slightly slower idle one. Providers without any measurement
+        yet are preferred, so every node gets probed.
+        """
+        latency = self.latency if self.latency is not None else 0.0
+        return (latency + 0.001) * (self.in_flight + 1)
+
+    @property
+    def is_open(self) -> bool:
+        """Whether the circuit breaker currently rejects traffic"""
+        return self.opened_at is not None
+
+    def needs_probe(self, now) -> bool:
+        """Whether an open breaker is due for a half-open probe"""
+        return self.is_open and not self.probing and \
+            now - self.opened_at >= self.reset_timeout
+
+    def latency_percentile(self, percentile, min_samples=10):
+        """Latency below which the given share of recent requests completed
+
+        Args:
+            percentile (float): Share of requests, between 0 and 1
+            min_samples (int): Samples required before an estimate is given
+
+        Returns:
+            float: Seconds, or None if there is not enough data yet
+
+        """
+        if len(self.samples) < min_samples:
+            return None
+
+        ordered = sorted(self.samples)
+        return ordered[int(percentile * (len(ordered) - 1))]
+
+    def observe(self, elapsed):
+        """Fold a new latency sample into the moving average"""
+        self.samples.append(elapsed)
+        if self.latency is None:
+            self.latency = elapsed
+        else:
+            self.latency = self.smoothing * elapsed + (1 - self.smoothing) * self.latency
+
+    def observe_failure(self, elapsed, reference):
+        """Fold a failed request into the moving average as a slow one.
+
+        A node refusing connections fails faster than a healthy node
+        answers, so its real latency would make it the preferred choice.
+        Failures are not kept as samples, they would skew the hedging delay.
+
+        Args:
+            elapsed (float): Seconds until the request failed
+            reference (float): Slowest latency of the pool
+
+        """
+        penalty = max(elapsed, self.failure_penalty * reference)
+        if self.latency is None:
+            self.latency = penalty
+        else:
+            self.latency = self.smoothing * penalty + (1 - self.smoothing) * self.latency
+
+    def record_success(self):
+        self.failures = 0
+        self.opened_at = None
+
+    def record_failure(self):
+        self.failures += 1
+        if self.failures >= self.failure_threshold:
+            self.opened_at = time.monotonic()
+
+    def __repr__(self):
+        return '<PoolMember %s latency=%r in_flight=%d open=%r>' % (
+            getattr(self.provider, 'node_url', self.provider),
+            self.latency,
+            self.in_flight,
+            self.is_open
+        )
+
+
+class ProviderPool(object):
+    """A set of interchangeable providers for one node role.
+
+    Each request is routed to the provider with the lowest expected cost,
+    based on an exponentially weighted moving average (EWMA) of its latency
+    and the number of requests currently in flight on it.
+
+    Providers that keep failing are taken out of rotation by a per-provider
+    circuit breaker, and read-only requests that fail on one node are
+    transparently retried on the next healthy one.
+
+    Latency-critical reads can be hedged: if the chosen node has not
+    answered within a percentile of its recent latency, the same request is
+    sent to a second node and whichever answers first wins.
+
+    The pool exposes the same ``request``/``is_connected`` interface as a
+    single provider, so it can be used wherever an ``HttpProvider`` is expected.
+
+    Examples:
+        >>> from tronapi import Tron
+        >>> tron = Tron(full_node=[
+        >>>     'http://10.0.0.1:8090',
+        >>>     'http://10.0.0.2:8090'
+        >>> ])
+
+    """
+
+    def __init__(self, providers, smoothing=0.3, failure_threshold=3, reset_timeout=30,
+                 hedge_workers=16):
+        """Create a new pool
+
+        Args:
+            providers (list): Providers serving the same node role
+            smoothing (float): Weight of the newest sample in the latency EWMA
+            failure_threshold (int): Consecutive failures before a provider is disabled
+            reset_timeout (float): Seconds before a disabled provider is probed again
+            hedge_workers (int): Threads available to hedged requests
+
+        """
+        if not providers:
+            raise ValueError('At least one provider is required')
+
+        if not 0 < smoothing <= 1:
+            raise ValueError('Invalid smoothing provided, expected a value in (0, 1]')
+
+        if failure_threshold < 1:
+            raise ValueError('Invalid failure threshold provided')
+
+        self.members = [
+            PoolMember(provider, smoothing, failure_threshold, reset_timeout)
+            for provider in providers
+        ]
+        self._lock = threading.Lock()
+        self._status_page = None
+        self._hedge_workers = hedge_workers
+        self._executor = None
+
+    @property
+    def providers(self):
+        """List of the pooled providers"""
+        return [member.provider for member in self.members]
+
+    @property
+    def status_page(self):
+        """Get the page to check the connection"""
+        return self._status_page
+
+    @status_page.setter
+    def status_page(self, page):
+        self._status_page = page
+        for provider in self.providers:
+            provider.status_page = page
+
+    def select(self, exclude=None):
+        """Pick the healthy provider with the lowest expected cost
+
+        Args:
+            exclude (iterable): Members that must not be chosen
+
+        """
+        exclude = exclude or ()
+        candidates = [
+            member for member in self.members
+            if member not in exclude and not member.is_open
+        ]
+        if not candidates:
+            return None
+
+        return min(candidates, key=lambda member: member.score)
+
+    def request(self, path, json=None, params=None, method=None, retry=False):
+        """Performs an HTTP request on the least loaded provider.
+
+           Args:
+               path (str): API endpoint path (e.g.: ``'/transactions'``).
+               json (dict): JSON data to send along with the request.
+               params (dict): Dictionary of URL (query) parameters.
+               method (str): HTTP method (e.g.: ``'GET'``).
+               retry (bool): Retry on the next healthy provider if the node fails.
+                Only safe for requests that do not change the chain state.
+
+        """
+        tried = []
+        while True:
+            member = self._reserve(exclude=tried)
+            if member is None:
+                raise NodeUnavailable(
+                    'No healthy node left to send {0} to'.format(path)
+                )
+            tried.append(member)
+
+            try:
+                return self._send(member, path, json=json, params=params, method=method)
+            except Exception as exc:
+                if not retry or not is_node_failure(exc) or len(tried) == len(self.members):
+                    raise
+
+                log.warning('Node %r failed (%s), retrying %s on another node',
+                            member, exc, path)
+
+    def request_hedged(self, path, json=None, params=None, method=None, percentile=0.95):
+        """Performs a read request, duplicating it to a second provider when slow.
+
+        The request goes to the best provider first. If no answer arrives within
+        the ``percentile`` of that provider's recent latency, or it fails,
+        the request is sent to the next best provider as well and the first
+        successful response is returned.
+
+        Note:
+            A request that is already on the wire can not be aborted, the losing
+            request only has its result discarded. Never hedge requests which
+            change the chain state.
+
+        Args:
+            path (str): API endpoint path (e.g.: ``'/transactions'``).
+            json (dict): JSON data to send along with the request.
+            params (dict): Dictionary of URL (query) parameters.
+            method (str): HTTP method (e.g.: ``'GET'``).
+            percentile (float): Latency percentile after which the request is hedged
+
+        """
+        kwargs = dict(json=json, params=params, method=method)
+
+        primary = self._reserve()
+        if primary is None:
+            raise NodeUnavailable('No healthy node left to send {0} to'.format(path))
+
+        with self._lock:
+            delay = primary.latency_percentile(percentile)
+        if len(self.members) < 2:
+            return self._send(primary, path, **kwargs)
+
+        # Without latency history there is no deadline, but a failed
+        # primary is still retried on the secondary
+        futures = [self.executor.submit(self._send, primary, path, **kwargs)]
+        done, _ = wait(futures, timeout=delay)
+
+        if done:
+            exc = futures[0].exception()
+            if exc is None:
+                return futures[0].result()
+            if not is_node_failure(exc):
+                raise exc
+
+        secondary = self._reserve(exclude=[primary])
+        if secondary is not None:
+            futures.append(self.executor.submit(self._send, secondary, path, **kwargs))
+
+        error = None
+        for future in as_completed(futures):
+            error = future.exception()
+            if error is None:
+                for other in futures:
+                    other.cancel()
+                return future.result()
+
+        raise error
+
+    def stream(self, path, prefix, json=None, params=None, method=None):
+        """Stream the items of a response from the least loaded provider.
+
+        A stream that broke half way can not be resumed transparently,
+        so it is never retried on another node.
+
+        Args:
+            path (str): API endpoint path (e.g.: ``'/transactions'``).
+            prefix (str): ijson-style path of the items to yield
+            json (dict): JSON data to send along with the request.
+            params (dict): Dictionary of URL (query) parameters.
+            method (str): HTTP method (e.g.: ``'GET'``).
+
+        """
+        member = self._reserve()
+        if member is None:
+            raise NodeUnavailable('No healthy node left to send {0} to'.format(path))
+
+        completed = False
+        try:
+            yield from member.provider.stream(path, prefix, json=json,
+                                              params=params, method=method)
+            completed = True
+        except Exception as exc:
+            if is_node_failure(exc):
+                with self._lock:
+                    member.record_failure()
+            raise
+        finally:
+            with self._lock:
+                member.in_flight -= 1
+                if completed:
+                    member.record_success()
+
+    @property
+    def executor(self):
+        """Thread pool used to run hedged requests"""
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self._hedge_workers)
+            return self._executor
+
+    def is_connected(self) -> bool:
+        """Connection check
+
+        Returns:
+            bool: True if at least one provider is healthy,
+            False otherwise.
+        """
+        return any(self._check(provider) for provider in self.providers)
+
+    @staticmethod
+    def _check(provider) -> bool:
+        """Connection check of a single provider, an unreachable node is not connected"""
+        try:
+            return provider.is_connected()
+        except Exception:
+            return False
+
+    def _reserve(self, exclude=None):
+        """Choose a member and count the upcoming request against it"""
+        now = time.monotonic()
+        with self._lock:
+            for member in self.members:
+                if member.needs_probe(now):
+                    member.probing = True
+                    self._start_probe(member)
+
+            member = self.select(exclude=exclude)
+            if member is not None:
+                member.in_flight += 1
+            return member
+
+    def _start_probe(self, member):
+        spawn(self._probe, member)
+
+    def _probe(self, member):
+        """Half-open check: close the breaker if the status page answers"""
+        self._end_probe(member, self._check(member.provider))
+
+    def _end_probe(self, member, healthy):
+        with self._lock:
+            member.probing = False
+            if healthy:
+                member.record_success()
+            else:
+                member.opened_at = time.monotonic()
+
+    def _send(self, member, path, **kwargs):
+        """Send the request through an already reserved member"""
+        started = time.monotonic()
+        try:
+            response = member.provider.request(path, **kwargs)
+        except Exception as exc:
+            self._release(member, started, exc)
+            raise
+
+        self._release(member, started)
+        return response
+
+    def _release(self, member, started, exc=None):
+        """Record the outcome of a request sent through a reserved member"""
+        with self._lock:
+            member.in_flight -= 1
+            if exc is None:
+                member.observe(time.monotonic() - started)
+                member.record_success()
+            elif is_node_failure(exc):
+                elapsed = time.monotonic() - started
+                member.observe_failure(elapsed, max(
+                    (other.latency for other in self.members if other.latency is not None),
+                    default=elapsed
+                ))
+                member.record_failure()
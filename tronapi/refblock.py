@@ -0,0 +1,171 @@
+# --------------------------------------------------------------------
+# Copyright (c) iEXBase. All rights reserved.
+# Licensed under the MIT License.
+# See License.txt in the project root for license information.
+# --------------------------------------------------------------------
+
+"""
+    tronapi.refblock
+    ================
+
+    Keep a recent reference block for building transactions.
+
+    :copyright: © 2019 by the iEXBase.
+    :license: MIT License
+"""
+
+import logging
+import threading
+import time
+
+from tronapi.common.blocks import block_number
+from tronapi.common.threads import TimerClass
+
+log = logging.getLogger(__name__)
+
+
+def ref_block_fields(block):
+    """Reference fields of a transaction referring to the given block
+
+    Args:
+        block (dict): Block as returned by the node
+
+    """
+    return {
+        # Bytes 6 and 7 of the 8 byte big endian height
+        'ref_block_bytes': '{0:04x}'.format(block_number(block) & 0xffff),
+        # Bytes 8 to 15 of the block id
+        'ref_block_hash': block['blockID'][16:32],
+        'timestamp': block['block_header']['raw_data'].get('timestamp', 0)
+    }
+
+
+def expiration_time(timestamp, lifetime, now=None):
+    """Expiration of a transaction created now, in milliseconds
+
+    Args:
+        timestamp (int): Timestamp of the reference block, in milliseconds
+        lifetime (int): Seconds the transaction should stay valid
+        now (int): Current time in milliseconds, read from the clock if omitted
+
+    """
+    if now is None:
+        now = int(time.time() * 1000)
+
+    # A local clock running late must not produce expired transactions
+    return max(now, timestamp) + lifetime * 1000
+
+
+class RefBlockCache(object):
+    """Refreshes the head block in the background.
+
+    Transactions must refer to one of the last 65536 blocks and expire
+    shortly after the head block time. The cache fetches the head block
+    once per ``interval`` on a daemon thread, so any number of builders can
+    read fresh reference fields without looking up the head themselves.
+
+    A failed refresh is logged and the previous block is kept.
+
+    Examples:
+        >>> tron = Tron()
+        >>> cache = tron.ref_block_cache
+        >>> cache.ref_block_bytes, cache.ref_block_hash, cache.expiration
+
+    """
+
+    def __init__(self, tron, interval=30, lifetime=60):
+        """Create a new cache
+
+        Args:
+            tron (Tron): Tron instance
+            interval (float): Seconds between two refreshes
+            lifetime (int): Seconds transactions should stay valid
+
+        """
+        self.tron = tron
+        self.interval = interval
+        self.lifetime = lifetime
+        self._fields = None
+        self._refreshed_at = None
+        self._lock = threading.Lock()
+        self._timer = None
+
+    def start(self):
+        """Fetch the head block and keep refreshing it in the background"""
+        if self._timer is not None:
+            return self
+
+        # The first block is fetched synchronously, so errors are raised
+        self.refresh()
+
+        with self._lock:
+            if self._timer is None:
+                self._timer = TimerClass(self.interval, self._refresh_quietly)
+                self._timer.daemon = True
+                self._timer.start()
+
+        return self
+
+    def stop(self):
+        """Stop the background refresh"""
+        with self._lock:
+            timer, self._timer = self._timer, None
+
+        if timer is not None:
+            timer.stop()
+
+    @property
+    def is_running(self) -> bool:
+        return self._timer is not None
+
+    def refresh(self):
+        """Fetch the current head block now"""
+        fields = ref_block_fields(self.tron.trx.get_current_block())
+        with self._lock:
+            self._fields = fields
+            self._refreshed_at = time.monotonic()
+
+    @property
+    def fields(self):
+        """Reference fields of the cached block, fetched first if needed"""
+        fields = self._fields
+        if fields is None:
+            self.refresh()
+            fields = self._fields
+        return fields
+
+    @property
+    def ref_block_bytes(self):
+        return self.fields['ref_block_bytes']
+
+    @property
+    def ref_block_hash(self):
+        return self.fields['ref_block_hash']
+
+    @property
+    def timestamp(self):
+        """Timestamp of the cached block, in milliseconds"""
+        return self.fields['timestamp']
+
+    @property
+    def expiration(self):
+        """Suggested expiration for a transaction created now, in milliseconds"""
+        return expiration_time(self.timestamp, self.lifetime)
+
+    @property
+    def age(self):
+        """Seconds since the last successful refresh, or None"""
+        if self._refreshed_at is None:
+            return None
+        return time.monotonic() - self._refreshed_at
+
+    def _refresh_quietly(self):
+        age = self.age
+        if age is not None and age < self.interval / 2:
+            # Refreshed moments ago, e.g. by start()
+            return
+
+        try:
+            self.refresh()
+        except Exception as exc:
+            log.warning('Could not refresh the reference block: %s', exc)
@@ -4,6 +4,8 @@
 # See License.txt in the project root for license information.
 # --------------------------------------------------------------------
 
+import hashlib
+import time
 from datetime import datetime
 from typing import (
     Any,
@@ -25,16 +27,36 @@ from tronapi.exceptions import (
     TronError,
     InvalidAddress
 )
+from tronapi.common import protobuf
 from tronapi.common.validation import is_valid_url
+from tronapi.refblock import expiration_time, ref_block_fields
 
 DEFAULT_TIME = datetime.now()
 START_DATE = int(DEFAULT_TIME.timestamp() * 1000)
 
+# Full node endpoints which the offline builder replaces,
+# with the contract each of them creates
+OFFLINE_CONTRACTS = {
+    '/wallet/createtransaction': 'TransferContract',
+    '/wallet/transferasset': 'TransferAssetContract',
+    '/wallet/freezebalance': 'FreezeBalanceContract',
+    '/wallet/unfreezebalance': 'UnfreezeBalanceContract',
+    '/wallet/withdrawbalance': 'WithdrawBalanceContract',
+    '/wallet/createwitness': 'WitnessCreateContract',
+    '/wallet/votewitnessaccount': 'VoteWitnessContract',
+    '/wallet/updateaccount': 'AccountUpdateContract',
+    '/wallet/triggersmartcontract': 'TriggerSmartContract',
+}
+
 
 class TransactionBuilder(object):
     def __init__(self, tron):
         self.tron = tron
 
+    def _create(self, path, data):
+        """Ask the full node to create the unsigned transaction"""
+        return self.tron.manager.request(path, data)
+
     def send_transaction(self, to, amount, account=None):
         """Creates a transaction of transfer.
         If the recipient address does not exist, a corresponding account will be created.
@@ -65,7 +87,7 @@ class TransactionBuilder(object):
         if _to == _from:
             raise TronError('Cannot transfer TRX to the same account')
 
-        response = self.tron.manager.request('/wallet/createtransaction', {
+        response = self._create('/wallet/createtransaction', {
             'to_address': _to,
             'owner_address': _from,
             'amount': self.tron.toSun(amount)
@@ -114,7 +136,7 @@ class TransactionBuilder(object):
         if is_string(token_id) and token_id.upper() == 'TRX':
             return self.send_transaction(_to, amount, _from)
 
-        return self.tron.manager.request('/wallet/transferasset', {
+        return self._create('/wallet/transferasset', {
             'to_address': _to,
             'owner_address': _from,
             'asset_name': _token_id,
@@ -151,7 +173,7 @@ class TransactionBuilder(object):
         if not self.tron.isAddress(account):
             raise InvalidTronError('Invalid address provided')
 
-        response = self.tron.manager.request('/wallet/freezebalance', {
+        response = self._create('/wallet/freezebalance', {
             'owner_address': self.tron.address.to_hex(account),
             'frozen_balance': self.tron.toSun(amount),
             'frozen_duration': int(duration),
@@ -184,7 +206,7 @@ class TransactionBuilder(object):
         if not self.tron.isAddress(account):
             raise InvalidTronError('Invalid address provided')
 
-        response = self.tron.manager.request('/wallet/unfreezebalance', {
+        response = self._create('/wallet/unfreezebalance', {
             'owner_address': self.tron.address.to_hex(account),
             'resource': resource
         })
@@ -221,7 +243,7 @@ class TransactionBuilder(object):
         _to = self.tron.address.to_hex(to)
         _from = self.tron.address.to_hex(buyer)
 
-        return self.tron.manager.request('/wallet/participateassetissue', {
+        return self._create('/wallet/participateassetissue', {
             'to_address': _to,
             'owner_address': _from,
             'asset_name': self.tron.toHex(text=token_id),
@@ -242,7 +264,7 @@ class TransactionBuilder(object):
         if not self.tron.isAddress(address):
             raise InvalidAddress('Invalid address provided')
 
-        return self.tron.manager.request('/wallet/withdrawbalance', {
+        return self._create('/wallet/withdrawbalance', {
             'owner_address': self.tron.address.to_hex(address)
         })
 
@@ -265,7 +287,7 @@ class TransactionBuilder(object):
         if not is_valid_url(url):
             raise TronError('Invalid url provided')
 
-        return self.tron.manager.request('/wallet/createwitness', {
+        return self._create('/wallet/createwitness', {
             'owner_address': self.tron.address.to_hex(address),
             'url': self.tron.toHex(text=url)
         })
@@ -309,7 +331,7 @@ class TransactionBuilder(object):
                 'vote_count': int(vote_count)
             })
 
-        return self.tron.manager.request('/wallet/votewitnessaccount', {
+        return self._create('/wallet/votewitnessaccount', {
             'owner_address': self.tron.address.to_hex(voter_address),
             'votes': _view_vote
         })
@@ -339,7 +361,7 @@ class TransactionBuilder(object):
         if not self.tron.isAddress(issuer_address):
             raise InvalidAddress('Invalid issuerAddress provided')
 
-        return self.tron.manager.request('/wallet/proposalcreate', {
+        return self._create('/wallet/proposalcreate', {
             'owner_address': self.tron.address.to_hex(issuer_address),
             'parameters': parameters
         })
@@ -367,7 +389,7 @@ class TransactionBuilder(object):
         if not is_boolean(has_approval):
             raise TronError('Invalid has_approval provided')
 
-        return self.tron.manager.request('/wallet/proposalapprove', {
+        return self._create('/wallet/proposalapprove', {
             'owner_address': self.tron.address.to_hex(voter_address),
             'proposal_id': int(proposal_id),
             'is_add_approval': bool(has_approval)
@@ -395,7 +417,7 @@ class TransactionBuilder(object):
         if not isinstance(proposal_id, int) or proposal_id < 0:
             raise InvalidTronError('Invalid proposal_id provided')
 
-        return self.tron.manager.request('/wallet/proposaldelete', {
+        return self._create('/wallet/proposaldelete', {
             'owner_address': self.tron.address.to_hex(issuer_address),
             'proposal_id': int(proposal_id)
         })
@@ -424,7 +446,7 @@ class TransactionBuilder(object):
         if not self.tron.isAddress(account):
             raise TronError('Invalid origin address provided')
 
-        response = self.tron.manager.request('/wallet/updateaccount', {
+        response = self._create('/wallet/updateaccount', {
             'account_name': self.tron.toHex(text=account_name),
             'owner_address': self.tron.address.to_hex(account)
         })
@@ -502,8 +524,8 @@ class TransactionBuilder(object):
         transaction = dict(**kwargs)
         transaction.setdefault('owner_address', self.tron.address.to_hex(owner_address))
 
-        return self.tron.manager.request('/wallet/deploycontract',
-                                         transaction)
+        return self._create('/wallet/deploycontract',
+                            transaction)
 
     def trigger_smart_contract(self, **kwargs):
         """Trigger Smart Contract
@@ -594,7 +616,7 @@ class TransactionBuilder(object):
         if token_id:
             data['token_id'] = int(token_id)
 
-        return self.tron.manager.request('/wallet/triggersmartcontract', data)
+        return self._create('/wallet/triggersmartcontract', data)
 
     def create_trx_exchange(self,
                             token_name: str,
@@ -622,7 +644,7 @@ class TransactionBuilder(object):
         if token_balance <= 0 or trx_balance <= 0:
             raise TronError('Invalid amount provided')
 
-        return self.tron.manager.request('/wallet/exchangecreate', {
+        return self._create('/wallet/exchangecreate', {
             'owner_address': self.tron.address.to_hex(account),
             'first_token_id': self.tron.toHex(text=token_name),
             'first_token_balance': token_balance,
@@ -657,7 +679,7 @@ class TransactionBuilder(object):
         if second_token_balance <= 0 or first_token_balance <= 0:
             raise ValueError('Invalid amount provided')
 
-        return self.tron.manager.request('/wallet/exchangecreate', {
+        return self._create('/wallet/exchangecreate', {
             'owner_address': self.tron.address.to_hex(owner_address),
             'first_token_id': self.tron.toHex(text=first_token_name),
             'first_token_balance': first_token_balance,
@@ -692,7 +714,7 @@ class TransactionBuilder(object):
         if token_amount < 1:
             raise ValueError('Invalid token_amount provided')
 
-        return self.tron.manager.request('/wallet/exchangeinject', {
+        return self._create('/wallet/exchangeinject', {
             'owner_address': self.tron.address.to_hex(owner_address),
             'exchange_id': exchange_id,
             'token_id': self.tron.toHex(text=token_name),
@@ -814,7 +836,7 @@ class TransactionBuilder(object):
             'frozen_days': int(frozen_duration)
         }
 
-        response = self.tron.manager.request('/wallet/createassetissue', {
+        response = self._create('/wallet/createassetissue', {
             'owner_address': self.tron.address.to_hex(issuer_address),
             'name': self.tron.toHex(text=kwargs.get('name')),
             'abbr': self.tron.toHex(text=kwargs.get('abbreviation')),
@@ -861,7 +883,7 @@ class TransactionBuilder(object):
         if token_amount < 1:
             raise ValueError('Invalid token_amount provided')
 
-        return self.tron.manager.request('/wallet/exchangewithdraw', {
+        return self._create('/wallet/exchangewithdraw', {
             'owner_address': self.tron.address.to_hex(owner_address),
             'exchange_id': exchange_id,
             'token_id': self.tron.toHex(text=token_name),
@@ -901,7 +923,7 @@ class TransactionBuilder(object):
         if token_amount_expected < 1:
             raise ValueError('Invalid token_amount_expected provided')
 
-        return self.tron.manager.request('/wallet/exchangewithdraw', {
+        return self._create('/wallet/exchangewithdraw', {
             'owner_address': self.tron.address.to_hex(owner_address),
             'exchange_id': exchange_id,
             'token_id': self.tron.toHex(text=token_name),
@@ -937,7 +959,7 @@ class TransactionBuilder(object):
                 user_fee_percentage > 100:
             raise ValueError('Invalid user_fee_percentage provided')
 
-        return self.tron.manager.request('wallet/updatesetting', {
+        return self._create('wallet/updatesetting', {
             'owner_address': self.tron.address.to_hex(owner_address),
             'contract_address': self.tron.address.to_hex(contract_address),
             'consume_user_resource_percent': user_fee_percentage
@@ -971,7 +993,7 @@ class TransactionBuilder(object):
                 origin_energy_limit > 10000000:
             raise ValueError('Invalid originEnergyLimit  provided')
 
-        return self.tron.manager.request('wallet/updateenergylimit', {
+        return self._create('wallet/updateenergylimit', {
             'owner_address': self.tron.address.to_hex(owner_address),
             'contract_address': self.tron.address.to_hex(contract_address),
             'origin_energy_limit': origin_energy_limit
@@ -1038,4 +1060,159 @@ class TransactionBuilder(object):
             else:
                 data['actives'] = actives_permissions
 
-        return self.tron.manager.request('wallet/accountpermissionupdate', data)
+        return self._create('wallet/accountpermissionupdate', data)
+
+
+class OfflineTransactionBuilder(TransactionBuilder):
+    """Builds transactions locally instead of asking the full node.
+
+    The ``raw_data`` is serialized to protobuf in process and the ``txID`` is
+    its sha256, so creating a transaction costs no network round-trip. The
+    only chain data needed is a recent reference block, which is read from
+    the :class:`~tronapi.refblock.RefBlockCache` shared through ``tron``
+    unless a block is pinned with :meth:`set_ref_block`.
+
+    Transfers, token transfers, freezing, voting, account updates and smart
+    contract triggers are built offline, every other method still goes
+    through the node. The results have the same shape as the node answers,
+    so they can be signed and broadcast as usual.
+
+    Note:
+        Transactions are only valid while the reference block is among the
+        last 65536 blocks, and the node rejects identical transactions created
+        within the same millisecond.
+
+    Examples:
+        >>> builder = OfflineTransactionBuilder(tron)
+        >>> for to, amount in payouts:
+        >>>     tx = builder.send_transaction(to, amount)
+        >>>     tron.trx.broadcast(tron.trx.sign(tx))
+
+    """
+
+    def __init__(self, tron, ref_block=None, expiration=60):
+        """Create a new offline builder
+
+        Args:
+            tron (Tron): Tron instance
+            ref_block (dict): Block the transactions refer to, as returned by the node.
+                Defaults to the block kept by ``tron.ref_block_cache``.
+            expiration (int): Seconds the transactions stay valid
+
+        """
+        super().__init__(tron)
+
+        if not is_integer(expiration) or expiration <= 0:
+            raise ValueError('Invalid expiration provided')
+
+        self.expiration = expiration
+        self._ref_block = None
+        if ref_block is not None:
+            self.set_ref_block(ref_block)
+
+    @property
+    def ref_block(self):
+        """Reference fields taken from the reference block"""
+        if self._ref_block is not None:
+            return self._ref_block
+        return self.tron.ref_block_cache.fields
+
+    def set_ref_block(self, block):
+        """Pin the reference block used by the following transactions
+
+        Args:
+            block (dict): Block as returned by the node,
+                or None to use the shared :class:`~tronapi.refblock.RefBlockCache` again
+
+        """
+        self._ref_block = ref_block_fields(block) if block is not None else None
+
+    def build(self, contract_type, value, fee_limit=None, permission_id=None):
+        """Build an unsigned transaction holding a single contract
+
+        Args:
+            contract_type (str): Contract name, e.g. ``'TransferContract'``
+            value (dict): Contract fields, with addresses in hex
+            fee_limit (int): Maximum energy fee in SUN, for smart contracts
+            permission_id (int): Permission used to sign a multi-signature transaction
+
+        Returns:
+            dict: Transaction with ``txID``, ``raw_data`` and ``raw_data_hex``
+
+        """
+        if contract_type not in protobuf.CONTRACT_TYPES:
+            raise InvalidTronError('Unsupported contract type: {0}'.format(contract_type))
+
+        ref_block = self.ref_block
+        now = int(time.time() * 1000)
+
+        contract = {
+            'parameter': {
+                'value': self._normalize(contract_type, value),
+                'type_url': protobuf.TYPE_URL_PREFIX + contract_type
+            },
+            'type': contract_type
+        }
+        if permission_id:
+            contract['Permission_id'] = int(permission_id)
+
+        raw_data = {
+            'contract': [contract],
+            'ref_block_bytes': ref_block['ref_block_bytes'],
+            'ref_block_hash': ref_block['ref_block_hash'],
+            'expiration': expiration_time(ref_block['timestamp'], self.expiration, now),
+            'timestamp': now
+        }
+        if fee_limit:
+            raw_data['fee_limit'] = int(fee_limit)
+
+        raw_bytes = protobuf.encode_raw_data(raw_data)
+
+        return {
+            'visible': False,
+            'txID': hashlib.sha256(raw_bytes).hexdigest(),
+            'raw_data': raw_data,
+            'raw_data_hex': raw_bytes.hex()
+        }
+
+    def _create(self, path, data):
+        contract_type = OFFLINE_CONTRACTS.get(path)
+        if contract_type is None:
+            return super()._create(path, data)
+
+        if contract_type != 'TriggerSmartContract':
+            return self.build(contract_type, data)
+
+        value = dict(data)
+        fee_limit = value.pop('fee_limit', None)
+        selector = self.tron.keccak(text=value.pop('function_selector'))[:4]
+        value['data'] = selector.hex() + value.pop('parameter', '')
+
+        return {
+            'result': {'result': True},
+            'transaction': self.build(contract_type, value, fee_limit=fee_limit)
+        }
+
+    @staticmethod
+    def _normalize(contract_type, value):
+        """Keep the known fields, with bytes as plain lowercase hex like the node"""
+        fields = protobuf.MESSAGES[contract_type]
+        normalized = {}
+        for name, _, kind in fields:
+            if value.get(name) is None:
+                continue
+
+            item = value[name]
+            if kind == 'bytes':
+                item = protobuf.hex_to_bytes(item).hex()
+            elif kind == 'VoteWitnessContract.Vote':
+                item = [
+                    {
+                        'vote_address': protobuf.hex_to_bytes(vote['vote_address']).hex(),
+                        'vote_count': int(vote['vote_count'])
+                    }
+                    for vote in item
+                ]
+            normalized[name] = item
+
+        return normalized
@@ -15,25 +15,56 @@
 """
 
 import math
+import os
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from itertools import islice, repeat
 from typing import Any
 
-from trx_utils import is_integer, is_hex
+from trx_utils import is_integer, is_hex, remove_0x_prefix
 from trx_utils.types import is_object, is_string, is_list
 
+from tronapi.archive import export_blocks
 from tronapi.common.transactions import wait_for_transaction_id
 from tronapi.contract import Contract
-from tronapi.exceptions import InvalidTronError, TronError, TimeExhausted
+from tronapi.exceptions import InvalidTronError, IncompleteBlockRange, TronError, TimeExhausted
 from tronapi.module import Module
-from tronapi.common.blocks import select_method_for_block
+from tronapi.common.blocks import select_method_for_block, block_number
 from tronapi.common.toolz import (
     assoc
 )
 from tronapi.common.account import Account
 
+# Maximum number of blocks a node returns for one range query
+MAX_BLOCK_RANGE = 100
+
+# Transactions signed per task by Trx.sign_many worker processes
+SIGN_CHUNK_SIZE = 500
+
 TRX_MESSAGE_HEADER = '\x19TRON Signed Message:\n'
 ETH_MESSAGE_HEADER = '\x19Ethereum Signed Message:\n'
 
 
+def sign_transaction_id(tx_id, private_key):
+    """Signature of a transaction id, as stored in the transaction"""
+    return Account.sign_hash(tx_id, private_key)['signature'].hex()[2:]
+
+
+def _sign_transaction_ids(private_key, tx_ids):
+    """Worker task of :meth:`Trx.sign_many`"""
+    return [sign_transaction_id(tx_id, private_key) for tx_id in tx_ids]
+
+
+def _attach_signature(transaction, signature):
+    # support multi sign
+    if 'signature' in transaction and is_list(transaction['signature']):
+        if signature not in transaction['signature']:
+            transaction['signature'].append(signature)
+    else:
+        transaction['signature'] = [signature]
+
+
 class Trx(Module):
     default_contract_factory = Contract
 
@@ -69,11 +100,31 @@ class Trx(Module):
             if_number={'url': '/wallet/getblockbynum', 'field': 'num'},
         )
 
+        store = self.tron.block_store
+        if store is not None:
+            if is_integer(block):
+                stored = store.get(block)
+            elif method['field'] == 'value' and is_string(block):
+                stored = store.get_by_id(remove_0x_prefix(block).lower())
+            else:
+                stored = None
+
+            if stored is not None:
+                return stored
+
+        # A block looked up by id may be from a fork that lost, only the
+        # block returned for a solidified height is known to be canonical
+        solid_number = None
+        if store is not None and is_integer(block):
+            solid_number = store.solid_number_for(block)
+
         result = self.tron.manager.request(method['url'], {
             method['field']: block
         })
 
         if result:
+            if solid_number is not None:
+                store.add_confirmed([result], solid_number)
             return result
         raise ValueError("The call to {method['url']} did not return a value.")
 
@@ -528,7 +579,7 @@ class Trx(Module):
         if 'signature' in transaction:
             raise TronError('Transaction is already signed')
 
-        address = self.tron.address.from_private_key(self.tron.private_key).hex.lower()
+        address = self.tron.signing_key.address.hex.lower()
         owner_address = transaction['raw_data']['contract'][0]['parameter']['value']['owner_address']
 
         if address != owner_address:
@@ -563,7 +614,7 @@ class Trx(Module):
 
             message_hash = self.tron.keccak(text=header+transaction)
 
-            signed_message = Account.sign_hash(self.tron.toHex(message_hash), self.tron.private_key)
+            signed_message = Account.sign_hash(self.tron.toHex(message_hash), self.tron.signing_key)
             return signed_message
 
         if not multisig and 'signature' in transaction:
@@ -571,29 +622,80 @@ class Trx(Module):
 
         try:
             if not multisig:
-                address = self.tron.address.from_private_key(self.tron.private_key).hex.lower()
+                address = self.tron.signing_key.address.hex.lower()
                 owner_address = transaction['raw_data']['contract'][0]['parameter']['value']['owner_address']
 
                 if address != owner_address:
                     raise ValueError('Private key does not match address in transaction')
 
             # This option deals with signing of transactions, and writing to the array
-            signed_tx = Account.sign_hash(
-                transaction['txID'], self.tron.private_key
-            )
-            signature = signed_tx['signature'].hex()[2:]
-
-            # support multi sign
-            if 'signature' in transaction and is_list(transaction['signature']):
-                if not transaction['signature'].index(signature):
-                    transaction['signature'].append(signature)
-            else:
-                transaction['signature'] = [signature]
+            signature = sign_transaction_id(transaction['txID'], self.tron.signing_key)
+            _attach_signature(transaction, signature)
 
             return transaction
         except ValueError as err:
             raise InvalidTronError(err)
 
+    def sign_many(self, transactions, workers=None, multisig=False):
+        """Sign a batch of transactions with the default private key
+
+        The owner of every transaction is checked against the key up front,
+        then the signatures are computed in a pool of ``workers`` processes.
+        Small batches are signed in the current process.
+
+        Examples:
+            >>> txs = [builder.send_transaction(to, amount) for to, amount in payouts]
+            >>> for tx in tron.trx.sign_many(txs, workers=8):
+            >>>     tron.trx.broadcast(tx)
+
+        Args:
+            transactions (list): unsigned transactions
+            workers (int): number of processes, defaults to the number of CPUs
+            multisig (bool): multi sign, skips the owner check
+
+        Returns:
+            list: the signed transactions, in the given order
+
+        """
+        transactions = list(transactions)
+        if workers is None:
+            workers = os.cpu_count() or 1
+
+        if not is_integer(workers) or workers < 1:
+            raise InvalidTronError('Invalid workers provided')
+
+        signing_key = self.tron.signing_key
+        if not multisig:
+            address = signing_key.address.hex.lower()
+            for transaction in transactions:
+                if 'signature' in transaction:
+                    raise TronError('Transaction {0} is already signed'.format(transaction['txID']))
+
+                owner_address = transaction['raw_data']['contract'][0]['parameter']['value']['owner_address']
+                if address != owner_address:
+                    raise InvalidTronError(
+                        'Private key does not match address in transaction {0}'.format(transaction['txID'])
+                    )
+
+        # Worker processes receive the raw key
+        private_key = bytes(signing_key)
+        tx_ids = [transaction['txID'] for transaction in transactions]
+        if workers == 1 or len(tx_ids) <= SIGN_CHUNK_SIZE:
+            signatures = _sign_transaction_ids(private_key, tx_ids)
+        else:
+            chunks = [tx_ids[i:i + SIGN_CHUNK_SIZE] for i in range(0, len(tx_ids), SIGN_CHUNK_SIZE)]
+            with ProcessPoolExecutor(max_workers=min(workers, len(chunks))) as executor:
+                signatures = [
+                    signature
+                    for chunk in executor.map(_sign_transaction_ids, repeat(private_key), chunks)
+                    for signature in chunk
+                ]
+
+        for transaction, signature in zip(transactions, signatures):
+            _attach_signature(transaction, signature)
+
+        return transactions
+
     def broadcast(self, signed_transaction):
         """Broadcast the signed transaction
 
@@ -763,13 +865,163 @@ class Trx(Module):
         if not is_integer(end) or end <= start:
             raise InvalidTronError('Invalid end of range provided')
 
+        store = self.tron.block_store
+        if store is not None:
+            stored = store.get_range(start, end + 1)
+            if len(stored) == end + 1 - start:
+                return stored
+            solid_number = store.solid_number_for(end)
+
         response = self.tron.manager.request('/wallet/getblockbylimitnext', {
             'startNum': int(start),
             'endNum': int(end) + 1
         }, 'post')
 
+        if store is not None:
+            store.add_confirmed(response.get('block', []), solid_number)
+
         return response.get('block')
 
+    def iter_block_range(self, start, end):
+        """Iterate over a range of blocks while they are being downloaded
+
+        Unlike :meth:`get_block_range`, blocks are yielded one at a time as
+        soon as they are parsed off the connection (requires ``ijson``),
+        so memory use stays proportional to a single block and processing
+        overlaps with the network transfer.
+
+        Args:
+            start (int): starting block height, including this block
+            end (int): ending block height, excluding that block
+
+        """
+        if not is_integer(start) or start < 0:
+            raise InvalidTronError('Invalid start of range provided')
+
+        if not is_integer(end) or end <= start:
+            raise InvalidTronError('Invalid end of range provided')
+
+        return self.tron.manager.stream('/wallet/getblockbylimitnext', 'block.item', {
+            'startNum': int(start),
+            'endNum': int(end) + 1
+        }, 'post')
+
+    def fetch_blocks(self, start, end, concurrency=4, chunk=MAX_BLOCK_RANGE, retries=3):
+        """Download a large range of blocks with several requests in parallel
+
+        The range is split into chunks of at most ``chunk`` blocks which are
+        fetched concurrently (spread over the node pool when one is configured).
+        A failed or incomplete chunk is retried up to ``retries`` times, then
+        the error is raised (:class:`IncompleteBlockRange` for a short chunk),
+        so the blocks yielded are always contiguous. Blocks are yielded in
+        height order, and only a bounded number of chunks is held in memory.
+
+        Examples:
+            >>> for block in tron.trx.fetch_blocks(1000000, 1100000, concurrency=8):
+            >>>     process(block)
+
+        Args:
+            start (int): starting block height, including this block
+            end (int): ending block height, excluding that block
+            concurrency (int): number of requests in flight
+            chunk (int): blocks per request, nodes return at most 100
+            retries (int): attempts to repeat a failed chunk
+
+        """
+        if not is_integer(start) or start < 0:
+            raise InvalidTronError('Invalid start of range provided')
+
+        if not is_integer(end) or end <= start:
+            raise InvalidTronError('Invalid end of range provided')
+
+        if not is_integer(concurrency) or concurrency < 1:
+            raise InvalidTronError('Invalid concurrency provided')
+
+        if not is_integer(chunk) or not 0 < chunk <= MAX_BLOCK_RANGE:
+            raise InvalidTronError('Invalid chunk size provided, expected 1 to {0}'.format(MAX_BLOCK_RANGE))
+
+        if not is_integer(retries) or retries < 0:
+            raise InvalidTronError('Invalid retries provided')
+
+        return self._fetch_chunks(range(start, end, chunk), end, concurrency, chunk, retries)
+
+    def export_blocks(self, start, end, path, concurrency=4, append=False):
+        """Export the transactions of a range of blocks to a columnar archive
+
+        Each transaction becomes one row of the height, timestamp, txid,
+        contract_type, owner, to and amount columns (requires ``numpy``).
+        The columns are read back as memory-mapped arrays.
+
+        Examples:
+            >>> archive = tron.trx.export_blocks(1000000, 1100000, 'blocks')
+            >>> archive['amount'][archive['height'] > 1050000].sum()
+
+        Args:
+            start (int): starting block height, including this block
+            end (int): ending block height, excluding that block
+            path (str): Archive directory
+            concurrency (int): number of requests in flight
+            append (bool): Continue an existing archive ending at ``start``
+
+        Returns:
+            BlockArchive: the written archive
+
+        """
+        if not is_integer(start) or start < 0:
+            raise InvalidTronError('Invalid start of range provided')
+
+        if not is_integer(end) or end <= start:
+            raise InvalidTronError('Invalid end of range provided')
+
+        return export_blocks(self.tron, start, end, path, concurrency=concurrency, append=append)
+
+    def _fetch_chunks(self, chunk_starts, end, concurrency, chunk, retries):
+        """Generator behind :meth:`fetch_blocks`"""
+
+        def fetch(chunk_start):
+            chunk_end = min(chunk_start + chunk, end)
+            for attempt in range(retries + 1):
+                try:
+                    response = self.tron.manager.request('/wallet/getblockbylimitnext', {
+                        'startNum': chunk_start,
+                        'endNum': chunk_end
+                    })
+                    blocks = sorted(response.get('block', []), key=block_number)
+
+                    # Nodes return short chunks near their head, or while syncing
+                    if [block_number(block) for block in blocks] != list(range(chunk_start, chunk_end)):
+                        raise IncompleteBlockRange('Node returned {0} of the blocks {1} to {2}'.format(
+                            len(blocks), chunk_start, chunk_end - 1))
+
+                    return blocks
+                except Exception:
+                    if attempt == retries:
+                        raise
+                    time.sleep(0.5 * (attempt + 1))
+
+        chunk_starts = iter(chunk_starts)
+        executor = ThreadPoolExecutor(max_workers=concurrency)
+
+        # Keep a few more chunks queued than workers,
+        # so the workers are busy while the caller consumes blocks.
+        pending = deque(
+            executor.submit(fetch, chunk_start)
+            for chunk_start in islice(chunk_starts, concurrency * 2)
+        )
+        try:
+            while pending:
+                blocks = pending.popleft().result()
+
+                chunk_start = next(chunk_starts, None)
+                if chunk_start is not None:
+                    pending.append(executor.submit(fetch, chunk_start))
+
+                yield from blocks
+        finally:
+            for future in pending:
+                future.cancel()
+            executor.shutdown(wait=False)
+
     def get_latest_blocks(self, num=1):
         """Query the latest blocks
 
@@ -862,6 +1114,42 @@ class Trx(Module):
             return contract_factory(address)
         return contract_factory
 
+    def batch_call(self, calls, concurrency=8, return_exceptions=False, **kwargs):
+        """Run the constant calls of many contract functions concurrently
+
+        Requests are spread over the node pool when one is configured.
+
+        Examples:
+            >>> token = tron.trx.contract(address, abi=trc20_abi)
+            >>> balances = tron.trx.batch_call([
+            >>>     token.functions.balanceOf(holder) for holder in holders
+            >>> ], concurrency=16)
+
+        Args:
+            calls (list): Contract functions bound to their arguments
+            concurrency (int): number of requests in flight
+            return_exceptions (bool): Return the exception of a failed call in
+                its place, instead of raising the first one
+            **kwargs: Options of :meth:`ContractFunction.call`
+
+        Returns:
+            list: results, in the order of the calls
+
+        """
+        if not is_integer(concurrency) or concurrency < 1:
+            raise InvalidTronError('Invalid concurrency provided')
+
+        def call(function):
+            try:
+                return function.call(**kwargs)
+            except Exception as exc:
+                if not return_exceptions:
+                    raise
+                return exc
+
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            return list(executor.map(call, calls))
+
     def validate_address(self, address, _is_hex=False):
         """Validate address
 
@@ -1014,3 +1302,273 @@ class Trx(Module):
         return self.tron.manager.request('/wallet/getassetissuebyid', {
             'value': token_id
         })
+
+
+class AsyncTrx(Module):
+    """Coroutine counterpart of :class:`Trx`
+
+    Every method that talks to a node is a coroutine and must be awaited.
+    Signing and message verification are purely local and are shared with :class:`Trx`.
+
+    """
+
+    sign = Trx.sign
+    verify_message = Trx.verify_message
+
+    async def get_current_block(self):
+        """Query the latest block"""
+        return await self.tron.manager.request(url='/wallet/getnowblock')
+
+    async def get_confirmed_current_block(self):
+        """Query the confirmed latest block"""
+        return await self.tron.manager.request('/walletsolidity/getnowblock')
+
+    async def get_block(self, block: Any = None):
+        """Get block details using HashString or blockNumber
+
+        Args:
+            block (Any): ID or height for the block
+
+        """
+
+        # If the block identifier is not specified,
+        # we take the default
+        if block is None:
+            block = self.tron.default_block
+
+        if block == 'latest':
+            return await self.get_current_block()
+        elif block == 'earliest':
+            return await self.get_block(0)
+
+        method = select_method_for_block(
+            block,
+            if_hash={'url': '/wallet/getblockbyid', 'field': 'value'},
+            if_number={'url': '/wallet/getblockbynum', 'field': 'num'},
+        )
+
+        result = await self.tron.manager.request(method['url'], {
+            method['field']: block
+        })
+
+        if result:
+            return result
+        raise ValueError("The call to {0} did not return a value.".format(method['url']))
+
+    async def get_block_range(self, start, end):
+        """Query a range of blocks by block height
+
+        Args:
+            start (int): starting block height, including this block
+            end (int): ending block height, excluding that block
+
+        """
+        if not is_integer(start) or start < 0:
+            raise InvalidTronError('Invalid start of range provided')
+
+        if not is_integer(end) or end <= start:
+            raise InvalidTronError('Invalid end of range provided')
+
+        response = await self.tron.manager.request('/wallet/getblockbylimitnext', {
+            'startNum': int(start),
+            'endNum': int(end) + 1
+        }, 'post')
+
+        return response.get('block')
+
+    async def get_latest_blocks(self, num=1):
+        """Query the latest blocks
+
+        Args:
+            num (int): the number of blocks to query
+
+        """
+        if not is_integer(num) or num <= 0:
+            raise InvalidTronError('Invalid limit provided')
+
+        response = await self.tron.manager.request('/wallet/getblockbylatestnum', {
+            'num': num
+        })
+
+        return response.get('block')
+
+    async def get_transaction(self, transaction_id: str,
+                              is_confirm: bool = False):
+        """Query transaction based on id
+
+        Args:
+            transaction_id (str): transaction id
+            is_confirm (bool):
+        """
+
+        method = 'walletsolidity' if is_confirm else 'wallet'
+        response = await self.tron.manager.request('/{}/gettransactionbyid'.format(method), {
+            'value': transaction_id
+        })
+
+        if 'txID' not in response:
+            raise ValueError('Transaction not found')
+
+        return response
+
+    async def get_transaction_info(self, tx_id):
+        """Query transaction fee based on id
+
+        Args:
+            tx_id (str): Transaction Id
+
+        """
+        return await self.tron.manager.request('/walletsolidity/gettransactioninfobyid', {
+            'value': tx_id
+        })
+
+    async def get_account(self, address=None):
+        """Query information about an account
+
+        Args:
+            address (str): Address
+
+        """
+        address = self._resolve_address(address)
+
+        return await self.tron.manager.request('/walletsolidity/getaccount', {
+            'address': address
+        })
+
+    async def get_account_resource(self, address=None):
+        """Query the resource information of the account
+
+        Args:
+            address (str): Address
+
+        """
+        address = self._resolve_address(address)
+
+        return await self.tron.manager.request('/wallet/getaccountresource', {
+            'address': address
+        })
+
+    async def get_balance(self, address=None, is_float=False):
+        """Getting a balance
+
+        Args:
+            address (str): Address
+            is_float (bool): Convert to float format
+
+        """
+        response = await self.get_account(address)
+        if 'balance' not in response:
+            return 0
+
+        if is_float:
+            return self.tron.fromSun(response['balance'])
+
+        return response['balance']
+
+    async def get_band_width(self, address=None):
+        """Query bandwidth information.
+
+        Args:
+            address (str): address
+
+        """
+        address = self._resolve_address(address)
+
+        response = await self.tron.manager.request('/wallet/getaccountnet', {
+            'address': address
+        })
+
+        free_net_limit = response.get('freeNetLimit', 0)
+        free_net_used = response.get('freeNetUsed', 0)
+        net_limit = response.get('NetLimit', 0)
+        net_used = response.get('NetUsed', 0)
+
+        return (free_net_limit - free_net_used) + (net_limit - net_used)
+
+    async def get_transaction_count(self):
+        """Count all transactions on the network"""
+        response = await self.tron.manager.request('/wallet/totaltransaction')
+        return response.get('num')
+
+    async def broadcast(self, signed_transaction):
+        """Broadcast the signed transaction
+
+        Args:
+            signed_transaction (object): signed transaction contract data
+
+        """
+        if not is_object(signed_transaction):
+            raise InvalidTronError('Invalid transaction provided')
+
+        if 'signature' not in signed_transaction:
+            raise TronError('Transaction is not signed')
+
+        response = await self.tron.manager.request('/wallet/broadcasttransaction',
+                                                   signed_transaction)
+
+        if 'result' in response:
+            response.update({
+                'transaction': signed_transaction
+            })
+        return response
+
+    async def sign_and_broadcast(self, transaction: Any):
+        """Sign and send to the network
+
+        Args:
+            transaction (Any): transaction details
+        """
+        if not is_object(transaction):
+            raise TronError('Invalid transaction provided')
+
+        return await self.broadcast(self.sign(transaction))
+
+    async def get_contract(self, contract_address):
+        """Queries a contract's information from the blockchain.
+
+        Args:
+            contract_address (str): contract address
+
+        """
+        if not self.tron.isAddress(contract_address):
+            raise InvalidTronError('Invalid contract address provided')
+
+        return await self.tron.manager.request('/wallet/getcontract', {
+            'value': self.tron.address.to_hex(contract_address)
+        })
+
+    async def get_token_by_id(self, token_id: str):
+        """Query token by id.
+
+            Args:
+                token_id (str): The id of the token, it's a string
+        """
+        if not is_string(token_id):
+            raise ValueError('Invalid token ID provided')
+
+        return await self.tron.manager.request('/wallet/getassetissuebyid', {
+            'value': token_id
+        })
+
+    async def list_super_representatives(self):
+        """Query the list of Super Representatives"""
+        response = await self.tron.manager.request('/wallet/listwitnesses')
+        return response.get('witnesses')
+
+    async def get_chain_parameters(self):
+        """Getting chain parameters"""
+        return await self.tron.manager.request('/wallet/getchainparameters')
+
+    async def get_node_info(self):
+        """Get info about the node"""
+        return await self.tron.manager.request('/wallet/getnodeinfo')
+
+    def _resolve_address(self, address):
+        """Validate an address, falling back to the default one, and convert it to hex"""
+        if address is None:
+            address = self.tron.default_address.hex
+
+        if not self.tron.isAddress(address):
+            raise InvalidTronError('Invalid address provided')
+
+        return self.tron.address.to_hex(address)